@@ -16,19 +16,29 @@ import sys
 from pathlib import Path
 
 import click
-from tqdm import tqdm
 
-from ohe.core.bus import DataBus
-from ohe.core.config import load_config
-from ohe.ingestion.video_file import VideoFileProvider
-from ohe.logging_.csv_writer import CsvWriter
-from ohe.logging_.export import SessionExporter
-from ohe.logging_.log_worker import LogWorker
-from ohe.logging_.session import SessionLogger
-from ohe.processing.calibration import CalibrationModel
-from ohe.processing.pipeline import ProcessingPipeline
-from ohe.rules.engine import RulesEngine
-from ohe.rules.thresholds import Thresholds
+# Heavy dependencies (OpenCV, NumPy, pydantic, PyYAML, tqdm) are imported
+# inside the commands that need them so ``ohe --help``, ``ohe sessions`` and
+# ``ohe export`` don't pay for the whole processing stack at start-up.
+
+
+# Critical-anomaly messages held between progress refreshes before the rest
+# are counted and summarised instead
+_MAX_PENDING_CRITICAL = 50
+# Number of recent detections averaged for the live stagger postfix
+_ROLLING_WINDOW = 30
+# Frames buffered before rules are evaluated and rows handed to the log
+# worker in one go; aligned with the progress-bar refresh cadence
+_BATCH_FRAMES = 30
+# Decoded frames queued ahead of the pipeline.  Decode buffers are recycled,
+# so the pool also covers the frames outside the queue: one being decoded,
+# one blocked handing over to the queue, and one being processed.
+_PREFETCH_FRAMES = 4
+_PREFETCH_IN_FLIGHT = 3
+# Bus topics and severity used inside the per-frame loop
+_TOPIC_MEASUREMENT = "measurement"
+_TOPIC_ANOMALY = "anomaly"
+_CRITICAL = "CRITICAL"
 
 
 def _setup_logging(level: str) -> None:
@@ -57,6 +67,22 @@ def main() -> None:
 @click.option("--export/--no-export", default=True, show_default=True, help="Auto-export CSV + JSON summary after processing.")
 def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
     """Process a video file: detect wire, compute measurements, log to SQLite + CSV."""
+    import numpy as np
+    from tqdm import tqdm
+
+    from ohe.core.bus import DataBus
+    from ohe.core.config import load_config
+    from ohe.core.models import Measurement
+    from ohe.ingestion.prefetch import PrefetchingProvider
+    from ohe.ingestion.video_file import VideoFileProvider
+    from ohe.logging_.csv_writer import CsvWriter
+    from ohe.logging_.log_worker import LogWorker
+    from ohe.logging_.session import SessionLogger
+    from ohe.processing.calibration import CalibrationModel
+    from ohe.processing.pipeline import ProcessingPipeline
+    from ohe.rules.engine import RulesEngine
+    from ohe.rules.thresholds import Thresholds
+
     _setup_logging(log_level)
 
     cfg = load_config(config_path)
@@ -70,39 +96,109 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
 
     # Session + CSV + background log worker
     session_dir = cfg.session_dir_path()
-    session_logger = SessionLogger(session_dir, source=video)
+    # Headless run: nothing reads the DB until export, so hold the lock throughout
+    session_logger = SessionLogger(session_dir, source=video, exclusive=True)
     info = session_logger.start()
 
     csv_writer: CsvWriter | None = None
     if cfg.logging.csv_enabled:
-        csv_writer = CsvWriter(session_dir, info.session_id, max_rows=cfg.logging.csv_max_rows)
+        csv_writer = CsvWriter(
+            session_dir, info.session_id,
+            max_rows=cfg.logging.csv_max_rows,
+            max_bytes=cfg.logging.csv_max_bytes,
+        )
 
     worker = LogWorker(session_logger, csv_writer, maxsize=1000)
     worker.start()
 
-    # Bus wires warning/critical anomalies to stderr
-    def _on_anomaly(a):
-        if a.severity == "CRITICAL":
-            tqdm.write(f"  [CRITICAL] {a.message}")
+    # Bus wires critical anomalies to stderr.  Messages are buffered and
+    # written alongside the progress-bar refresh so an anomaly burst doesn't
+    # take tqdm's I/O lock once per frame.
+    crit_buf: list[str] = []
+    crit_suppressed = 0
 
-    bus.subscribe("anomaly", _on_anomaly)
+    def _on_anomaly(a):
+        nonlocal crit_suppressed
+        if a.severity == _CRITICAL:
+            if len(crit_buf) < _MAX_PENDING_CRITICAL:
+                crit_buf.append(f"  [CRITICAL] {a.message}")
+            else:
+                crit_suppressed += 1
+
+    def _flush_critical():
+        nonlocal crit_suppressed
+        if crit_suppressed:
+            crit_buf.append(f"  [CRITICAL] ... {crit_suppressed} more suppressed")
+            crit_suppressed = 0
+        if crit_buf:
+            tqdm.write("\n".join(crit_buf))
+            crit_buf.clear()
+
+    bus.subscribe(_TOPIC_ANOMALY, _on_anomaly)
 
     # Determine total frames for progress bar
-    provider = VideoFileProvider(video, frame_skip=frame_skip)
+    # Decode runs ahead on a background thread while the pipeline works
+    provider = PrefetchingProvider(
+        VideoFileProvider(
+            video, frame_skip=frame_skip, buffer_pool=_PREFETCH_FRAMES + _PREFETCH_IN_FLIGHT,
+        ),
+        maxsize=_PREFETCH_FRAMES,
+    )
     provider.open()
     total = provider.frame_count if provider.frame_count > 0 else None
     if max_frames > 0:
         total = min(total or max_frames, max_frames // frame_skip)
 
-    # Running stats
+    # Running stats: O(1) per frame — a fixed ring for the live rolling mean
+    # plus running sum/min/max for the end-of-run summary.
     detected = 0
     anomaly_total = 0
-    stagger_vals: list[float] = []
+    ring = np.zeros(_ROLLING_WINDOW, dtype=np.float64)
+    stagger_sum = 0.0
+    stagger_min = float("inf")
+    stagger_max = float("-inf")
 
     click.echo(f"\nProcessing: {Path(video).name}")
     click.echo(f"Session ID: {info.session_id}")
     click.echo(f"Output dir: {session_dir}\n")
 
+    # Measurements are only published if something besides the log worker
+    # wants them; subscriptions are fixed before the loop starts.
+    publish_measurements = bus.has_subscribers(_TOPIC_MEASUREMENT)
+
+    # Frames are processed one at a time but evaluated, logged and published
+    # in windows of _BATCH_FRAMES to amortise the per-call overhead.
+    window: list[Measurement] = []
+
+    # Bind the hot per-frame callables once; the loop below runs millions of
+    # times on a long survey and each attribute lookup adds up.
+    run_pipeline = pipeline.run
+    evaluate_batch = rules.evaluate_batch
+    push_many = worker.push_many
+    publish = bus.publish
+    window_append = window.append
+
+    def _flush_window() -> int:
+        """Evaluate rules over the buffered window and hand it to the log worker.
+
+        Returns the number of anomalies raised.
+        """
+        if not window:
+            return 0
+        pairs = list(zip(window, evaluate_batch(window)))
+        window.clear()
+        push_many(pairs)
+
+        raised = 0
+        for m, anomalies in pairs:
+            if publish_measurements:
+                publish(_TOPIC_MEASUREMENT, m)
+            if anomalies:
+                for a in anomalies:
+                    publish(_TOPIC_ANOMALY, a)
+                raised += len(anomalies)
+        return raised
+
     frame_count = 0
     try:
         with tqdm(
@@ -111,35 +207,35 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
             dynamic_ncols=True,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         ) as pbar:
+            pbar_update = pbar.update
             for raw in provider.frames():
                 if max_frames > 0 and frame_count >= max_frames:
                     break
 
-                measurement = pipeline.run(raw)
-                anomalies = rules.evaluate(measurement)
-
-                # Async write (non-blocking)
-                worker.push_measurement(measurement, anomalies)
-
-                # Publish for any other subscribers
-                bus.publish("measurement", measurement)
-                for a in anomalies:
-                    bus.publish("anomaly", a)
+                measurement = run_pipeline(raw)
+                window_append(measurement)
 
                 # Stats
-                if measurement.stagger_mm is not None:
+                stagger = measurement.stagger_mm
+                if stagger is not None:
+                    ring[detected % _ROLLING_WINDOW] = stagger
                     detected += 1
-                    stagger_vals.append(measurement.stagger_mm)
-                anomaly_total += len(anomalies)
+                    stagger_sum += stagger
+                    if stagger < stagger_min:
+                        stagger_min = stagger
+                    if stagger > stagger_max:
+                        stagger_max = stagger
 
                 frame_count += 1
-                pbar.update(1)
+                pbar_update(1)
 
-                # Live postfix stats every 30 frames
-                if frame_count % 30 == 0:
+                # Rules + async write (non-blocking) + live postfix per window
+                if frame_count % _BATCH_FRAMES == 0:
+                    anomaly_total += _flush_window()
+                    _flush_critical()
                     avg_stagger = (
-                        sum(stagger_vals[-30:]) / len(stagger_vals[-30:])
-                        if stagger_vals else 0.0
+                        float(ring[:min(detected, _ROLLING_WINDOW)].mean())
+                        if detected else 0.0
                     )
                     det_pct = detected / frame_count * 100
                     pbar.set_postfix({
@@ -154,6 +250,8 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
         logging.exception("Fatal error")
         sys.exit(1)
     finally:
+        anomaly_total += _flush_window()
+        _flush_critical()
         provider.close()
         worker.stop()
         if csv_writer:
@@ -161,8 +259,8 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
         final_info = session_logger.stop()
 
     det_pct = detected / max(frame_count, 1) * 100
-    avg_stagger = sum(stagger_vals) / len(stagger_vals) if stagger_vals else None
-    stagger_range = (min(stagger_vals), max(stagger_vals)) if stagger_vals else (None, None)
+    avg_stagger = stagger_sum / detected if detected else None
+    stagger_range = (stagger_min, stagger_max) if detected else (None, None)
 
     click.echo("\n" + "=" * 60)
     click.echo(f" SESSION COMPLETE")
@@ -180,6 +278,7 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
     # Auto-export
     if export and session_logger.db_path:
         click.echo("\nExporting summary...")
+        from ohe.logging_.export import SessionExporter
         try:
             exp = SessionExporter(session_logger.db_path)
             csv_out, json_out, events_out = exp.export_all()
@@ -201,6 +300,8 @@ def process_cmd(video, config_path, frame_skip, max_frames, log_level, export):
 @click.option("--out-dir", default=None, type=click.Path(), help="Output directory (default: same as DB).")
 def export_cmd(db, out_dir):
     """Export a completed session database to CSV + JSON summary."""
+    from ohe.logging_.export import SessionExporter
+
     out_dir_path = Path(out_dir) if out_dir else Path(db).parent
     out_dir_path.mkdir(parents=True, exist_ok=True)
 
@@ -221,6 +322,10 @@ def export_cmd(db, out_dir):
 @click.option("--limit", default=20, show_default=True, help="Number of sessions to show.")
 def sessions_cmd(config_path, limit):
     """List recent sessions in the session directory."""
+    import sqlite3
+
+    from ohe.core.config import load_config
+
     cfg = load_config(config_path)
     session_dir = cfg.session_dir_path()
 
@@ -232,19 +337,29 @@ def sessions_cmd(config_path, limit):
     click.echo(f"\n{'ID':<30} {'Source':<30} {'Frames':>8} {'Anomalies':>10}")
     click.echo("-" * 82)
 
-    for db in dbs[:limit]:
-        try:
-            import sqlite3
-            conn = sqlite3.connect(str(db))
-            row = conn.execute(
-                "SELECT session_id, source, total_frames, anomaly_count FROM sessions LIMIT 1"
-            ).fetchone()
-            conn.close()
-            if row:
-                src = Path(row[1]).name if row[1] else "?"
-                click.echo(f"  {row[0]:<28} {src:<30} {row[2]:>8} {row[3]:>10}")
-        except Exception:
-            click.echo(f"  {db.stem:<28} [error reading database]")
+    # One in-memory connection; each session DB is ATTACHed in turn rather
+    # than paying a full connect/close per file.
+    conn = sqlite3.connect(":memory:")
+    try:
+        for db in dbs[:limit]:
+            try:
+                conn.execute("ATTACH DATABASE ? AS s", (str(db),))
+            except Exception:
+                click.echo(f"  {db.stem:<28} [error reading database]")
+                continue
+            try:
+                row = conn.execute(
+                    "SELECT session_id, source, total_frames, anomaly_count FROM s.sessions LIMIT 1"
+                ).fetchone()
+                if row:
+                    src = Path(row[1]).name if row[1] else "?"
+                    click.echo(f"  {row[0]:<28} {src:<30} {row[2]:>8} {row[3]:>10}")
+            except Exception:
+                click.echo(f"  {db.stem:<28} [error reading database]")
+            finally:
+                conn.execute("DETACH DATABASE s")
+    finally:
+        conn.close()
 
     click.echo("")
 
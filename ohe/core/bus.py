@@ -12,8 +12,10 @@ Design notes
 * Topics are plain strings e.g. "measurement", "anomaly", "frame".
 * For UI integration (Phase 4) a QueuedSubscriber wraps the queue so the
   worker thread can push data and the Qt main thread can poll via a timer.
-* Thread-safety: subscription registration should happen before threads
-  start; ``publish`` itself is thread-safe for queue-based subscribers.
+* Thread-safety: handler lists are immutable tuples replaced wholesale
+  (copy-on-write) under a lock on subscribe/unsubscribe.  ``publish`` reads
+  the current tuple without locking — CPython dict lookups are atomic, so a
+  publisher sees either the old or the new handler set, never a torn one.
 """
 
 from __future__ import annotations
@@ -21,7 +23,7 @@ from __future__ import annotations
 import logging
 import queue
 import threading
-from collections import defaultdict
+from collections import deque
 from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
@@ -35,33 +37,30 @@ class DataBus:
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._handlers: dict[Topic, list[Handler]] = defaultdict(list)
+        self._handlers: dict[Topic, tuple[Handler, ...]] = {}
 
     def subscribe(self, topic: Topic, handler: Handler) -> None:
         """Register *handler* to be called whenever *topic* is published."""
         with self._lock:
-            self._handlers[topic].append(handler)
+            self._handlers[topic] = self._handlers.get(topic, ()) + (handler,)
         logger.debug("DataBus: subscribed %s to topic '%s'", handler, topic)
 
     def unsubscribe(self, topic: Topic, handler: Handler) -> None:
         """Remove *handler* from *topic*. No-op if not registered."""
         with self._lock:
-            handlers = self._handlers.get(topic, [])
-            try:
-                handlers.remove(handler)
-            except ValueError:
-                pass
+            handlers = self._handlers.get(topic, ())
+            if handler in handlers:
+                i = handlers.index(handler)
+                self._handlers[topic] = handlers[:i] + handlers[i + 1:]
 
     def publish(self, topic: Topic, payload: Any) -> None:
         """Deliver *payload* to all subscribers of *topic*.
 
         Exceptions raised by individual handlers are logged but do not stop
-        delivery to the remaining subscribers.
+        delivery to the remaining subscribers.  No lock is taken and nothing
+        is allocated: the handler tuple is a stable snapshot.
         """
-        with self._lock:
-            handlers = list(self._handlers.get(topic, []))
-
-        for handler in handlers:
+        for handler in self._handlers.get(topic, ()):
             try:
                 handler(payload)
             except Exception:
@@ -69,54 +68,70 @@ class DataBus:
                     "DataBus: handler %s raised an error on topic '%s'", handler, topic
                 )
 
+    def has_subscribers(self, topic: Topic) -> bool:
+        """Return True if at least one handler is registered for *topic*."""
+        return bool(self._handlers.get(topic))
+
     def topics(self) -> list[Topic]:
         """Return the list of topics that have at least one subscriber."""
-        with self._lock:
-            return [t for t, h in self._handlers.items() if h]
+        return [t for t, h in list(self._handlers.items()) if h]
 
 
 class QueuedSubscriber:
-    """Thread-safe bridge: puts published payloads into a queue.Queue.
+    """Thread-safe bridge: buffers published payloads for another thread.
 
     Useful for handing data from a worker thread to the Qt UI thread.
+    Items live in a ``collections.deque`` guarded by one lock, so
+    :meth:`drain` empties the whole buffer in a single locked step instead
+    of one lock round-trip per item.
 
     Example::
 
         qs = QueuedSubscriber()
         bus.subscribe("measurement", qs.put)
         # In Qt timer callback:
-        while not qs.empty():
-            m = qs.get()
+        for m in qs.drain():
             update_chart(m)
     """
 
     def __init__(self, maxsize: int = 0) -> None:
-        self._q: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        self._q: deque[Any] = deque()
+        self._cond = threading.Condition(threading.Lock())
 
     # Allow this object to be passed directly as a handler
     def __call__(self, payload: Any) -> None:
         self.put(payload)
 
     def put(self, payload: Any) -> None:
-        try:
-            self._q.put_nowait(payload)
-        except queue.Full:
-            logger.warning("QueuedSubscriber: queue full, dropping payload %s", type(payload))
+        with self._cond:
+            if self._maxsize > 0 and len(self._q) >= self._maxsize:
+                logger.warning("QueuedSubscriber: queue full, dropping payload %s", type(payload))
+                return
+            self._q.append(payload)
+            self._cond.notify()
+
+    # ``queue.Queue``-compatible alias
+    put_nowait = put
 
     def get(self, block: bool = False) -> Any:
-        return self._q.get(block=block)
+        """Pop the oldest item; raises ``queue.Empty`` if none and not *block*."""
+        with self._cond:
+            if block:
+                while not self._q:
+                    self._cond.wait()
+            if not self._q:
+                raise queue.Empty
+            return self._q.popleft()
 
     def empty(self) -> bool:
-        return self._q.empty()
+        return not self._q
 
     def drain(self) -> list[Any]:
         """Return all currently queued items without blocking."""
-        items: list[Any] = []
-        while not self._q.empty():
-            try:
-                items.append(self._q.get_nowait())
-            except queue.Empty:
-                break
+        with self._cond:
+            items = list(self._q)
+            self._q.clear()
         return items
 
 
@@ -16,10 +16,16 @@ from pathlib import Path
 from typing import Any, Optional
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
 
 from ohe.core.exceptions import ConfigError
 
+try:  # libyaml-backed loader is an order of magnitude faster when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,17 +64,24 @@ _DEFAULT_CONFIG = _BUNDLE_ROOT / "config" / "default.yaml"
 
 # ---------------------------------------------------------------------------
 # Pydantic sub-models
+#
+# These are ``pydantic.dataclasses`` rather than ``BaseModel`` subclasses:
+# validation is identical, but instances are plain dataclasses without the
+# BaseModel metaclass machinery, which keeps CLI start-up and per-instance
+# overhead down.  Validation runs once, in load_config(), via a TypeAdapter.
 # ---------------------------------------------------------------------------
 
-class IngestionConfig(BaseModel):
+@dataclass
+class IngestionConfig:
     target_fps: float = 0
     frame_skip: int = Field(1, ge=1)
 
 
-class ProcessingConfig(BaseModel):
+@dataclass
+class ProcessingConfig:
     roi: Optional[list[int]] = None  # [x, y, w, h]
     clahe_clip_limit: float = 2.0
-    clahe_tile_grid_size: list[int] = [8, 8]
+    clahe_tile_grid_size: list[int] = Field(default_factory=lambda: [8, 8])
     blur_kernel_size: int = Field(5, ge=1)
     canny_threshold1: int = 50
     canny_threshold2: int = 150
@@ -78,6 +91,12 @@ class ProcessingConfig(BaseModel):
     hough_min_line_length: int = 50
     hough_max_line_gap: int = 10
     min_detection_confidence: float = Field(0.5, ge=0.0, le=1.0)
+    # Run undistort → CLAHE → blur on the GPU (CUDA builds of OpenCV only;
+    # falls back to the CPU when no CUDA device is available)
+    use_cuda: bool = False
+    # Same steps via OpenCV's OpenCL T-API (UMat) when CUDA is off or missing;
+    # falls back to the CPU when no OpenCL device is available
+    use_opencl: bool = False
 
     @field_validator("blur_kernel_size")
     @classmethod
@@ -87,45 +106,53 @@ class ProcessingConfig(BaseModel):
         return v
 
 
-class CalibrationConfig(BaseModel):
+@dataclass
+class CalibrationConfig:
     file: str = "config/calibration.json"
     fallback_px_per_mm: float = Field(10.0, gt=0)
 
 
-class StaggerThreshold(BaseModel):
+@dataclass
+class StaggerThreshold:
     warning_mm: float = 150.0
     critical_mm: float = 200.0
 
 
-class DiameterThreshold(BaseModel):
+@dataclass
+class DiameterThreshold:
     min_warning_mm: float = 10.0
     min_critical_mm: float = 8.0
     max_warning_mm: float = 15.0
     max_critical_mm: float = 17.0
 
 
-class RulesConfig(BaseModel):
-    stagger: StaggerThreshold = StaggerThreshold()
-    diameter: DiameterThreshold = DiameterThreshold()
+@dataclass
+class RulesConfig:
+    stagger: StaggerThreshold = Field(default_factory=StaggerThreshold)
+    diameter: DiameterThreshold = Field(default_factory=DiameterThreshold)
 
 
-class LoggingConfig(BaseModel):
+@dataclass
+class LoggingConfig:
     session_dir: str = "data/sessions"
     sqlite_enabled: bool = True
     csv_enabled: bool = True
     csv_max_rows: int = Field(100_000, gt=0)
+    csv_max_bytes: int = Field(256 * 1024 * 1024, gt=0)
     log_level: str = "INFO"
 
 
-class UIConfig(BaseModel):
+@dataclass
+class UIConfig:
     window_width: int = 1440
     window_height: int = 900
     chart_history_frames: int = 500
-    overlay_wire_colour: list[int] = [0, 255, 0]
-    overlay_centre_colour: list[int] = [0, 0, 255]
+    overlay_wire_colour: list[int] = Field(default_factory=lambda: [0, 255, 0])
+    overlay_centre_colour: list[int] = Field(default_factory=lambda: [0, 0, 255])
 
 
-class InputConfig(BaseModel):
+@dataclass
+class InputConfig:
     """Input source configuration."""
     mode: str = "video_file"
     """'video_file' or 'camera'."""
@@ -135,7 +162,8 @@ class InputConfig(BaseModel):
     """Target FPS for camera capture (0 = native camera rate)."""
 
 
-class SpeedConfig(BaseModel):
+@dataclass
+class SpeedConfig:
     """Vehicle speed source configuration."""
     mode: str = "simulated"
     """'simulated' or 'live'."""
@@ -145,7 +173,8 @@ class SpeedConfig(BaseModel):
     """Maximum random jitter per frame (km/h)."""
 
 
-class EventVideoConfig(BaseModel):
+@dataclass
+class EventVideoConfig:
     """Controls event clip generation."""
     enabled: bool = True
     pre_frames: int = Field(90, ge=0)
@@ -158,7 +187,8 @@ class EventVideoConfig(BaseModel):
     """Frame-rate used when encoding event clips."""
 
 
-class GeoConfig(BaseModel):
+@dataclass
+class GeoConfig:
     """Geolocation settings."""
     enabled: bool = True
     mode: str = "simulated"
@@ -171,7 +201,8 @@ class GeoConfig(BaseModel):
     """Starting longitude for simulation."""
 
 
-class VideoDirectoryConfig(BaseModel):
+@dataclass
+class VideoDirectoryConfig:
     """Paths for training video storage and frame extraction."""
     training_videos_dir: str = "data/videos"
     """Directory containing training / reference video files."""
@@ -187,18 +218,19 @@ class VideoDirectoryConfig(BaseModel):
 # Root config model
 # ---------------------------------------------------------------------------
 
-class AppConfig(BaseModel):
-    ingestion: IngestionConfig = IngestionConfig()
-    processing: ProcessingConfig = ProcessingConfig()
-    calibration: CalibrationConfig = CalibrationConfig()
-    rules: RulesConfig = RulesConfig()
-    logging: LoggingConfig = LoggingConfig()
-    ui: UIConfig = UIConfig()
-    input: InputConfig = InputConfig()
-    speed: SpeedConfig = SpeedConfig()
-    event_video: EventVideoConfig = EventVideoConfig()
-    geo: GeoConfig = GeoConfig()
-    video_directory: VideoDirectoryConfig = VideoDirectoryConfig()
+@dataclass
+class AppConfig:
+    ingestion: IngestionConfig = Field(default_factory=IngestionConfig)
+    processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
+    calibration: CalibrationConfig = Field(default_factory=CalibrationConfig)
+    rules: RulesConfig = Field(default_factory=RulesConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    ui: UIConfig = Field(default_factory=UIConfig)
+    input: InputConfig = Field(default_factory=InputConfig)
+    speed: SpeedConfig = Field(default_factory=SpeedConfig)
+    event_video: EventVideoConfig = Field(default_factory=EventVideoConfig)
+    geo: GeoConfig = Field(default_factory=GeoConfig)
+    video_directory: VideoDirectoryConfig = Field(default_factory=VideoDirectoryConfig)
     model_version: str = "classical-v1"
     """Detection algorithm / model version string stored in every anomaly log."""
 
@@ -315,6 +347,23 @@ class AppConfig(BaseModel):
 # Loader
 # ---------------------------------------------------------------------------
 
+_APP_CONFIG_ADAPTER = TypeAdapter(AppConfig)
+
+# Parsed YAML keyed by (resolved path, mtime_ns).  Only the raw dict is cached;
+# every load_config() call still validates into a fresh AppConfig, so callers
+# may mutate their config without affecting later loads.
+_raw_cache: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _read_yaml(config_path: Path) -> dict[str, Any]:
+    key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    raw = _raw_cache.get(key)
+    if raw is None:
+        raw = yaml.load(config_path.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
+        _raw_cache[key] = raw
+    return raw
+
+
 def load_config(path: str | Path | None = None) -> AppConfig:
     """Load and validate AppConfig from a YAML file.
 
@@ -333,12 +382,12 @@ def load_config(path: str | Path | None = None) -> AppConfig:
         raise ConfigError(f"Configuration file not found: {config_path}")
 
     try:
-        raw: dict[str, Any] = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        raw = _read_yaml(config_path)
     except yaml.YAMLError as exc:
         raise ConfigError(f"YAML parse error in {config_path}: {exc}") from exc
 
     try:
-        cfg = AppConfig.model_validate(raw)
+        cfg = _APP_CONFIG_ADAPTER.validate_python(raw)
     except Exception as exc:
         raise ConfigError(f"Invalid configuration values: {exc}") from exc
 
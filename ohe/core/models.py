@@ -4,10 +4,17 @@ core/models.py
 Central data-transfer objects (dataclasses) used throughout the OHE pipeline.
 All fields are intentionally kept plain Python types / numpy arrays for
 easy serialisation and cross-module use without circular imports.
+
+Every class is declared with ``slots=True``: several of these objects are
+created per frame, and slotted instances are smaller and faster to read
+than ``__dict__``-backed ones.  They are not frozen — ``Anomaly`` is enriched
+in place by the UI worker (geo, speed, clip path), and frozen dataclasses
+pay an ``object.__setattr__`` per field at construction time.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import Optional, Tuple
 
@@ -18,7 +25,7 @@ import numpy as np
 # Geolocation
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GeoLocation:
     """Geolocation snapshot attached to a frame or event."""
 
@@ -47,7 +54,7 @@ class GeoLocation:
 # Ingestion layer
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RawFrame:
     """A single frame as delivered by a FrameProvider."""
 
@@ -68,7 +75,7 @@ class RawFrame:
 # Processing layer
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFrame:
     """Frame after pre-processing (ROI crop, colour conversion, enhancement)."""
 
@@ -83,7 +90,7 @@ class ProcessedFrame:
     """Pixel offset of the ROI's top edge in the original frame."""
 
 
-@dataclass
+@dataclass(slots=True)
 class WireCandidate:
     """Output of the wire detector — pixel-space wire geometry."""
 
@@ -114,7 +121,7 @@ class WireCandidate:
 # Measurement layer
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Measurement:
     """Real-world measurement derived from a WireCandidate + calibration."""
 
@@ -130,22 +137,41 @@ class Measurement:
     confidence: float
     """Detector confidence propagated from WireCandidate."""
 
-    # Bounding box in original (full-frame) pixel coordinates
-    wire_bbox: Optional[Tuple[int, int, int, int]] = None   # (x, y, w, h)
+    # Bounding box in original (full-frame) pixel coordinates; -1 = no wire.
+    # Stored as flat scalars so no tuple is allocated per frame.
+    bbox_x: int = -1
+    bbox_y: int = -1
+    bbox_w: int = -1
+    bbox_h: int = -1
 
-    # Wire centre in original frame coordinates
-    wire_centre_px: Optional[Tuple[float, float]] = None    # (cx, cy)
+    # Wire centre in original frame coordinates; NaN = no wire
+    centre_x: float = math.nan
+    centre_y: float = math.nan
 
     def is_valid(self) -> bool:
         """Return True if both stagger and diameter are available."""
         return self.stagger_mm is not None and self.diameter_mm is not None
 
+    @property
+    def wire_bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """``(x, y, w, h)`` in full-frame pixels, or None if no wire was measured."""
+        if self.bbox_x < 0:
+            return None
+        return (self.bbox_x, self.bbox_y, self.bbox_w, self.bbox_h)
+
+    @property
+    def wire_centre_px(self) -> Optional[Tuple[float, float]]:
+        """``(cx, cy)`` in full-frame pixels, or None if no wire was measured."""
+        if math.isnan(self.centre_x):
+            return None
+        return (self.centre_x, self.centre_y)
+
 
 # ---------------------------------------------------------------------------
 # Rules / anomaly layer
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     """A threshold violation produced by the RulesEngine."""
 
@@ -185,7 +211,7 @@ class Anomaly:
 # Session metadata
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Metadata for a single processing session."""
 
@@ -36,12 +36,18 @@ class FrameProvider(ABC):
 
     def frames(self) -> Iterator[RawFrame]:
         """Yield frames until end-of-stream."""
+        # Bound once: this loop runs for every frame of a long video
+        next_frame = self.next_frame
         while True:
-            frame = self.next_frame()
+            frame = next_frame()
             if frame is None:
                 return
             yield frame
 
+    def __iter__(self) -> Iterator[RawFrame]:
+        """``for raw in provider:`` is shorthand for ``provider.frames()``."""
+        return self.frames()
+
     def __enter__(self) -> "FrameProvider":
         self.open()
         return self
@@ -0,0 +1,137 @@
+"""
+ingestion/prefetch.py
+---------------------
+FrameProvider wrapper that decodes ahead on a background thread.
+
+Without prefetching, the processing loop alternates between OpenCV decode
+(C, releases the GIL) and Python pipeline work, so one of them is always
+idle.  :class:`PrefetchingProvider` runs the wrapped provider's
+``next_frame()`` on a daemon thread and hands frames over through a small
+bounded queue, overlapping decode with processing.
+
+Usage::
+
+    provider = PrefetchingProvider(VideoFileProvider(path), maxsize=4)
+    with provider:
+        for raw in provider.frames():
+            ...
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+
+from ohe.core.exceptions import IngestionError
+from ohe.core.models import RawFrame
+from ohe.ingestion.base import FrameProvider
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker placed on the queue by the reader thread
+_EOS = object()
+
+
+class PrefetchingProvider(FrameProvider):
+    """Wraps another :class:`FrameProvider` and reads it on a background thread."""
+
+    def __init__(self, inner: FrameProvider, maxsize: int = 4) -> None:
+        """
+        Args:
+            inner:   Provider to read from. Opened/closed by this wrapper.
+            maxsize: Maximum number of decoded frames held ahead of the consumer.
+        """
+        self._inner = inner
+        self._q: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._exhausted = False
+
+    # ------------------------------------------------------------------
+    # FrameProvider implementation
+    # ------------------------------------------------------------------
+
+    def open(self) -> None:
+        self._inner.open()
+        self._stop.clear()
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._run, name="FramePrefetch", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            # Unblock a reader waiting on a full queue
+            while self._thread.is_alive():
+                self._drain()
+                self._thread.join(timeout=0.05)
+            self._thread = None
+        self._drain()
+        self._inner.close()
+
+    def next_frame(self) -> RawFrame | None:
+        if self._thread is None:
+            raise IngestionError("Provider not opened. Call open() first.")
+        if self._exhausted:
+            return None
+
+        item = self._q.get()
+        if item is _EOS:
+            self._exhausted = True
+            return None
+        if isinstance(item, BaseException):
+            self._exhausted = True
+            raise item
+        return item
+
+    # ------------------------------------------------------------------
+    # Reader thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                frame = self._inner.next_frame()
+                if frame is None:
+                    break
+                if not self._put(frame):
+                    return
+        except Exception as exc:
+            logger.debug("PrefetchingProvider: reader raised %r", exc)
+            self._put(exc)
+            return
+        self._put(_EOS)
+
+    def _put(self, item: object) -> bool:
+        """Block until *item* is queued; returns False if asked to stop first."""
+        while not self._stop.is_set():
+            try:
+                self._q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                return
+
+    # ------------------------------------------------------------------
+    # Metadata (forwarded to the wrapped provider)
+    # ------------------------------------------------------------------
+
+    @property
+    def fps(self) -> float:
+        return self._inner.fps
+
+    @property
+    def frame_count(self) -> int:
+        return self._inner.frame_count
+
+    @property
+    def source_id(self) -> str:
+        return self._inner.source_id
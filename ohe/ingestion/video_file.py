@@ -7,6 +7,7 @@ Uses OpenCV VideoCapture. Supports:
 * Frame skipping (``frame_skip``)
 * Target FPS sub-sampling (``target_fps``)
 * Optional start/end frame window
+* Optional decode into a small ring of recycled image buffers (``buffer_pool``)
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ import time
 from pathlib import Path
 
 import cv2
+import numpy as np
 
 from ohe.core.exceptions import EndOfStreamError, IngestionError
 from ohe.core.models import RawFrame
@@ -23,6 +25,34 @@ from ohe.ingestion.base import FrameProvider
 
 logger = logging.getLogger(__name__)
 
+# Start offsets below this are reached by grab()-ing forward from frame 0.
+# CAP_PROP_POS_FRAMES on H.264/H.265 seeks to the previous keyframe and
+# decodes forward anyway, so for short jumps plain grabs are cheaper and
+# frame-accurate.
+_GRAB_SEEK_LIMIT = 240
+
+
+def _open_capture(path: str) -> cv2.VideoCapture:
+    """Open *path* with FFmpeg, asking for hardware decode where available.
+
+    FFmpeg picks whichever accelerator the platform offers (VAAPI, NVDEC,
+    VideoToolbox, D3D11, …) and silently decodes on the CPU when there is
+    none.  Older OpenCV builds without the params overload, or a backend
+    that refuses the file, fall back to the default constructor.
+    """
+    accel = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+    if accel is not None:
+        try:
+            cap = cv2.VideoCapture(
+                path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_HW_ACCELERATION, accel]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except (TypeError, cv2.error) as exc:
+            logger.debug("Hardware-accelerated open failed for %s: %s", path, exc)
+    return cv2.VideoCapture(path)
+
 
 class VideoFileProvider(FrameProvider):
     """Reads frames from a local video file via OpenCV VideoCapture."""
@@ -34,6 +64,8 @@ class VideoFileProvider(FrameProvider):
         target_fps: float = 0.0,
         start_frame: int = 0,
         end_frame: int = -1,
+        buffer_pool: int = 0,
+        native_timestamps: bool = False,
     ) -> None:
         """
         Args:
@@ -43,8 +75,19 @@ class VideoFileProvider(FrameProvider):
                          Useful for real-time simulation. 0 = as fast as possible.
             start_frame: Zero-based index of the first frame to yield.
             end_frame:   Last frame index to yield (-1 = until end of file).
+            buffer_pool: If > 0, decode into a ring of this many preallocated
+                         images instead of a fresh array per frame.  A
+                         yielded ``RawFrame.image`` is then overwritten
+                         ``buffer_pool`` frames later, so consumers must not
+                         hold frames longer than that (size it to cover any
+                         prefetch queue plus the frame being processed).
+            native_timestamps: Query the decoder for each frame's timestamp
+                         (``CAP_PROP_POS_MSEC``) instead of deriving it from
+                         the frame index and FPS.  Only needed for
+                         variable-frame-rate files.
         """
         self._path = Path(path)
+        self._source = str(self._path)
         self._frame_skip = max(1, frame_skip)
         self._target_fps = target_fps
         self._start_frame = start_frame
@@ -54,6 +97,17 @@ class VideoFileProvider(FrameProvider):
         self._frame_id: int = 0
         self._native_fps: float = 0.0
         self._total_frames: int = -1
+        self._native_timestamps = native_timestamps
+        self._ms_per_frame: float = 0.0
+
+        # Rate limiting state persists across next_frame() calls
+        self._frame_interval = 1.0 / target_fps if target_fps > 0 else 0.0
+        self._last_yield_time = 0.0
+
+        # Recycled decode targets; filled lazily from the first reads so
+        # the shape always matches what the decoder produces
+        self._pool: list[np.ndarray | None] = [None] * max(0, buffer_pool)
+        self._pool_idx = 0
 
     # ------------------------------------------------------------------
     # FrameProvider implementation
@@ -63,21 +117,31 @@ class VideoFileProvider(FrameProvider):
         if not self._path.exists():
             raise IngestionError(f"Video file not found: {self._path}")
 
-        self._cap = cv2.VideoCapture(str(self._path))
+        self._cap = _open_capture(self._source)
         if not self._cap.isOpened():
             raise IngestionError(f"OpenCV could not open video: {self._path}")
 
         self._native_fps = self._cap.get(cv2.CAP_PROP_FPS) or 25.0
+        self._ms_per_frame = 1000.0 / self._native_fps
         self._total_frames = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
         # Seek to start frame if requested
-        if self._start_frame > 0:
+        self._frame_id = 0
+        if 0 < self._start_frame < _GRAB_SEEK_LIMIT:
+            for _ in range(self._start_frame):
+                if not self._cap.grab():
+                    break
+                self._frame_id += 1
+        elif self._start_frame > 0:
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, self._start_frame)
             self._frame_id = self._start_frame
+        self._last_yield_time = 0.0
 
         logger.info(
-            "Opened video: %s | %.1f fps | %d frames",
+            "Opened video: %s | %.1f fps | %d frames | backend %s (hw accel %s)",
             self._path.name, self._native_fps, self._total_frames,
+            self._cap.getBackendName(),
+            "on" if self._cap.get(cv2.CAP_PROP_HW_ACCELERATION) > 0 else "off",
         )
 
     def close(self) -> None:
@@ -90,9 +154,6 @@ class VideoFileProvider(FrameProvider):
         if self._cap is None:
             raise IngestionError("Provider not opened. Call open() first.")
 
-        _frame_interval = 1.0 / self._target_fps if self._target_fps > 0 else 0.0
-        _last_yield_time: float = 0.0
-
         # Skip frames (read & discard)
         for _ in range(self._frame_skip - 1):
             ret = self._cap.grab()
@@ -101,28 +162,40 @@ class VideoFileProvider(FrameProvider):
             self._frame_id += 1
 
         # Read the actual frame
-        ret, image = self._cap.read()
+        if self._pool:
+            idx = self._pool_idx
+            self._pool_idx = (idx + 1) % len(self._pool)
+            dst = self._pool[idx]
+            ret, image = self._cap.read(dst) if dst is not None else self._cap.read()
+            if ret and image is not None:
+                # OpenCV reallocates if the shape changed; keep whatever it used
+                self._pool[idx] = image
+        else:
+            ret, image = self._cap.read()
         if not ret or image is None:
             return None
 
         if self._end_frame >= 0 and self._frame_id > self._end_frame:
             return None
 
-        timestamp_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+        if self._native_timestamps:
+            timestamp_ms = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+        else:
+            timestamp_ms = self._frame_id * self._ms_per_frame
         frame = RawFrame(
             frame_id=self._frame_id,
             timestamp_ms=timestamp_ms,
             image=image,
-            source=str(self._path),
+            source=self._source,
         )
         self._frame_id += self._frame_skip
 
         # Rate limiting
-        if _frame_interval > 0:
-            elapsed = time.monotonic() - _last_yield_time
-            if elapsed < _frame_interval:
-                time.sleep(_frame_interval - elapsed)
-            _last_yield_time = time.monotonic()
+        if self._frame_interval > 0:
+            elapsed = time.monotonic() - self._last_yield_time
+            if elapsed < self._frame_interval:
+                time.sleep(self._frame_interval - elapsed)
+            self._last_yield_time = time.monotonic()
 
         return frame
 
@@ -140,4 +213,4 @@ class VideoFileProvider(FrameProvider):
 
     @property
     def source_id(self) -> str:
-        return str(self._path)
+        return self._source
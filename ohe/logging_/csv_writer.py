@@ -6,16 +6,26 @@ Rolling CSV writer for per-frame measurements.
 Each row contains: session_id, frame_id, timestamp_ms, stagger_mm,
 diameter_mm, confidence, anomaly_types (semicolon-separated if any).
 
-Rolls over to a new file when ``max_rows`` is reached.
+The schema is fixed and every field is numeric or a known identifier, so
+rows are formatted directly from a template rather than going through
+``csv.writer``'s quoting logic.  Encoded rows accumulate in one reusable
+``bytearray`` and reach the (binary) file in ``_FLUSH_BYTES`` chunks, so
+the per-frame cost is a buffer append, not a ``write()``.
+
+Rolls over to a new file when ``max_rows`` rows or ``max_bytes`` bytes are
+reached, whichever comes first.  The byte budget is what bounds file size
+when rows are wide (long anomaly lists); it is checked only when the
+buffer is written out, i.e. once per ``_FLUSH_BYTES``, so a part may
+overshoot it by at most one chunk.
 """
 
 from __future__ import annotations
 
-import csv
 import logging
+import os
 import time
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional
 
 from ohe.core.models import Anomaly, Measurement
 
@@ -32,18 +42,38 @@ _FIELDNAMES = [
     "anomaly_severities",
 ]
 
+# Encoded bytes held in memory before being written to the file in one go
+_FLUSH_BYTES = 64 * 1024
+# Same terminator csv.writer's default dialect uses
+_LINE_END = "\r\n"
+_HEADER = (",".join(_FIELDNAMES) + _LINE_END).encode("ascii")
+# Default size budget per file part
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# One measurement row after the session_id column; columns follow _FIELDNAMES
+_ROW_FMT_TAIL = ",%d,%.3f,%s,%s,%.4f,%s,%s" + _LINE_END
+
 
 class CsvWriter:
     """Writes measurements to rolling CSV files."""
 
-    def __init__(self, session_dir: Path, session_id: str, max_rows: int = 100_000) -> None:
+    def __init__(
+        self,
+        session_dir: Path,
+        session_id: str,
+        max_rows: int = 100_000,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+    ) -> None:
         self._session_dir = session_dir
         self._session_id = session_id
-        self._max_rows = max_rows
+        # session_id is constant for the writer, so bake it into the row template
+        self._row_fmt = session_id.replace("%", "%%") + _ROW_FMT_TAIL
+        self._max_rows = max(1, max_rows)
+        self._max_bytes = max(1, max_bytes)
         self._row_count = 0
+        self._bytes_written = 0
         self._file_index = 0
-        self._file: Optional[object] = None
-        self._writer: Optional[csv.DictWriter] = None
+        self._file: Optional[BinaryIO] = None
+        self._buf = bytearray()
         self._open_new_file()
 
     # ------------------------------------------------------------------
@@ -52,48 +82,99 @@ class CsvWriter:
 
     def write(self, m: Measurement, anomalies: list[Anomaly] | None = None) -> None:
         """Append one measurement row to the current CSV file."""
-        if self._writer is None:
+        if self._file is None:
+            return
+        self._append_rows([self._format_row(m, anomalies)])
+
+    def write_many(self, items: Iterable[tuple[Measurement, list[Anomaly]]]) -> None:
+        """Append one row per ``(Measurement, [Anomaly])`` pair.
+
+        Rows are formatted in one pass and added to the buffer together,
+        so a batch from the log worker costs one buffer/rollover check per
+        file part instead of one per row.
+        """
+        if self._file is None:
             return
-        anomalies = anomalies or []
-        row = {
-            "session_id": self._session_id,
-            "frame_id": m.frame_id,
-            "timestamp_ms": f"{m.timestamp_ms:.3f}",
-            "stagger_mm": f"{m.stagger_mm:.4f}" if m.stagger_mm is not None else "",
-            "diameter_mm": f"{m.diameter_mm:.4f}" if m.diameter_mm is not None else "",
-            "confidence": f"{m.confidence:.4f}",
-            "anomaly_types": ";".join(a.anomaly_type for a in anomalies),
-            "anomaly_severities": ";".join(a.severity for a in anomalies),
-        }
-        self._writer.writerow(row)
-        self._row_count += 1
-
-        if self._row_count >= self._max_rows:
-            self.close()
-            self._file_index += 1
-            self._row_count = 0
-            self._open_new_file()
+        fmt = self._format_row
+        self._append_rows([fmt(m, anomalies) for m, anomalies in items])
 
     def flush(self) -> None:
+        """Write any buffered rows and flush the file to the OS (page cache only)."""
+        self._flush_buffer()
         if self._file:
-            self._file.flush()  # type: ignore[attr-defined]
+            self._file.flush()
+
+    def durable_flush(self) -> None:
+        """Like :meth:`flush`, then ``fsync`` so the rows survive a power loss.
+
+        Much slower than :meth:`flush`; meant for checkpoints (the log
+        worker calls it every few seconds) and for :meth:`close`.
+        """
+        self.flush()
+        if self._file:
+            os.fsync(self._file.fileno())
 
     def close(self) -> None:
         if self._file:
-            self._file.close()  # type: ignore[attr-defined]
+            try:
+                self.durable_flush()
+            except OSError:
+                logger.exception("CSV fsync failed on close (session=%s)", self._session_id)
+            self._file.close()
             self._file = None
-            self._writer = None
             logger.debug("CSV file closed (session=%s, part=%d)", self._session_id, self._file_index)
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _format_row(self, m: Measurement, anomalies: list[Anomaly] | None) -> str:
+        if anomalies:
+            types = ";".join([a.anomaly_type for a in anomalies])
+            severities = ";".join([a.severity for a in anomalies])
+        else:
+            types = severities = ""
+        return self._row_fmt % (
+            m.frame_id,
+            m.timestamp_ms,
+            "" if m.stagger_mm is None else f"{m.stagger_mm:.4f}",
+            "" if m.diameter_mm is None else f"{m.diameter_mm:.4f}",
+            m.confidence,
+            types,
+            severities,
+        )
+
+    def _append_rows(self, rows: list[str]) -> None:
+        """Buffer *rows*, rolling over to a new file part when a budget is hit."""
+        while rows:
+            room = self._max_rows - self._row_count
+            chunk, rows = rows[:room], rows[room:]
+            self._buf += "".join(chunk).encode("utf-8")
+            self._row_count += len(chunk)
+
+            if len(self._buf) >= _FLUSH_BYTES:
+                self._flush_buffer()
+
+            if self._row_count >= self._max_rows or self._bytes_written >= self._max_bytes:
+                self._roll_over()
+
+    def _roll_over(self) -> None:
+        self.close()
+        self._file_index += 1
+        self._row_count = 0
+        self._open_new_file()
+
+    def _flush_buffer(self) -> None:
+        if self._buf and self._file is not None:
+            self._file.write(self._buf)
+            self._bytes_written += len(self._buf)
+        self._buf.clear()
+
     def _open_new_file(self) -> None:
         suffix = f"_part{self._file_index:03d}" if self._file_index > 0 else ""
         filename = f"{self._session_id}{suffix}.csv"
         path = self._session_dir / filename
-        self._file = open(path, "w", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(self._file, fieldnames=_FIELDNAMES)  # type: ignore[arg-type]
-        self._writer.writeheader()
+        self._file = open(path, "wb")
+        self._file.write(_HEADER)
+        self._bytes_written = len(_HEADER)
         logger.info("CSV writer opened: %s", path)
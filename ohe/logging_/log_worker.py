@@ -4,8 +4,17 @@ logging_/log_worker.py
 Background-thread log worker.
 
 Decouples the hot processing pipeline from the (relatively slow) SQLite and
-CSV I/O using a thread-safe queue.  The pipeline simply calls push() and
-returns immediately; the worker thread drains the queue at its own pace.
+CSV I/O.  The pipeline simply calls push() and returns immediately; the
+worker thread drains the buffer at its own pace.
+
+There is exactly one producer (the pipeline thread) and one consumer, so
+the buffer is a bounded ``collections.deque`` with an ``Event`` to wake the
+consumer and no lock at all: ``append``/``extend``/``popleft`` are atomic
+under the GIL, which is all single-producer/single-consumer needs.  That
+is lighter than ``queue.Queue``'s lock + Condition on every item.  The
+consumer pops everything queued and writes it in chunks of ``batch_size``
+via :meth:`SessionLogger.log_batch`, so SQLite pays one commit per chunk
+rather than one per frame.
 
 Usage::
 
@@ -29,9 +38,10 @@ Usage::
 from __future__ import annotations
 
 import logging
-import queue
 import threading
-from typing import Optional
+import time
+from collections import deque
+from typing import Iterable, Optional
 
 from ohe.core.models import Anomaly, Measurement
 from ohe.logging_.csv_writer import CsvWriter
@@ -39,16 +49,21 @@ from ohe.logging_.session import SessionLogger
 
 logger = logging.getLogger(__name__)
 
-# Sentinel to signal the worker to exit
-_STOP = object()
+# Default batching: commit every N frames; when fewer are pending, wait up to
+# this many seconds for more to arrive before writing
+_DEFAULT_BATCH_SIZE = 200
+_DEFAULT_FLUSH_INTERVAL_S = 0.25
+# Seconds between durability checkpoints (SQLite WAL checkpoint + CSV fsync)
+_DEFAULT_CHECKPOINT_INTERVAL_S = 10.0
 
 
 class LogWorker:
     """Thread-safe, non-blocking measurement / anomaly logger.
 
-    The worker owns a ``queue.Queue`` that accepts ``(Measurement, [Anomaly])``
-    tuples.  A daemon background thread consumes items and writes them to
-    both the :class:`SessionLogger` (SQLite) and :class:`CsvWriter`.
+    The worker owns a bounded deque of ``(Measurement, [Anomaly])`` tuples.
+    When it is full the *oldest* entry is discarded and counted.  A daemon
+    background thread consumes items in batches and writes them to both the
+    :class:`SessionLogger` (SQLite) and :class:`CsvWriter`.
     """
 
     def __init__(
@@ -56,10 +71,20 @@ class LogWorker:
         session: SessionLogger,
         csv_writer: Optional[CsvWriter] = None,
         maxsize: int = 500,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL_S,
+        checkpoint_interval: float = _DEFAULT_CHECKPOINT_INTERVAL_S,
     ) -> None:
         self._session = session
         self._csv = csv_writer
-        self._q: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = time.monotonic()
+        self._maxsize = max(1, maxsize)
+        self._q: deque[tuple[Measurement, list[Anomaly]]] = deque(maxlen=self._maxsize)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._dropped = 0
 
@@ -71,20 +96,25 @@ class LogWorker:
         """Start the background writer thread."""
         if self._thread and self._thread.is_alive():
             return
+        self._stopping.clear()
+        self._last_checkpoint = time.monotonic()
         self._thread = threading.Thread(target=self._run, name="LogWorker", daemon=True)
         self._thread.start()
         logger.debug("LogWorker started")
 
     def stop(self, timeout: float = 10.0) -> None:
         """Signal stop and wait for the queue to drain (up to *timeout* seconds)."""
-        try:
-            self._q.put_nowait(_STOP)
-        except queue.Full:
-            logger.warning("LogWorker: queue full on stop — forcing shutdown")
+        self._stopping.set()
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=timeout)
             if self._thread.is_alive():
                 logger.warning("LogWorker: thread did not exit within %.1fs", timeout)
+        if self._csv and not (self._thread and self._thread.is_alive()):
+            try:
+                self._csv.flush()
+            except Exception:
+                logger.exception("LogWorker: CSV flush failed on stop")
         if self._dropped:
             logger.warning("LogWorker: %d item(s) were dropped due to full queue", self._dropped)
 
@@ -95,14 +125,35 @@ class LogWorker:
     def push_measurement(self, m: Measurement, anomalies: list[Anomaly] | None = None) -> None:
         """Enqueue a measurement+anomaly pair for async writing.
 
-        If the queue is full the item is silently dropped (with a counter).
+        If the queue is full the oldest pending item is dropped (with a counter).
         """
-        try:
-            self._q.put_nowait((m, anomalies or []))
-        except queue.Full:
-            self._dropped += 1
-            if self._dropped % 100 == 0:
-                logger.warning("LogWorker: queue full — %d items dropped so far", self._dropped)
+        q = self._q
+        if len(q) == self._maxsize:
+            self._count_dropped(1)
+        q.append((m, anomalies or []))
+        self._wake.set()
+
+    def push_many(self, items: Iterable[tuple[Measurement, list[Anomaly]]]) -> None:
+        """Enqueue a window of ``(Measurement, [Anomaly])`` pairs in one call.
+
+        Overflow drops the oldest pending items, exactly as with
+        :meth:`push_measurement`.
+        """
+        items = list(items)
+        overflow = len(self._q) + len(items) - self._maxsize
+        if overflow > 0:
+            self._count_dropped(overflow)
+        self._q.extend(items)
+        self._wake.set()
+
+    def _count_dropped(self, n: int) -> None:
+        # Only the producer touches the counter.  The consumer may pop between
+        # the length check and the append, so the count can slightly overstate
+        # real drops under contention; it is a diagnostic, not an exact figure.
+        before = self._dropped
+        self._dropped += n
+        if self._dropped // 100 > before // 100:
+            logger.warning("LogWorker: queue full — %d items dropped so far", self._dropped)
 
     # ------------------------------------------------------------------
     # Background thread
@@ -111,49 +162,76 @@ class LogWorker:
     def _run(self) -> None:
         """Main loop for the background writer thread."""
         while True:
-            try:
-                item = self._q.get(timeout=1.0)
-            except queue.Empty:
-                continue
+            self._wake.wait(timeout=1.0)
+            self._wake.clear()
 
-            if item is _STOP:
-                # Drain remaining items before exiting
-                self._drain_remaining()
-                break
+            # Give the producer a moment to fill a batch before committing
+            if not self._stopping.is_set() and 0 < len(self._q) < self._batch_size:
+                self._stopping.wait(self._flush_interval)
 
-            m, anomalies = item
-            self._write(m, anomalies)
-            self._q.task_done()
+            items = self._take_all()
+            if items:
+                self._write_items(items)
+
+            if time.monotonic() - self._last_checkpoint >= self._checkpoint_interval:
+                self._checkpoint()
+
+            if self._stopping.is_set() and not self._q:
+                break
 
         logger.debug("LogWorker thread exiting")
 
-    def _drain_remaining(self) -> None:
-        """Empty the queue after receiving the stop sentinel."""
-        while True:
+    def _take_all(self) -> list[tuple[Measurement, list[Anomaly]]]:
+        """Pop everything queued so far.
+
+        ``popleft`` (rather than copy + ``clear``) so an item the producer
+        appends mid-drain is either taken now or left for the next pass,
+        never lost.
+        """
+        q = self._q
+        popleft = q.popleft
+        items = []
+        append = items.append
+        # Only this thread removes items; appends never shrink the deque, so
+        # popleft() after a truthy check cannot raise.
+        while q:
+            append(popleft())
+        return items
+
+    def _write_items(self, items: list[tuple[Measurement, list[Anomaly]]]) -> None:
+        """Write everything drained in one wake-up to both sinks.
+
+        SQLite gets ``batch_size`` rows per transaction so a backlog doesn't
+        hold the session lock for one huge commit; the CSV writer buffers
+        internally and takes the whole drain in one call.
+        """
+        for i in range(0, len(items), self._batch_size):
+            batch = items[i:i + self._batch_size]
             try:
-                item = self._q.get_nowait()
-                if item is _STOP:
-                    continue
-                m, anomalies = item
-                self._write(m, anomalies)
-                self._q.task_done()
-            except queue.Empty:
-                break
+                self._session.log_batch(batch)
+            except Exception:
+                logger.exception(
+                    "LogWorker: SQLite batch write failed (%d frame(s))", len(batch)
+                )
 
-    def _write(self, m: Measurement, anomalies: list[Anomaly]) -> None:
-        """Write measurement + anomalies to both sinks."""
+        if self._csv:
+            try:
+                self._csv.write_many(items)
+            except Exception:
+                logger.exception("LogWorker: CSV write failed (%d frame(s))", len(items))
+
+    def _checkpoint(self) -> None:
+        """Make everything written so far durable (fsyncs happen only here)."""
+        self._last_checkpoint = time.monotonic()
         try:
-            self._session.log_measurement(m)
-            for a in anomalies:
-                self._session.log_anomaly(a)
+            self._session.checkpoint()
         except Exception:
-            logger.exception("LogWorker: SQLite write failed for frame %d", m.frame_id)
-
+            logger.exception("LogWorker: SQLite checkpoint failed")
         if self._csv:
             try:
-                self._csv.write(m, anomalies)
+                self._csv.durable_flush()
             except Exception:
-                logger.exception("LogWorker: CSV write failed for frame %d", m.frame_id)
+                logger.exception("LogWorker: CSV durable flush failed")
 
     # ------------------------------------------------------------------
     # Stats
@@ -161,7 +239,7 @@ class LogWorker:
 
     @property
     def queue_size(self) -> int:
-        return self._q.qsize()
+        return len(self._q)
 
     @property
     def dropped_count(self) -> int:
@@ -6,29 +6,50 @@ Session lifecycle manager + SQLite writer.
 Creates one SQLite database per session in ``config.logging.session_dir``
 and writes measurements and anomalies as they arrive.
 
+Measurements logged one at a time through :meth:`SessionLogger.log_measurement`
+are buffered and inserted with ``executemany`` inside a single transaction
+every ``_FLUSH_ROWS`` rows or ``_FLUSH_INTERVAL_S`` seconds, and always on
+:meth:`SessionLogger.flush` / :meth:`SessionLogger.stop`.  Anomalies are
+written immediately because callers need the new rowid (clip backfill).
+
 Schema
 ------
 sessions       (session_id, source, started_at_ms, ended_at_ms, total_frames, anomaly_count, notes)
 measurements   (session_id, frame_id, timestamp_ms, stagger_mm, diameter_mm, confidence, wire_bbox)
 anomalies      (session_id, frame_id, timestamp_ms, anomaly_type, value, threshold, severity, message)
 
+Transactions
+------------
+The connection is opened with ``isolation_level=None`` (autocommit), so the
+sqlite3 module never issues implicit BEGINs.  Single statements (session
+row, clip backfill) commit on their own; every multi-row write is wrapped
+in an explicit ``BEGIN`` … ``COMMIT`` by :meth:`SessionLogger._insert_locked`.
+
 Thread safety
 -------------
 All public write methods acquire ``_lock`` before touching the connection.
 This allows the LogWorker background thread and the pipeline thread to both
-call methods on the same SessionLogger without triggering "cannot commit –
-no transaction is active" races.
+call methods on the same SessionLogger without interleaving transactions.
+
+Exclusive mode
+--------------
+``SessionLogger(..., exclusive=True)`` sets ``PRAGMA locking_mode=EXCLUSIVE``
+before WAL is enabled.  SQLite then takes the file lock once and keeps it,
+and keeps the WAL index in heap memory instead of the ``-shm`` file, so no
+transaction pays for lock acquisition.  The price is that no other
+connection can open the database until :meth:`SessionLogger.stop` closes it.
+Use it only where nothing reads the session while it is live.
 """
 
 from __future__ import annotations
 
 import logging
+import secrets
 import sqlite3
 import threading
 import time
-import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from ohe.core.models import Anomaly, Measurement, SessionInfo
 
@@ -76,25 +97,41 @@ CREATE TABLE IF NOT EXISTS anomalies (
     model_version  TEXT,
     FOREIGN KEY (session_id) REFERENCES sessions(session_id)
 );
+
+-- Support the per-frame measurement/anomaly join used by the CSV export
+CREATE INDEX IF NOT EXISTS idx_anom_session_frame ON anomalies(session_id, frame_id);
+CREATE INDEX IF NOT EXISTS idx_meas_session_frame ON measurements(session_id, frame_id);
 """
 
+# Applied once per connection in start().  WAL lets readers (``ohe sessions``,
+# the exporter) run while the session is live; synchronous=NORMAL only fsyncs
+# at WAL checkpoints instead of on every commit.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-65536;",      # 64 MiB page cache
+    "PRAGMA mmap_size=268435456;",    # 256 MiB memory-mapped I/O
+    "PRAGMA busy_timeout=5000;",
+)
 
-def _safe_commit(conn: sqlite3.Connection) -> None:
-    """Commit only when there is an active transaction; silently skip otherwise.
+# Buffered single-row measurements are flushed at whichever comes first
+_FLUSH_ROWS = 500
+_FLUSH_INTERVAL_S = 1.0
 
-    sqlite3 in Python operates in *deferred transaction* mode by default —
-    ``conn.in_transaction`` is True whenever DML has been issued since the
-    last commit/rollback.  Calling commit() when ``in_transaction`` is False
-    is a no-op in SQLite, but we guard explicitly to be safe across versions.
-    """
-    try:
-        if conn.in_transaction:
-            conn.commit()
-    except sqlite3.OperationalError as exc:
-        # "cannot commit – no transaction is active" → already committed/rolled back
-        logger.debug("_safe_commit: suppressed OperationalError — %s", exc)
-    except Exception:
-        logger.exception("_safe_commit: unexpected error")
+_INSERT_MEASUREMENT = (
+    "INSERT INTO measurements "
+    "(session_id,frame_id,timestamp_ms,stagger_mm,"
+    "diameter_mm,confidence,wire_bbox) VALUES (?,?,?,?,?,?,?)"
+)
+
+_INSERT_ANOMALY = """
+    INSERT INTO anomalies
+        (session_id, frame_id, timestamp_ms, anomaly_type, value,
+         threshold, severity, message, latitude, longitude,
+         speed_kmh, video_clip, model_version)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
 
 
 class SessionLogger:
@@ -110,16 +147,20 @@ class SessionLogger:
         source: str,
         notes: str = "",
         track_name: str = "",
+        exclusive: bool = False,
     ) -> None:
         self._session_dir = session_dir
         self._source = source
         self._notes = notes
         self._track_name = track_name
+        self._exclusive = exclusive
         self._session_id: str = ""
         self._db_path: Optional[Path] = None
         self._conn: Optional[sqlite3.Connection] = None
         self._info: Optional[SessionInfo] = None
         self._lock = threading.Lock()
+        self._m_buf: list[tuple] = []
+        self._last_flush = time.monotonic()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -128,16 +169,24 @@ class SessionLogger:
     def start(self) -> SessionInfo:
         """Open a new session and create the SQLite database."""
         self._session_dir.mkdir(parents=True, exist_ok=True)
-        ts = time.strftime("%Y%m%dT%H%M%S")
-        self._session_id = f"{ts}_{uuid.uuid4().hex[:6]}"
+        # The random suffix separates sessions started within the same
+        # second; the clock alone can't, as it ticks in ~15.6 ms steps on
+        # Windows.
+        ts = time.strftime("%Y%m%dT%H%M%S", time.localtime(time.time_ns() // 1_000_000_000))
+        self._session_id = f"{ts}_{secrets.token_hex(3)}"
         self._db_path = self._session_dir / f"{self._session_id}.sqlite"
 
-        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
-        # WAL mode: allows concurrent readers + one writer, much safer
-        conn.execute("PRAGMA journal_mode=WAL;")
+        conn = sqlite3.connect(
+            str(self._db_path), isolation_level=None, check_same_thread=False
+        )
+        if self._exclusive:
+            # Must precede journal_mode=WAL so the WAL index lives in heap memory
+            conn.execute("PRAGMA locking_mode=EXCLUSIVE;")
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
         conn.executescript(_DDL)
-        _safe_commit(conn)
         self._conn = conn
+        self._last_flush = time.monotonic()
 
         started_at = time.time() * 1000
         with self._lock:
@@ -147,7 +196,6 @@ class SessionLogger:
                 (self._session_id, self._source, started_at,
                  self._track_name, self._notes),
             )
-            _safe_commit(self._conn)
 
         self._info = SessionInfo(
             session_id=self._session_id,
@@ -165,6 +213,7 @@ class SessionLogger:
             raise RuntimeError("Session not started.")
         ended_at = time.time() * 1000
         with self._lock:
+            self._flush_locked()
             try:
                 self._conn.execute(
                     "UPDATE sessions SET ended_at_ms=?, total_frames=?, "
@@ -172,7 +221,8 @@ class SessionLogger:
                     (ended_at, self._info.total_frames, self._info.anomaly_count,
                      self._info.event_clip_count, self._session_id),
                 )
-                _safe_commit(self._conn)
+                # Give the planner row statistics for the export queries
+                self._conn.execute("ANALYZE")
             except Exception:
                 logger.exception("SessionLogger.stop: error finalising session record")
             finally:
@@ -194,21 +244,17 @@ class SessionLogger:
     # ------------------------------------------------------------------
 
     def log_measurement(self, m: Measurement) -> None:
+        """Queue one measurement row; it reaches SQLite on the next flush."""
         if self._conn is None:
             return
-        bbox_str = str(m.wire_bbox) if m.wire_bbox else None
+        row = self._measurement_row(m)
         with self._lock:
-            try:
-                self._conn.execute(
-                    "INSERT INTO measurements "
-                    "(session_id,frame_id,timestamp_ms,stagger_mm,"
-                    "diameter_mm,confidence,wire_bbox) VALUES (?,?,?,?,?,?,?)",
-                    (self._session_id, m.frame_id, m.timestamp_ms,
-                     m.stagger_mm, m.diameter_mm, m.confidence, bbox_str),
-                )
-                _safe_commit(self._conn)
-            except Exception:
-                logger.exception("log_measurement: write failed (frame %d)", m.frame_id)
+            self._m_buf.append(row)
+            if (
+                len(self._m_buf) >= _FLUSH_ROWS
+                or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL_S
+            ):
+                self._flush_locked()
         if self._info:
             self._info.total_frames += 1
 
@@ -219,22 +265,9 @@ class SessionLogger:
         rowid = -1
         with self._lock:
             try:
-                cur = self._conn.execute(
-                    """
-                    INSERT INTO anomalies
-                        (session_id, frame_id, timestamp_ms, anomaly_type, value,
-                         threshold, severity, message, latitude, longitude,
-                         speed_kmh, video_clip, model_version)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    """,
-                    (
-                        self._session_id, a.frame_id, a.timestamp_ms,
-                        a.anomaly_type, a.value, a.threshold, a.severity,
-                        a.message, a.latitude, a.longitude, a.speed_kmh,
-                        a.video_clip, a.model_version,
-                    ),
-                )
-                _safe_commit(self._conn)
+                # Buffered measurements first, so rows land in frame order
+                self._flush_locked()
+                cur = self._conn.execute(_INSERT_ANOMALY, self._anomaly_row(a))
                 rowid = cur.lastrowid or -1
             except Exception:
                 logger.exception("log_anomaly: write failed (frame %d)", a.frame_id)
@@ -242,6 +275,88 @@ class SessionLogger:
             self._info.anomaly_count += 1
         return rowid
 
+    def log_batch(self, items: list[tuple[Measurement, list[Anomaly]]]) -> None:
+        """Write many ``(Measurement, [Anomaly])`` pairs in one transaction.
+
+        Used by :class:`~ohe.logging_.log_worker.LogWorker` so that a burst of
+        frames costs a single commit (and a single fsync) instead of one each.
+        """
+        if self._conn is None or not items:
+            return
+        m_rows = [self._measurement_row(m) for m, _ in items]
+        a_rows = [self._anomaly_row(a) for _, anomalies in items for a in anomalies]
+        with self._lock:
+            try:
+                self._insert_locked(m_rows, a_rows)
+            except Exception:
+                logger.exception(
+                    "log_batch: write failed (frames %d..%d)",
+                    items[0][0].frame_id, items[-1][0].frame_id,
+                )
+        if self._info:
+            self._info.total_frames += len(m_rows)
+            self._info.anomaly_count += len(a_rows)
+
+    def flush(self) -> None:
+        """Write any buffered measurement rows in one transaction."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._flush_locked()
+
+    def checkpoint(self) -> None:
+        """Flush buffered rows and run a passive WAL checkpoint.
+
+        With ``synchronous=NORMAL`` commits don't fsync; durability comes at
+        checkpoints, so the log worker calls this every few seconds rather
+        than paying an fsync per transaction.
+        """
+        if self._conn is None:
+            return
+        with self._lock:
+            self._flush_locked()
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error:
+                logger.exception("SessionLogger: WAL checkpoint failed")
+
+    def _flush_locked(self) -> None:
+        """Insert ``_m_buf`` in a single transaction.  Caller holds ``_lock``."""
+        n = len(self._m_buf)
+        try:
+            self._insert_locked()
+        except Exception:
+            logger.exception("SessionLogger: flush of %d measurement row(s) failed", n)
+
+    def _insert_locked(
+        self, m_rows: Sequence[tuple] = (), a_rows: Sequence[tuple] = ()
+    ) -> None:
+        """Insert buffered + given rows in one explicit BEGIN … COMMIT.
+
+        Caller holds ``_lock``.  The buffer is consumed either way; on error
+        the transaction is rolled back and the exception re-raised.
+        """
+        self._last_flush = time.monotonic()
+        pending, self._m_buf = self._m_buf, []
+        if not (pending or m_rows or a_rows):
+            return
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            if pending:
+                conn.executemany(_INSERT_MEASUREMENT, pending)
+            if m_rows:
+                conn.executemany(_INSERT_MEASUREMENT, m_rows)
+            if a_rows:
+                conn.executemany(_INSERT_ANOMALY, a_rows)
+            conn.execute("COMMIT")
+        except Exception:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            raise
+
     def update_anomaly_clip(self, anomaly_rowid: int, clip_path: str) -> None:
         """Backfill the video_clip path once the clip file has been written."""
         if self._conn is None or anomaly_rowid < 0:
@@ -252,7 +367,6 @@ class SessionLogger:
                     "UPDATE anomalies SET video_clip=? WHERE id=?",
                     (clip_path, anomaly_rowid),
                 )
-                _safe_commit(self._conn)
             except Exception:
                 logger.exception(
                     "update_anomaly_clip: write failed (rowid %d)", anomaly_rowid
@@ -260,6 +374,25 @@ class SessionLogger:
         if self._info:
             self._info.event_clip_count += 1
 
+    # ------------------------------------------------------------------
+    # Row builders
+    # ------------------------------------------------------------------
+
+    def _measurement_row(self, m: Measurement) -> tuple:
+        bbox_str = (
+            f"({m.bbox_x}, {m.bbox_y}, {m.bbox_w}, {m.bbox_h})" if m.bbox_x >= 0 else None
+        )
+        return (self._session_id, m.frame_id, m.timestamp_ms,
+                m.stagger_mm, m.diameter_mm, m.confidence, bbox_str)
+
+    def _anomaly_row(self, a: Anomaly) -> tuple:
+        return (
+            self._session_id, a.frame_id, a.timestamp_ms,
+            a.anomaly_type, a.value, a.threshold, a.severity,
+            a.message, a.latitude, a.longitude, a.speed_kmh,
+            a.video_clip, a.model_version,
+        )
+
     @property
     def db_path(self) -> Optional[Path]:
         return self._db_path
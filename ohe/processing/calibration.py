@@ -18,6 +18,11 @@ from typing import Optional
 import cv2
 import numpy as np
 
+try:  # optional speed-up: orjson parses several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - depends on the install
+    orjson = None  # type: ignore[assignment]
+
 from ohe.core.exceptions import CalibrationError
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,19 @@ logger = logging.getLogger(__name__)
 class CalibrationModel:
     """Encapsulates camera geometry and pixel-to-mm scale."""
 
+    __slots__ = (
+        "_px_per_mm",
+        "_mm_per_px",
+        "track_centre_x_px",
+        "image_width_px",
+        "image_height_px",
+        "use_undistort",
+        "_camera_matrix",
+        "_dist_coeffs",
+        "_map1",
+        "_map2",
+    )
+
     def __init__(
         self,
         px_per_mm: float,
@@ -36,8 +54,6 @@ class CalibrationModel:
         camera_matrix: Optional[np.ndarray] = None,
         dist_coeffs: Optional[np.ndarray] = None,
     ) -> None:
-        if px_per_mm <= 0:
-            raise CalibrationError(f"px_per_mm must be positive, got {px_per_mm}")
         self.px_per_mm = px_per_mm
         self.track_centre_x_px = track_centre_x_px
         self.image_width_px = image_width_px
@@ -55,9 +71,27 @@ class CalibrationModel:
     # Pixel ↔ mm conversions
     # ------------------------------------------------------------------
 
+    @property
+    def px_per_mm(self) -> float:
+        return self._px_per_mm
+
+    @px_per_mm.setter
+    def px_per_mm(self, value: float) -> None:
+        if value <= 0:
+            raise CalibrationError(f"px_per_mm must be positive, got {value}")
+        self._px_per_mm = value
+        # Conversions run per frame; multiply by the reciprocal instead of dividing
+        self._mm_per_px = 1.0 / value
+
     def px_to_mm(self, pixels: float) -> float:
         """Convert a distance in pixels to millimetres."""
-        return pixels / self.px_per_mm
+        return pixels * self._mm_per_px
+
+    def px_to_mm_array(
+        self, pixels: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Vectorised :meth:`px_to_mm`; writes into *out* when given."""
+        return np.multiply(pixels, self._mm_per_px, out=out)
 
     def mm_to_px(self, mm: float) -> float:
         """Convert a distance in millimetres to pixels."""
@@ -68,29 +102,57 @@ class CalibrationModel:
 
         Positive = wire to the right of track centre.
         """
-        offset_px = wire_centre_x_px - self.track_centre_x_px
-        return self.px_to_mm(offset_px)
+        return (wire_centre_x_px - self.track_centre_x_px) * self._mm_per_px
+
+    def stagger_from_centre_px_array(
+        self, wire_centre_x_px: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Vectorised :meth:`stagger_from_centre_px`; writes into *out* when given."""
+        out = np.subtract(wire_centre_x_px, self.track_centre_x_px, out=out, dtype=np.float64)
+        return np.multiply(out, self._mm_per_px, out=out)
 
     # ------------------------------------------------------------------
     # Undistortion
     # ------------------------------------------------------------------
 
-    def undistort(self, image: np.ndarray) -> np.ndarray:
-        """Apply pre-computed lens undistortion maps to *image*."""
+    def undistort(self, image: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply pre-computed lens undistortion maps to *image*.
+
+        Pass *dst* (calibration-sized, same dtype as *image*) to write into a
+        reusable buffer instead of allocating a new image per call.
+        """
         if self._map1 is None or self._map2 is None:
             return image
-        return cv2.remap(image, self._map1, self._map2, cv2.INTER_LINEAR)
+        return cv2.remap(image, self._map1, self._map2, cv2.INTER_LINEAR, dst=dst)
+
+    def undistort_maps(
+        self, x: int, y: int, width: int, height: int
+    ) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Build remap tables that undistort the sub-window (x, y, width, height).
+
+        The camera's principal point is shifted into the window's coordinates,
+        so remapping a crop with these tables matches undistorting the full
+        frame and then cropping only in the window's interior.  Near the edges
+        the distortion can pull source pixels from outside the crop, which
+        the crop does not have; callers remap with ``BORDER_REPLICATE`` so
+        those pixels repeat the crop's edge instead of turning black.
+        Returns ``None`` when no camera model is loaded.
+        """
+        if self._camera_matrix is None or self._dist_coeffs is None:
+            return None
+        k = self._camera_matrix.copy()
+        k[0, 2] -= x
+        k[1, 2] -= y
+        # CV_16SC2 yields the fixed-point pair remap's fast path wants: integer
+        # source coordinates (map1) plus a CV_16UC1 interpolation-table index
+        # (map2) — the same thing cv2.convertMaps would produce from float maps.
+        return cv2.initUndistortRectifyMap(
+            k, self._dist_coeffs, None, k, (width, height), cv2.CV_16SC2
+        )
 
     def _build_undistort_maps(self) -> None:
         size = (self.image_width_px, self.image_height_px)
-        self._map1, self._map2 = cv2.initUndistortRectifyMap(
-            self._camera_matrix,
-            self._dist_coeffs,
-            None,
-            self._camera_matrix,
-            size,
-            cv2.CV_16SC2,
-        )
+        self._map1, self._map2 = self.undistort_maps(0, 0, *size)  # type: ignore[misc]
         logger.debug("Undistortion maps built for %s", size)
 
     # ------------------------------------------------------------------
@@ -114,8 +176,8 @@ class CalibrationModel:
                 image_height_px=1080,
             )
 
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         px_per_mm = float(data.get("px_per_mm", fallback_px_per_mm))
         track_centre_x = int(data.get("track_centre_x_px", data.get("image_width_px", 1920) // 2))
@@ -129,11 +191,12 @@ class CalibrationModel:
 
         if use_undistort:
             try:
-                camera_matrix = np.array([
-                    [dist_cfg["fx"], 0,              dist_cfg["cx"]],
-                    [0,              dist_cfg["fy"],  dist_cfg["cy"]],
-                    [0,              0,               1.0           ],
-                ], dtype=np.float64)
+                camera_matrix = np.zeros((3, 3), dtype=np.float64)
+                camera_matrix[0, 0] = dist_cfg["fx"]
+                camera_matrix[0, 2] = dist_cfg["cx"]
+                camera_matrix[1, 1] = dist_cfg["fy"]
+                camera_matrix[1, 2] = dist_cfg["cy"]
+                camera_matrix[2, 2] = 1.0
                 dist_coeffs = np.array(
                     [dist_cfg["k1"], dist_cfg["k2"], dist_cfg["p1"], dist_cfg["p2"], dist_cfg["k3"]],
                     dtype=np.float64,
@@ -12,11 +12,12 @@ Key improvements over Phase 1
    the contact wire, not the longest one.
 3. **Line-cluster voting** — nearby parallel lines are merged into cluster
    representatives before election, suppressing duplicate detections.
-4. **Gaussian profile diameter** — a vertical intensity profile is fitted
-   with a 1-D Gaussian to get a sub-pixel width estimate, replacing the
-   crude edge-span count.
-5. **Diagnostic mode** — ``detect_debug()`` returns an annotated BGR image
-   for the debug visualiser without altering the normal detection path.
+4. **Gaussian profile diameter** — the half-maximum width of the peak lobe
+   in a vertical intensity profile gives a sub-pixel wire width, replacing
+   the crude edge-span count.
+5. **Diagnostic mode** — ``detect(pf, debug=img)`` draws its intermediate
+   lines onto *img*; ``detect_debug()`` wraps that for the debug visualiser.
+   Without a debug image the drawing code is skipped entirely.
 """
 
 from __future__ import annotations
@@ -27,7 +28,11 @@ from typing import Optional
 
 import cv2
 import numpy as np
-from scipy.optimize import curve_fit  # type: ignore[import-untyped]
+
+try:  # optional speed-up: JIT-compiles the per-frame profile kernel below
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the install
+    njit = None
 
 from ohe.core.config import ProcessingConfig
 from ohe.core.models import ProcessedFrame, WireCandidate
@@ -40,29 +45,152 @@ _WIRE_ANGLE_TOLERANCE_DEG = 30.0
 _CLUSTER_Y_TOLERANCE_PX = 8
 
 
+# Profiles are smoothed with the [1, 4, 6, 4, 1] / 16 binomial kernel, which
+# adds this variance (px²) to the wire's own; it is subtracted back out
+_SMOOTH_VAR = 1.0
+# Minimum peak height over the baseline, in grey levels × 16 (the kernel gain)
+_MIN_PEAK_X16 = 5 * 16
+# ... and in multiples of the pixel noise σ, estimated from the median
+# absolute first difference (≈ 0.954 σ for Gaussian noise)
+_MIN_PEAK_SNR = 4.0
+_MAD_DIFF_PER_SIGMA = 0.954
+
+
+def _profile_fwhm(col: np.ndarray, search_half: int) -> float:
+    """Half-maximum width of the peak lobe in a vertical intensity profile.
+
+    Same estimate as the NumPy path in :meth:`WireDetector._gaussian_diameter`,
+    written as scalar loops so Numba can compile it.  *col* is the raw
+    ``uint8`` column view; everything up to the two crossing interpolations
+    is exact integer arithmetic on the profile scaled by 16.  Called
+    un-jitted only by tests.
+    """
+    n = col.shape[0]
+    last = n - 1
+    sm = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        sm[i] = (
+            int(col[max(i - 2, 0)])
+            + 4 * int(col[max(i - 1, 0)])
+            + 6 * int(col[i])
+            + 4 * int(col[min(i + 1, last)])
+            + int(col[min(i + 2, last)])
+        )
+    base = np.sort(sm)[last // 4]
+    p = 0
+    for i in range(1, n):
+        if sm[i] > sm[p]:
+            p = i
+    amp = sm[p] - base
+    if amp < _MIN_PEAK_X16:
+        return 4.0
+    diffs = np.empty(last, dtype=np.int64)
+    for i in range(last):
+        diffs[i] = abs(int(col[i + 1]) - int(col[i]))
+    mad = np.sort(diffs)[(last - 1) // 2]
+    if amp < _MIN_PEAK_SNR * 16 * mad / _MAD_DIFF_PER_SIGMA:
+        return 4.0
+
+    # Walk out from the peak to the half-maximum crossings on either side
+    half = base + amp / 2.0
+    i = p
+    while i > 0 and sm[i - 1] > half:
+        i -= 1
+    left = 0.0
+    if i > 0:
+        left = (i - 1) + (half - sm[i - 1]) / (sm[i] - sm[i - 1])
+    j = p
+    while j < last and sm[j + 1] > half:
+        j += 1
+    right = float(last)
+    if j < last:
+        right = j + (sm[j] - half) / (sm[j] - sm[j + 1])
+
+    sigma_sq = ((right - left) / 2.355) ** 2 - _SMOOTH_VAR
+    if sigma_sq <= 0.0:
+        return 1.0
+    fwhm = 2.355 * math.sqrt(sigma_sq)
+    return max(1.0, min(fwhm, search_half * 2.0))
+
+
+_profile_fwhm_jit = None
+if njit is not None:
+    try:
+        _profile_fwhm_jit = njit(cache=True)(_profile_fwhm)
+        # Compile (or load from the on-disk cache) now rather than on the first
+        # frame, for the strided uint8 column view _gaussian_diameter passes in
+        _profile_fwhm_jit(np.zeros((5, 2), dtype=np.uint8)[:, 0], 25)
+    except Exception:  # pragma: no cover - e.g. no cache locator when frozen
+        logger.warning("Numba profile kernel unavailable; using NumPy path", exc_info=True)
+        _profile_fwhm_jit = None
+
+
 class WireDetector:
     """Detects the contact wire in a :class:`ProcessedFrame`."""
 
+    __slots__ = (
+        "_cfg",
+        "_canny_t1",
+        "_canny_t2",
+        "_hough_rho",
+        "_hough_theta_rad",
+        "_hough_threshold",
+        "_hough_min_len",
+        "_hough_max_gap",
+        "_angle_tol_rad",
+        "_edges_buf",
+        "_dbg_buf",
+    )
+
     def __init__(self, config: ProcessingConfig) -> None:
         self._cfg = config
+        # Hough/Canny parameters are fixed for the detector's lifetime, so
+        # convert and look them up once rather than on every frame
+        self._canny_t1 = config.canny_threshold1
+        self._canny_t2 = config.canny_threshold2
+        self._hough_rho = config.hough_rho
+        self._hough_theta_rad = math.radians(config.hough_theta_deg)
+        self._hough_threshold = config.hough_threshold
+        self._hough_min_len = config.hough_min_line_length
+        self._hough_max_gap = config.hough_max_line_gap
+        self._angle_tol_rad = math.radians(_WIRE_ANGLE_TOLERANCE_DEG)
+        # Canny output never leaves _find_hough_lines, so one buffer is reused
+        self._edges_buf: Optional[np.ndarray] = None
+        # BGR canvas for detect_debug(); allocated on first use, so the normal
+        # detect() path never pays for it
+        self._dbg_buf: Optional[np.ndarray] = None
 
     # ------------------------------------------------------------------
     # Public API — normal detection
     # ------------------------------------------------------------------
 
-    def detect(self, pf: ProcessedFrame) -> WireCandidate:
-        """Detect contact wire; return :class:`WireCandidate` (conf=0 if not found)."""
+    def detect(
+        self, pf: ProcessedFrame, debug: Optional[np.ndarray] = None
+    ) -> WireCandidate:
+        """Detect contact wire; return :class:`WireCandidate` (conf=0 if not found).
+
+        If *debug* is a BGR image the size of ``pf.roi_image``, the Hough
+        lines, the filtered lines and the elected wire are drawn onto it.
+        With the default ``None`` no drawing code runs at all.
+        """
         lines = self._find_hough_lines(pf.roi_image)
         if lines is None:
             return self._empty(pf)
 
         horizontal = self._filter_horizontal(lines)
-        if not horizontal:
+        if debug is not None:
+            # All Hough lines in blue, horizontal-filtered lines in yellow
+            _draw_lines(debug, lines, (255, 150, 0))
+            _draw_lines(debug, horizontal, (0, 255, 255))
+        if len(horizontal) == 0:
             return self._empty(pf)
 
-        clusters = self._cluster_lines(horizontal)
-        best = self._elect_lowest_wire(clusters)
-        return self._build_candidate(pf, best)
+        clusters, length_sq = self._cluster_lines(horizontal)
+        best, best_len_sq = self._elect_lowest_wire(clusters, length_sq)
+        cand = self._build_candidate(pf, best, best_len_sq)
+        if debug is not None:
+            _draw_candidate(debug, best, cand)
+        return cand
 
     # ------------------------------------------------------------------
     # Public API — debug / visualiser hook
@@ -72,136 +200,104 @@ class WireDetector:
         """Same as :meth:`detect` but also returns an annotated BGR overlay image.
 
         The returned image has the same dimensions as ``pf.roi_image`` but is
-        converted to BGR so colours can be drawn on it.
+        converted to BGR so colours can be drawn on it.  It is a buffer owned
+        by the detector and is overwritten by the next call.
         """
-        dbg = cv2.cvtColor(pf.roi_image, cv2.COLOR_GRAY2BGR)
-
-        lines = self._find_hough_lines(pf.roi_image)
-        if lines is None:
-            return self._empty(pf), dbg
-
-        # Draw all Hough lines in blue
-        for x1, y1, x2, y2 in lines:
-            cv2.line(dbg, (x1, y1), (x2, y2), (255, 150, 0), 1)
-
-        horizontal = self._filter_horizontal(lines)
-        # Draw horizontal-filtered lines in yellow
-        for x1, y1, x2, y2 in horizontal:
-            cv2.line(dbg, (x1, y1), (x2, y2), (0, 255, 255), 1)
-
-        if not horizontal:
-            return self._empty(pf), dbg
-
-        clusters = self._cluster_lines(horizontal)
-        best = self._elect_lowest_wire(clusters)
-
-        # Draw elected wire in green, thick
-        x1, y1, x2, y2 = best
-        cv2.line(dbg, (x1, y1), (x2, y2), (0, 255, 0), 3)
-
-        cand = self._build_candidate(pf, best)
-
-        # Draw wire centre and bbox
-        if cand.confidence > 0:
-            cx, cy = int(cand.centre_x), int(cand.centre_y)
-            cv2.circle(dbg, (cx, cy), 5, (0, 0, 255), -1)
-            cv2.rectangle(
-                dbg,
-                (cand.bbox_x, cand.bbox_y),
-                (cand.bbox_x + cand.bbox_w, cand.bbox_y + cand.bbox_h),
-                (0, 200, 0), 1,
-            )
-            label = f"conf={cand.confidence:.2f} diam={cand.diameter_px:.1f}px"
-            cv2.putText(dbg, label, (cx - 60, cy - 12),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 0), 1)
-
-        return cand, dbg
+        img = pf.roi_image
+        shape = (img.shape[0], img.shape[1], 3)
+        if self._dbg_buf is None or self._dbg_buf.shape != shape:
+            self._dbg_buf = np.empty(shape, dtype=np.uint8)
+        dbg = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR, dst=self._dbg_buf)
+        return self.detect(pf, dbg), dbg
 
     # ------------------------------------------------------------------
     # Step 1: Canny + Hough
     # ------------------------------------------------------------------
 
-    def _find_hough_lines(
-        self, img: np.ndarray
-    ) -> Optional[list[tuple[int, int, int, int]]]:
-        edges = cv2.Canny(img, self._cfg.canny_threshold1, self._cfg.canny_threshold2)
+    def _find_hough_lines(self, img: np.ndarray) -> Optional[np.ndarray]:
+        """Return the Hough segments as an ``(N, 4)`` array of x1, y1, x2, y2."""
+        if self._edges_buf is None or self._edges_buf.shape != img.shape[:2]:
+            self._edges_buf = np.empty(img.shape[:2], dtype=np.uint8)
+        edges = cv2.Canny(img, self._canny_t1, self._canny_t2, edges=self._edges_buf)
         raw = cv2.HoughLinesP(
             edges,
-            rho=self._cfg.hough_rho,
-            theta=math.radians(self._cfg.hough_theta_deg),
-            threshold=self._cfg.hough_threshold,
-            minLineLength=self._cfg.hough_min_line_length,
-            maxLineGap=self._cfg.hough_max_line_gap,
+            rho=self._hough_rho,
+            theta=self._hough_theta_rad,
+            threshold=self._hough_threshold,
+            minLineLength=self._hough_min_len,
+            maxLineGap=self._hough_max_gap,
         )
         if raw is None or len(raw) == 0:
             return None
-        return [tuple(r[0]) for r in raw]  # type: ignore[return-value]
+        # HoughLinesP returns (N, 1, 4) on most builds, (N, 4) on some
+        return raw.reshape(-1, 4)
 
     # ------------------------------------------------------------------
     # Step 2: filter to near-horizontal lines
     # ------------------------------------------------------------------
 
-    def _filter_horizontal(
-        self, lines: list[tuple[int, int, int, int]]
-    ) -> list[tuple[int, int, int, int]]:
-        result = []
-        tol = _WIRE_ANGLE_TOLERANCE_DEG
-        for x1, y1, x2, y2 in lines:
-            dx, dy = x2 - x1, y2 - y1
-            angle = abs(math.degrees(math.atan2(dy, dx)))
-            if angle > 90:
-                angle = 180 - angle
-            if angle <= tol:
-                result.append((x1, y1, x2, y2))
-        return result
+    def _filter_horizontal(self, lines: np.ndarray) -> np.ndarray:
+        """Keep the rows of *lines* within the wire angle tolerance of horizontal."""
+        dx = lines[:, 2] - lines[:, 0]
+        dy = lines[:, 3] - lines[:, 1]
+        angle = np.abs(np.arctan2(dy, dx))
+        # Fold [0, π] onto [0, π/2] so right-to-left segments count too
+        return lines[np.minimum(angle, math.pi - angle) <= self._angle_tol_rad]
 
     # ------------------------------------------------------------------
     # Step 3: cluster nearby lines by mid-Y
     # ------------------------------------------------------------------
 
-    def _cluster_lines(
-        self, lines: list[tuple[int, int, int, int]]
-    ) -> list[tuple[int, int, int, int]]:
-        """Merge lines whose mid-Y values are within _CLUSTER_Y_TOLERANCE_PX."""
-        # Sort by mid-Y
-        sorted_lines = sorted(lines, key=lambda l: (l[1] + l[3]) / 2)
-        clusters: list[list[tuple[int, int, int, int]]] = []
-        for line in sorted_lines:
-            mid_y = (line[1] + line[3]) / 2
-            placed = False
-            for cluster in clusters:
-                rep = cluster[0]
-                rep_mid_y = (rep[1] + rep[3]) / 2
-                if abs(mid_y - rep_mid_y) <= _CLUSTER_Y_TOLERANCE_PX:
-                    cluster.append(line)
-                    placed = True
-                    break
-            if not placed:
-                clusters.append([line])
-
-        # From each cluster, pick the longest line as representative
-        representatives = []
-        for cluster in clusters:
-            best = max(cluster, key=lambda l: (l[2] - l[0]) ** 2 + (l[3] - l[1]) ** 2)
-            representatives.append(best)
-        return representatives
+    @staticmethod
+    def _cluster_lines(lines: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Merge lines whose mid-Y values are within _CLUSTER_Y_TOLERANCE_PX.
+
+        Walking the lines in mid-Y order, a cluster starts at the first line
+        not yet assigned and takes every line within the tolerance of it, so
+        each cluster is found with one ``searchsorted`` on the sorted mid-Ys.
+        Returns the longest line of each cluster as a ``(K, 4)`` array, in
+        ascending mid-Y order, and the squared length of each.
+        """
+        mid = (lines[:, 1] + lines[:, 3]) * 0.5
+        order = np.argsort(mid, kind="stable")
+        lines = lines[order]
+        mid = mid[order]
+        dx = lines[:, 2] - lines[:, 0]
+        dy = lines[:, 3] - lines[:, 1]
+        length_sq = dx * dx + dy * dy
+
+        n = len(mid)
+        searchsorted = mid.searchsorted
+        reps = []
+        start = 0
+        while start < n:
+            end = int(searchsorted(mid[start] + _CLUSTER_Y_TOLERANCE_PX, side="right"))
+            # From each cluster, pick the longest line as representative
+            reps.append(start + int(length_sq[start:end].argmax()))
+            start = end
+        return lines[reps], length_sq[reps]
 
     # ------------------------------------------------------------------
     # Step 4: elect lowest (contact) wire — highest Y = closest to pantograph
     # ------------------------------------------------------------------
 
+    @staticmethod
     def _elect_lowest_wire(
-        self, lines: list[tuple[int, int, int, int]]
-    ) -> tuple[int, int, int, int]:
-        """Return the line whose midpoint has the highest Y value (lowest in image)."""
-        return max(lines, key=lambda l: (l[1] + l[3]) / 2)
+        lines: np.ndarray, length_sq: np.ndarray
+    ) -> tuple[tuple[int, int, int, int], int]:
+        """Return the line whose midpoint has the highest Y value (lowest in image).
+
+        Its squared length is returned alongside so the caller doesn't recompute it.
+        """
+        i = int((lines[:, 1] + lines[:, 3]).argmax())
+        return tuple(lines[i].tolist()), int(length_sq[i])  # type: ignore[return-value]
 
     # ------------------------------------------------------------------
     # Step 5: build WireCandidate with Gaussian diameter
     # ------------------------------------------------------------------
 
     def _build_candidate(
-        self, pf: ProcessedFrame, line: tuple[int, int, int, int]
+        self, pf: ProcessedFrame, line: tuple[int, int, int, int], len_sq: int
     ) -> WireCandidate:
         x1, y1, x2, y2 = line
         h, w = pf.roi_image.shape[:2]
@@ -220,16 +316,18 @@ class WireDetector:
         bh = min(h - by, 2 * pad)
 
         # Confidence: fraction of ROI width covered (capped at 1.0)
-        line_len = math.hypot(x2 - x1, y2 - y1)
+        line_len = math.sqrt(len_sq)
         confidence = min(1.0, line_len / max(w, 1))
 
+        # Positional, in field order (per-frame hot path):
+        # frame_id, timestamp_ms, bbox x/y/w/h, centre x/y, diameter_px, confidence
+        raw = pf.raw
         return WireCandidate(
-            frame_id=pf.raw.frame_id,
-            timestamp_ms=pf.raw.timestamp_ms,
-            bbox_x=bx, bbox_y=by, bbox_w=bw, bbox_h=bh,
-            centre_x=cx, centre_y=cy,
-            diameter_px=diameter_px,
-            confidence=confidence,
+            raw.frame_id, raw.timestamp_ms,
+            bx, by, bw, bh,
+            cx, cy,
+            diameter_px,
+            confidence,
         )
 
     # ------------------------------------------------------------------
@@ -240,55 +338,100 @@ class WireDetector:
     def _gaussian_diameter(
         img: np.ndarray, cx: int, cy: int, search_half: int = 25
     ) -> float:
-        """Fit a 1-D Gaussian to a vertical intensity profile centred at (cx, cy).
-
-        Returns the FWHM (full-width at half-maximum) as the wire diameter in px.
-        Falls back to 4.0 px if the fit fails or the profile is featureless.
+        """Estimate the wire width from a vertical intensity profile at (cx, cy).
+
+        The profile is lightly smoothed, its background taken as the lower
+        quartile (robust to noise and to the wire itself), and the width read
+        off where the lobe around the peak crosses half its height.  Only that
+        contiguous lobe counts, so background noise elsewhere in the window
+        cannot widen the estimate.  The smoothing kernel's own spread is
+        subtracted in quadrature.  Returns the FWHM (full-width at
+        half-maximum) as the wire diameter in px, or 4.0 px if the profile
+        is featureless or its peak does not stand clear of the pixel noise.
         """
         h = img.shape[0]
         y0 = max(0, cy - search_half)
         y1 = min(h, cy + search_half + 1)
-        col = img[y0:y1, cx].astype(np.float64)
+        # A view into the (uint8) ROI — no float copy of the column
+        col = img[y0:y1, cx]
         if col.size < 5:
             return 4.0
-
-        xs = np.arange(len(col), dtype=np.float64)
-        # Initial guesses: amplitude=max, mean=centre, sigma=5
-        peak_idx = int(np.argmax(col))
-        amp0 = float(col[peak_idx])
-        mu0 = float(peak_idx)
-        sigma0 = 5.0
-        baseline0 = float(col.min())
-
-        if amp0 - baseline0 < 5:
+        if _profile_fwhm_jit is not None:
+            return _profile_fwhm_jit(col, search_half)
+
+        # [1, 4, 6, 4, 1] smoothing in integers (×16), edges replicated
+        wide = col.astype(np.int64)
+        padded = np.pad(wide, 2, mode="edge")
+        sm = np.convolve(padded, (1, 4, 6, 4, 1), mode="valid")
+        last = len(sm) - 1
+        base = int(np.partition(sm, last // 4)[last // 4])
+        p = int(np.argmax(sm))
+        amp = int(sm[p]) - base
+        if amp < _MIN_PEAK_X16:
             # Featureless column — no detectable wire
             return 4.0
-
-        def _gaussian(x, amp, mu, sigma, baseline):
-            return baseline + amp * np.exp(-0.5 * ((x - mu) / (sigma + 1e-9)) ** 2)
-
-        try:
-            popt, _ = curve_fit(
-                _gaussian, xs, col,
-                p0=[amp0 - baseline0, mu0, sigma0, baseline0],
-                bounds=([0, 0, 0.5, 0], [255, len(col), search_half, 255]),
-                maxfev=200,
-            )
-            sigma_fit = abs(popt[2])
-            fwhm = 2.355 * sigma_fit   # FWHM = 2√(2 ln 2) · σ
-            return max(1.0, min(fwhm, search_half * 2))
-        except Exception:
-            # Fall back to edge-span method
-            edges = cv2.Canny(img[y0:y1, max(0, cx - 2):cx + 3], 30, 100)
-            edge_rows = np.where(edges[:, 2] > 0)[0]
-            if len(edge_rows) >= 2:
-                return float(edge_rows[-1] - edge_rows[0] + 1)
+        diffs = np.abs(np.diff(wide))
+        k = (last - 1) // 2
+        mad = int(np.partition(diffs, k)[k])
+        if amp < _MIN_PEAK_SNR * 16 * mad / _MAD_DIFF_PER_SIGMA:
+            # No lobe clearly above the noise floor — nothing to measure
             return 4.0
 
+        # Half-maximum crossings bounding the contiguous lobe around the peak
+        half = base + amp / 2.0
+        below = np.flatnonzero(sm <= half)
+        before = below[below < p]
+        after = below[below > p]
+        left = 0.0
+        if before.size:
+            i = int(before[-1]) + 1
+            left = (i - 1) + (half - sm[i - 1]) / (sm[i] - sm[i - 1])
+        right = float(last)
+        if after.size:
+            j = int(after[0]) - 1
+            right = j + (sm[j] - half) / (sm[j] - sm[j + 1])
+
+        sigma_sq = ((right - left) / 2.355) ** 2 - _SMOOTH_VAR
+        if sigma_sq <= 0.0:
+            return 1.0
+        fwhm = 2.355 * math.sqrt(sigma_sq)   # FWHM = 2√(2 ln 2) · σ
+        return max(1.0, min(fwhm, search_half * 2))
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
     def _empty(pf: ProcessedFrame) -> WireCandidate:
-        return WireCandidate(frame_id=pf.raw.frame_id, timestamp_ms=pf.raw.timestamp_ms, confidence=0.0)
+        return WireCandidate(pf.raw.frame_id, pf.raw.timestamp_ms)
+
+
+# ----------------------------------------------------------------------
+# Debug drawing (only reached when detect() is given a debug image)
+# ----------------------------------------------------------------------
+
+def _draw_lines(dbg: np.ndarray, lines: np.ndarray, colour: tuple[int, int, int]) -> None:
+    for x1, y1, x2, y2 in lines.tolist():
+        cv2.line(dbg, (x1, y1), (x2, y2), colour, 1)
+
+
+def _draw_candidate(
+    dbg: np.ndarray, line: tuple[int, int, int, int], cand: WireCandidate
+) -> None:
+    # Elected wire in green, thick
+    x1, y1, x2, y2 = line
+    cv2.line(dbg, (x1, y1), (x2, y2), (0, 255, 0), 3)
+
+    # Wire centre and bbox
+    if cand.confidence > 0:
+        cx, cy = int(cand.centre_x), int(cand.centre_y)
+        cv2.circle(dbg, (cx, cy), 5, (0, 0, 255), -1)
+        cv2.rectangle(
+            dbg,
+            (cand.bbox_x, cand.bbox_y),
+            (cand.bbox_x + cand.bbox_w, cand.bbox_y + cand.bbox_h),
+            (0, 200, 0), 1,
+        )
+        label = f"conf={cand.confidence:.2f} diam={cand.diameter_px:.1f}px"
+        cv2.putText(dbg, label, (cx - 60, cy - 12),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 0), 1)
@@ -36,7 +36,9 @@ class ProcessingPipeline:
         self._cfg = config
         self._calibration = calibration
 
-        self._preprocessor = PreProcessor(config.processing, calibration)
+        # run() consumes each ProcessedFrame before returning, so the
+        # pre-processor may write every frame into the same output buffer.
+        self._preprocessor = PreProcessor(config.processing, calibration, reuse_output=True)
         self._detector = WireDetector(config.processing)
         self._measurement = MeasurementEngine(calibration, config.processing)
 
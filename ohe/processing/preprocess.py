@@ -6,15 +6,33 @@ Pre-processing stage: converts a RawFrame into a ProcessedFrame.
 Steps applied (in order):
 1. ROI crop (optional)
 2. Convert to grayscale
-3. Lens undistortion (optional, if calibration says so)
+3. Lens undistortion (optional, if calibration says so), remapping only the
+   ROI with tables built for that window
 4. CLAHE contrast enhancement
 5. Gaussian blur (noise reduction)
+
+Intermediate images (grayscale, CLAHE output) are written into buffers that
+are allocated on the first frame and reused for every frame of the same
+shape.  The final blurred image is reused too when the owner opts in with
+``reuse_output``: ``True`` writes every frame into one buffer — only safe
+when no caller keeps a ProcessedFrame past the next ``run()`` (as in
+:class:`ProcessingPipeline`) — and an integer *N* rotates through a ring of
+*N* preallocated buffers, so a ``roi_image`` stays valid until *N* further
+``run()`` calls.
+
+With ``processing.use_cuda`` and a CUDA build of OpenCV, steps 3–5 run on
+the GPU on a single CUDA stream: the grayscale ROI is uploaded once and
+only the blurred result is downloaded, instead of each step reading and
+writing the full ROI in host memory.  Without CUDA, ``processing.use_opencl``
+routes the same steps through OpenCV's transparent API instead: the ROI is
+wrapped in a ``cv2.UMat`` once and OpenCV dispatches remap, CLAHE and the
+blur to OpenCL kernels on whatever GPU the driver exposes.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -26,6 +44,79 @@ from ohe.processing.calibration import CalibrationModel
 logger = logging.getLogger(__name__)
 
 
+def _cuda_available() -> bool:
+    """True when OpenCV was built with CUDA and sees at least one device."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _bgr_to_gray(image: np.ndarray, dst: Optional[np.ndarray]) -> np.ndarray:
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=dst)
+
+
+def _as_gray(image: np.ndarray, dst: Optional[np.ndarray]) -> np.ndarray:
+    return image
+
+
+def _opencl_available() -> bool:
+    """True when OpenCV can dispatch UMat operations to an OpenCL device."""
+    try:
+        return cv2.ocl.haveOpenCL()
+    except (AttributeError, cv2.error):
+        return False
+
+
+class _CudaChain:
+    """Undistort → CLAHE → Gaussian blur on the GPU, queued on one stream.
+
+    Device buffers are kept between frames; OpenCV reallocates them only
+    when the ROI shape changes.
+    """
+
+    def __init__(self, config: ProcessingConfig) -> None:
+        self._stream = cv2.cuda_Stream()
+        self._clahe = cv2.cuda.createCLAHE(
+            clipLimit=config.clahe_clip_limit,
+            tileGridSize=tuple(config.clahe_tile_grid_size),
+        )
+        k = config.blur_kernel_size
+        self._blur = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (k, k), 0)
+        self._src = cv2.cuda_GpuMat()
+        self._undistorted = cv2.cuda_GpuMat()
+        self._enhanced = cv2.cuda_GpuMat()
+        self._blurred = cv2.cuda_GpuMat()
+        self._xmap: Optional[cv2.cuda_GpuMat] = None
+        self._ymap: Optional[cv2.cuda_GpuMat] = None
+
+    def set_maps(self, maps: Optional[Tuple[np.ndarray, np.ndarray]]) -> None:
+        """Upload undistortion tables (cuda::remap needs float maps)."""
+        if maps is None:
+            self._xmap = self._ymap = None
+            return
+        xmap, ymap = cv2.convertMaps(maps[0], maps[1], cv2.CV_32FC1)
+        self._xmap = cv2.cuda_GpuMat(xmap)
+        self._ymap = cv2.cuda_GpuMat(ymap)
+
+    def run(self, gray: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        stream = self._stream
+        self._src.upload(np.ascontiguousarray(gray), stream)
+        src = self._src
+        if self._xmap is not None:
+            cv2.cuda.remap(
+                src, self._xmap, self._ymap, cv2.INTER_LINEAR,
+                dst=self._undistorted, borderMode=cv2.BORDER_REPLICATE,
+                stream=stream,
+            )
+            src = self._undistorted
+        self._clahe.apply(src, stream, dst=self._enhanced)
+        self._blur.apply(self._enhanced, dst=self._blurred, stream=stream)
+        out = self._blurred.download(stream, dst) if dst is not None else self._blurred.download(stream)
+        stream.waitForCompletion()
+        return out
+
+
 class PreProcessor:
     """Transforms a :class:`RawFrame` into a :class:`ProcessedFrame`."""
 
@@ -33,9 +124,26 @@ class PreProcessor:
         self,
         config: ProcessingConfig,
         calibration: Optional[CalibrationModel] = None,
+        reuse_output: bool | int = False,
     ) -> None:
         self._cfg = config
         self._calibration = calibration
+        # Number of output buffers to rotate through (0 = fresh array per frame)
+        self._pool_size = max(0, int(reuse_output))
+
+        # Per-frame scratch buffers, (re)allocated when the ROI shape changes
+        self._gray_buf: Optional[np.ndarray] = None
+        self._clahe_buf: Optional[np.ndarray] = None
+        self._out_pool: list[np.ndarray] = []
+        self._out_idx = 0
+        self._undistort_buf: Optional[np.ndarray] = None
+
+        # Undistortion remap tables for the current ROI window, rebuilt only
+        # when the (clamped) window changes
+        self._undistort = bool(calibration and calibration.use_undistort)
+        self._undistort_key: Optional[Tuple[int, int, int, int]] = None
+        self._undistort_maps: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._undistort_umaps: Optional[Tuple[cv2.UMat, cv2.UMat]] = None
 
         # Build CLAHE object once
         self._clahe = cv2.createCLAHE(
@@ -43,10 +151,33 @@ class PreProcessor:
             tileGridSize=tuple(config.clahe_tile_grid_size),  # type: ignore[arg-type]
         )
 
+        # Optional GPU chain for steps 3–5
+        self._cuda: Optional[_CudaChain] = None
+        if config.use_cuda:
+            if _cuda_available():
+                self._cuda = _CudaChain(config)
+                logger.info("PreProcessor: using CUDA for undistort/CLAHE/blur")
+            else:
+                logger.warning("PreProcessor: use_cuda set but no CUDA device found — using CPU")
+
+        # Optional OpenCL (T-API) path for steps 3–5 when CUDA isn't in use
+        self._opencl = False
+        if config.use_opencl and self._cuda is None:
+            if _opencl_available():
+                cv2.ocl.setUseOpenCL(True)
+                self._opencl = True
+                logger.info("PreProcessor: using OpenCL for undistort/CLAHE/blur")
+            else:
+                logger.warning("PreProcessor: use_opencl set but OpenCL unavailable — using CPU")
+
         # Parse ROI
         self._roi: Optional[Tuple[int, int, int, int]] = (
             tuple(config.roi) if config.roi and len(config.roi) == 4 else None  # type: ignore[assignment]
         )
+        # Frame shape the ROI clamp and grayscale step were last resolved for
+        self._frame_shape: Optional[Tuple[int, ...]] = None
+        self._roi_clamped: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._to_gray = _bgr_to_gray
 
     # ------------------------------------------------------------------
     # Public API
@@ -58,37 +189,115 @@ class PreProcessor:
         Returns:
             :class:`ProcessedFrame` with ROI cropped and enhanced grayscale image.
         """
-        image = raw.image.copy()
-        roi_x, roi_y = 0, 0
+        image, roi_x, roi_y = self._crop(raw.image)
+        self._ensure_buffers(image.shape[:2])
+        return self._process(raw, image, roi_x, roi_y, self._next_output())
 
-        # Step 1: ROI crop
-        if self._roi:
-            rx, ry, rw, rh = self._roi
-            # Clamp to image bounds
-            h, w = image.shape[:2]
-            rx = max(0, min(rx, w - 1))
-            ry = max(0, min(ry, h - 1))
-            rw = min(rw, w - rx)
-            rh = min(rh, h - ry)
-            image = image[ry : ry + rh, rx : rx + rw]
-            roi_x, roi_y = rx, ry
+    def run_batch(self, raws: Sequence[RawFrame]) -> list[ProcessedFrame]:
+        """Pre-process a batch of frames (e.g. offline replay) in one call.
+
+        Scratch buffers are shared across the batch as in :meth:`run`, and
+        the outputs are slices of one ``(N, H, W)`` block allocated per run
+        of same-shaped ROIs rather than one array per frame.  Every returned
+        ``roi_image`` stays valid regardless of ``reuse_output``.
+
+        Frames are not stacked into one tall image for the OpenCV calls:
+        CLAHE tiles and the blur kernel would then straddle frame boundaries.
+        """
+        out: list[ProcessedFrame] = []
+        crop = self._crop
+        process = self._process
+        block: Optional[np.ndarray] = None
+        base = 0
+        for i, raw in enumerate(raws):
+            image, roi_x, roi_y = crop(raw.image)
+            shape = image.shape[:2]
+            self._ensure_buffers(shape)
+            if block is None or block.shape[1:] != shape:
+                block = np.empty((len(raws) - i, *shape), dtype=np.uint8)
+                base = i
+            out.append(process(raw, image, roi_x, roi_y, block[i - base]))
+        return out
+
+    def _crop(self, image: np.ndarray) -> Tuple[np.ndarray, int, int]:
+        """Step 1: ROI crop.  Returns ``(view, roi_x, roi_y)``.
+
+        The ROI is a view into the raw image, not a copy; every later step
+        writes to its own buffer, so the raw image is only ever read.
+        """
+        if image.shape != self._frame_shape:
+            self._set_frame_shape(image.shape)
+        if not self._roi:
+            return image, 0, 0
+        rx, ry, rw, rh = self._roi_clamped
+        return image[ry : ry + rh, rx : rx + rw], rx, ry
+
+    def _process(
+        self,
+        raw: RawFrame,
+        image: np.ndarray,
+        roi_x: int,
+        roi_y: int,
+        dst: Optional[np.ndarray],
+    ) -> ProcessedFrame:
+        """Steps 2–5 on the cropped *image*, blurring into *dst* if given."""
+        shape = image.shape[:2]
 
         # Step 2: Grayscale
-        if image.ndim == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
+        gray = self._to_gray(image, self._gray_buf)
+
+        if self._undistort:
+            key = (roi_x, roi_y, shape[1], shape[0])
+            if key != self._undistort_key:
+                self._undistort_maps = self._calibration.undistort_maps(*key)  # type: ignore[union-attr]
+                self._undistort_key = key
+                if self._cuda is not None:
+                    self._cuda.set_maps(self._undistort_maps)
+                if self._opencl:
+                    maps = self._undistort_maps
+                    self._undistort_umaps = (
+                        (cv2.UMat(maps[0]), cv2.UMat(maps[1])) if maps is not None else None
+                    )
+
+        # Steps 3–5 on the GPU
+        if self._cuda is not None:
+            blurred = self._cuda.run(gray, dst)
+            return ProcessedFrame(
+                raw=raw,
+                roi_image=blurred,
+                roi_offset_x=roi_x,
+                roi_offset_y=roi_y,
+            )
+
+        # Steps 3–5 through the OpenCL T-API
+        if self._opencl:
+            return ProcessedFrame(
+                raw=raw,
+                roi_image=self._run_opencl(gray, dst),
+                roi_offset_x=roi_x,
+                roi_offset_y=roi_y,
+            )
 
         # Step 3: Lens undistortion (skipped if no calibration or disabled)
-        if self._calibration and self._calibration.use_undistort:
-            gray = self._calibration.undistort(gray)
+        if self._undistort:
+            if self._undistort_maps is not None:
+                map1, map2 = self._undistort_maps
+                # Replicate rather than zero-fill samples that fall outside
+                # the crop, so the ROI edges don't pick up black bands
+                gray = cv2.remap(
+                    gray, map1, map2, cv2.INTER_LINEAR,
+                    dst=self._undistort_buf, borderMode=cv2.BORDER_REPLICATE,
+                )
 
         # Step 4: CLAHE contrast enhancement
-        enhanced = self._clahe.apply(gray)
+        enhanced = self._clahe.apply(gray, self._clahe_buf)
 
         # Step 5: Gaussian blur
         k = self._cfg.blur_kernel_size
-        blurred = cv2.GaussianBlur(enhanced, (k, k), 0)
+        blurred = cv2.GaussianBlur(
+            enhanced, (k, k), 0,
+            dst=dst,
+        )
 
         return ProcessedFrame(
             raw=raw,
@@ -97,6 +306,63 @@ class PreProcessor:
             roi_offset_y=roi_y,
         )
 
+    def _run_opencl(self, gray: np.ndarray, dst: Optional[np.ndarray]) -> np.ndarray:
+        """Steps 3–5 on a UMat; only the blurred result is read back."""
+        u = cv2.UMat(gray)
+        if self._undistort_umaps is not None:
+            u = cv2.remap(
+                u, *self._undistort_umaps, cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_REPLICATE,
+            )
+        u = self._clahe.apply(u)
+        k = self._cfg.blur_kernel_size
+        out = cv2.GaussianBlur(u, (k, k), 0).get()
+        if dst is None:
+            return out
+        np.copyto(dst, out)
+        return dst
+
+    def _ensure_buffers(self, shape: Tuple[int, int]) -> None:
+        if self._gray_buf is None or self._gray_buf.shape != shape:
+            self._alloc_buffers(shape)
+
+    def _alloc_buffers(self, shape: tuple[int, int]) -> None:
+        self._gray_buf = np.empty(shape, dtype=np.uint8)
+        self._clahe_buf = np.empty(shape, dtype=np.uint8)
+        self._out_pool = [np.empty(shape, dtype=np.uint8) for _ in range(self._pool_size)]
+        self._out_idx = 0
+        self._undistort_buf = np.empty(shape, dtype=np.uint8) if self._undistort else None
+
+    def _next_output(self) -> Optional[np.ndarray]:
+        """Next buffer of the output ring, or None when outputs aren't reused."""
+        if not self._out_pool:
+            return None
+        buf = self._out_pool[self._out_idx]
+        self._out_idx = (self._out_idx + 1) % len(self._out_pool)
+        return buf
+
+    def _set_frame_shape(self, shape: Tuple[int, ...]) -> None:
+        """Resolve the per-stream decisions for frames of *shape*.
+
+        A stream's frame size and channel count are fixed, so the ROI clamp
+        and the grayscale step are chosen here, when the shape (or the ROI)
+        changes, instead of being re-derived for every frame.
+        """
+        self._frame_shape = shape
+        self._to_gray = _bgr_to_gray if len(shape) == 3 else _as_gray
+        if self._roi:
+            self._roi_clamped = self._clamp_roi(shape[0], shape[1])
+
+    def _clamp_roi(self, h: int, w: int) -> Tuple[int, int, int, int]:
+        rx, ry, rw, rh = self._roi  # type: ignore[misc]
+        rx = max(0, min(rx, w - 1))
+        ry = max(0, min(ry, h - 1))
+        rw = min(rw, w - rx)
+        rh = min(rh, h - ry)
+        return rx, ry, rw, rh
+
     def set_roi(self, roi: Optional[Tuple[int, int, int, int]]) -> None:
         """Update the ROI at runtime (e.g. from UI drag)."""
         self._roi = roi
+        self._frame_shape = None
+        self._undistort_key = None
@@ -18,6 +18,15 @@ Severity levels:
 from __future__ import annotations
 
 import logging
+import math
+from typing import Callable, Sequence
+
+import numpy as np
+
+try:  # optional speed-up: JIT-compiles the batch breach kernel below
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the install
+    njit = None
 
 from ohe.core.models import Anomaly, Measurement
 from ohe.rules.thresholds import Thresholds
@@ -25,14 +34,55 @@ from ohe.rules.thresholds import Thresholds
 logger = logging.getLogger(__name__)
 
 
+def _breach_flags(
+    stagger: np.ndarray,
+    diameter: np.ndarray,
+    stag_lim: float,
+    dia_lo: float,
+    dia_hi: float,
+    out: np.ndarray,
+) -> None:
+    """Fill *out* with the breach mask of :meth:`RulesEngine._breach_mask`.
+
+    One fused pass over both columns with no temporary arrays, for Numba to
+    compile.  NaN compares False, as in the NumPy path.  Called un-jitted
+    only by tests.
+    """
+    for i in range(stagger.shape[0]):
+        st = stagger[i]
+        dia = diameter[i]
+        out[i] = abs(st) >= stag_lim or dia <= dia_lo or dia >= dia_hi
+
+
+_breach_flags_jit = None
+if njit is not None:
+    try:
+        _breach_flags_jit = njit(cache=True)(_breach_flags)
+        # Compile (or load from the on-disk cache) at import, not on first use
+        _f = np.zeros(1, dtype=np.float64)
+        _breach_flags_jit(_f, _f, 1.0, 0.0, 2.0, np.zeros(1, dtype=np.bool_))
+        del _f
+    except Exception:  # pragma: no cover - e.g. no cache locator when frozen
+        logger.warning("Numba breach kernel unavailable; using NumPy path", exc_info=True)
+        _breach_flags_jit = None
+
+
 class RulesEngine:
     """Converts a :class:`Measurement` into zero or more :class:`Anomaly` objects."""
 
     def __init__(self, thresholds: Thresholds) -> None:
         self._t = thresholds
+        # Thresholds are fixed for the engine's lifetime, so the per-frame
+        # entry point is specialised once with them bound as local constants.
+        self.evaluate = self._specialise()
 
     def evaluate(self, m: Measurement) -> list[Anomaly]:
-        """Evaluate *m* and return all threshold violations."""
+        """Evaluate *m* and return all threshold violations.
+
+        Instances replace this with the specialised closure built by
+        :meth:`_specialise`; this method remains the reference path that
+        builds the :class:`Anomaly` objects.
+        """
         anomalies: list[Anomaly] = []
 
         if m.stagger_mm is not None:
@@ -51,6 +101,120 @@ class RulesEngine:
 
         return anomalies
 
+    def evaluate_batch(self, measurements: Sequence[Measurement]) -> list[list[Anomaly]]:
+        """Evaluate a window of measurements; returns one anomaly list per input.
+
+        The threshold comparisons run vectorised over the whole window.  Only
+        frames that breach at least one limit go through :meth:`evaluate` to
+        build their :class:`Anomaly` objects, so the output is identical to
+        calling :meth:`evaluate` on each measurement in turn.
+        """
+        n = len(measurements)
+        if n == 0:
+            return []
+
+        nan = math.nan
+        stagger = np.fromiter(
+            (nan if m.stagger_mm is None else m.stagger_mm for m in measurements),
+            dtype=np.float64, count=n,
+        )
+        diameter = np.fromiter(
+            (nan if m.diameter_mm is None else m.diameter_mm for m in measurements),
+            dtype=np.float64, count=n,
+        )
+
+        results: list[list[Anomaly]] = [[] for _ in range(n)]
+        for i in np.flatnonzero(self._breach_mask(stagger, diameter)):
+            results[i] = self.evaluate(measurements[i])
+        return results
+
+    def evaluate_arrays(
+        self,
+        stagger_mm: np.ndarray,
+        diameter_mm: np.ndarray,
+        frame_id: np.ndarray,
+        timestamp_ms: np.ndarray,
+    ) -> list[Anomaly]:
+        """Evaluate a recorded run held as parallel arrays (NaN = no value).
+
+        For offline analysis, e.g. columns read straight from a session
+        database.  Returns every anomaly in frame order; a
+        :class:`Measurement` is only built for the frames that breach a
+        limit, so the common in-tolerance frame costs no Python work.
+        """
+        stagger = np.asarray(stagger_mm, dtype=np.float64)
+        diameter = np.asarray(diameter_mm, dtype=np.float64)
+        hits = np.flatnonzero(self._breach_mask(stagger, diameter))
+        if hits.size == 0:
+            return []
+
+        evaluate = self.evaluate
+        nan_s = np.isnan(stagger[hits]).tolist()
+        nan_d = np.isnan(diameter[hits]).tolist()
+        out: list[Anomaly] = []
+        for fid, ts, st, dia, no_st, no_dia in zip(
+            np.asarray(frame_id)[hits].tolist(),
+            np.asarray(timestamp_ms, dtype=np.float64)[hits].tolist(),
+            stagger[hits].tolist(),
+            diameter[hits].tolist(),
+            nan_s,
+            nan_d,
+        ):
+            out.extend(evaluate(Measurement(
+                fid, ts, None if no_st else st, None if no_dia else dia, 0.0,
+            )))
+        return out
+
+    def _breach_mask(self, stagger: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+        """Boolean mask of frames that breach at least one limit.
+
+        NaN (missing value) compares False everywhere, matching the
+        ``is not None`` guards in :meth:`evaluate`.  Uses the fused Numba
+        kernel when available.
+        """
+        t = self._t
+        stag_lim = min(t.stag_warn, t.stag_crit)
+        dia_lo = max(t.dia_min_warn, t.dia_min_crit)
+        dia_hi = min(t.dia_max_warn, t.dia_max_crit)
+        if _breach_flags_jit is not None:
+            out = np.empty(stagger.shape[0], dtype=np.bool_)
+            _breach_flags_jit(stagger, diameter, stag_lim, dia_lo, dia_hi, out)
+            return out
+        return (
+            (np.abs(stagger) >= stag_lim)
+            | (diameter <= dia_lo)
+            | (diameter >= dia_hi)
+        )
+
+    def _specialise(self) -> Callable[[Measurement], list[Anomaly]]:
+        """Return an ``evaluate`` equivalent with the thresholds baked in.
+
+        Most frames breach nothing, so the closure answers those with a few
+        comparisons against default-argument constants (fast locals in
+        CPython) and only falls through to the full :meth:`evaluate` when a
+        limit might be crossed.
+        """
+        t = self._t
+        full = type(self).evaluate.__get__(self)
+
+        def evaluate(
+            m: Measurement,
+            _stagger=min(t.stag_warn, t.stag_crit),
+            _dia_lo=max(t.dia_min_warn, t.dia_min_crit),
+            _dia_hi=min(t.dia_max_warn, t.dia_max_crit),
+            _full=full,
+        ) -> list[Anomaly]:
+            st = m.stagger_mm
+            dia = m.diameter_mm
+            if (st is None or -_stagger < st < _stagger) and (
+                dia is None or _dia_lo < dia < _dia_hi
+            ):
+                return []
+            return _full(m)
+
+        evaluate.__doc__ = RulesEngine.evaluate.__doc__
+        return evaluate
+
     # ------------------------------------------------------------------
     # Private checks
     # ------------------------------------------------------------------
@@ -58,79 +222,79 @@ class RulesEngine:
     def _check_stagger(self, m: Measurement) -> list[Anomaly]:
         results: list[Anomaly] = []
         val = m.stagger_mm  # type: ignore[assignment]
-        t = self._t.stagger
+        t = self._t
         abs_val = abs(val)
         direction = "RIGHT" if val >= 0 else "LEFT"
 
-        if abs_val >= t.critical_mm:
+        if abs_val >= t.stag_crit:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type=f"STAGGER_{direction}",
                 value=val,
-                threshold=t.critical_mm if val >= 0 else -t.critical_mm,
+                threshold=t.stag_crit if val >= 0 else -t.stag_crit,
                 severity="CRITICAL",
-                message=f"Stagger {direction}: {val:.1f} mm exceeds CRITICAL limit ±{t.critical_mm} mm",
+                message=f"Stagger {direction}: {val:.1f} mm exceeds CRITICAL limit ±{t.stag_crit} mm",
             ))
-        elif abs_val >= t.warning_mm:
+        elif abs_val >= t.stag_warn:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type=f"STAGGER_{direction}",
                 value=val,
-                threshold=t.warning_mm if val >= 0 else -t.warning_mm,
+                threshold=t.stag_warn if val >= 0 else -t.stag_warn,
                 severity="WARNING",
-                message=f"Stagger {direction}: {val:.1f} mm exceeds WARNING limit ±{t.warning_mm} mm",
+                message=f"Stagger {direction}: {val:.1f} mm exceeds WARNING limit ±{t.stag_warn} mm",
             ))
         return results
 
     def _check_diameter(self, m: Measurement) -> list[Anomaly]:
         results: list[Anomaly] = []
         val = m.diameter_mm  # type: ignore[assignment]
-        t = self._t.diameter
+        t = self._t
 
         # Check minimum
-        if val <= t.min_critical_mm:
+        if val <= t.dia_min_crit:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type="DIAMETER_LOW",
                 value=val,
-                threshold=t.min_critical_mm,
+                threshold=t.dia_min_crit,
                 severity="CRITICAL",
-                message=f"Diameter {val:.2f} mm below CRITICAL minimum {t.min_critical_mm} mm",
+                message=f"Diameter {val:.2f} mm below CRITICAL minimum {t.dia_min_crit} mm",
             ))
-        elif val <= t.min_warning_mm:
+        elif val <= t.dia_min_warn:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type="DIAMETER_LOW",
                 value=val,
-                threshold=t.min_warning_mm,
+                threshold=t.dia_min_warn,
                 severity="WARNING",
-                message=f"Diameter {val:.2f} mm below WARNING minimum {t.min_warning_mm} mm",
+                message=f"Diameter {val:.2f} mm below WARNING minimum {t.dia_min_warn} mm",
             ))
 
         # Check maximum
-        if val >= t.max_critical_mm:
+        if val >= t.dia_max_crit:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type="DIAMETER_HIGH",
                 value=val,
-                threshold=t.max_critical_mm,
+                threshold=t.dia_max_crit,
                 severity="CRITICAL",
-                message=f"Diameter {val:.2f} mm above CRITICAL maximum {t.max_critical_mm} mm",
+                message=f"Diameter {val:.2f} mm above CRITICAL maximum {t.dia_max_crit} mm",
             ))
-        elif val >= t.max_warning_mm:
+        elif val >= t.dia_max_warn:
             results.append(Anomaly(
                 frame_id=m.frame_id,
                 timestamp_ms=m.timestamp_ms,
                 anomaly_type="DIAMETER_HIGH",
                 value=val,
-                threshold=t.max_warning_mm,
+                threshold=t.dia_max_warn,
                 severity="WARNING",
-                message=f"Diameter {val:.2f} mm above WARNING maximum {t.max_warning_mm} mm",
+                message=f"Diameter {val:.2f} mm above WARNING maximum {t.dia_max_warn} mm",
             ))
 
         return results
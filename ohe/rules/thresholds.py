@@ -1,7 +1,10 @@
 """
 rules/thresholds.py
 --------------------
-Strongly-typed threshold objects populated from AppConfig.
+Strongly-typed threshold object populated from AppConfig.
+
+The six limits are flat, slotted fields rather than nested per-metric
+objects, so the rules engine reads each one with a single attribute lookup.
 """
 
 from __future__ import annotations
@@ -11,36 +14,22 @@ from dataclasses import dataclass
 from ohe.core.config import RulesConfig
 
 
-@dataclass(frozen=True)
-class StaggerThresholds:
-    warning_mm: float
-    critical_mm: float
-
-
-@dataclass(frozen=True)
-class DiameterThresholds:
-    min_warning_mm: float
-    min_critical_mm: float
-    max_warning_mm: float
-    max_critical_mm: float
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Thresholds:
-    stagger: StaggerThresholds
-    diameter: DiameterThresholds
+    stag_warn: float
+    stag_crit: float
+    dia_min_warn: float
+    dia_min_crit: float
+    dia_max_warn: float
+    dia_max_crit: float
 
     @classmethod
     def from_config(cls, cfg: RulesConfig) -> "Thresholds":
         return cls(
-            stagger=StaggerThresholds(
-                warning_mm=cfg.stagger.warning_mm,
-                critical_mm=cfg.stagger.critical_mm,
-            ),
-            diameter=DiameterThresholds(
-                min_warning_mm=cfg.diameter.min_warning_mm,
-                min_critical_mm=cfg.diameter.min_critical_mm,
-                max_warning_mm=cfg.diameter.max_warning_mm,
-                max_critical_mm=cfg.diameter.max_critical_mm,
-            ),
+            stag_warn=cfg.stagger.warning_mm,
+            stag_crit=cfg.stagger.critical_mm,
+            dia_min_warn=cfg.diameter.min_warning_mm,
+            dia_min_crit=cfg.diameter.min_critical_mm,
+            dia_max_warn=cfg.diameter.max_warning_mm,
+            dia_max_crit=cfg.diameter.max_critical_mm,
         )
@@ -5,27 +5,40 @@ Scrollable anomaly event log — Phase 2 enhanced.
 
 Each row shows: frame · timestamp · type · value · severity badge.
 Rows are colour-coded with left-side coloured accent bar.
+
+The log is a ``QListView`` over :class:`AnomalyModel`; rows are painted by
+:class:`_AnomalyDelegate` rather than built from child widgets, so only the
+visible rows cost anything and the 500-row history is one widget, not 500.
+
+Anomalies arrive in bursts on a bad section of line, so :meth:`add_anomaly`
+only queues them; a single-shot timer inserts the queued rows as one batch
+every ``_FLUSH_MS`` and prunes the overflow once per batch.
 """
 
 from __future__ import annotations
 
 import datetime
+from collections import deque
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont, QPainter
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
-    QScrollArea,
-    QSizePolicy,
+    QListView,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 
 from ohe.core.models import Anomaly
-from ohe.ui.widgets import HDivider, Palette, SeverityBadge
+from ohe.ui.widgets import Palette
 
 _MAX_ROWS = 500
+_FLUSH_MS = 50
+_ROW_HEIGHT = 30
+_ROW_SPACING = 2
 
 
 class AnomalyPanel(QWidget):
@@ -63,113 +76,188 @@ class AnomalyPanel(QWidget):
         h_lay.addWidget(col_hdr)
         outer.addWidget(header)
 
-        # ── Scroll area ────────────────────────────────────────────────────
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet("border: none;")
-
-        self._content = QWidget()
-        self._content.setStyleSheet(f"background-color: {Palette.BG_PANEL};")
-        self._layout  = QVBoxLayout(self._content)
-        self._layout.setContentsMargins(4, 4, 4, 4)
-        self._layout.setSpacing(2)
-        self._layout.addStretch()
-        self._scroll.setWidget(self._content)
-        outer.addWidget(self._scroll)
+        # ── List view ──────────────────────────────────────────────────────
+        self._model = AnomalyModel(self)
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(_AnomalyDelegate(self._view))
+        self._view.setUniformItemSizes(True)
+        self._view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._view.setStyleSheet(
+            f"QListView {{ border: none; background-color: {Palette.BG_PANEL}; }}"
+        )
+        outer.addWidget(self._view)
 
-        self._row_count = 0
+        self._pending: list[Anomaly] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush)
 
     # ------------------------------------------------------------------
     def add_anomaly(self, a: Anomaly) -> None:
-        """Prepend a new anomaly row."""
-        row = _AnomalyRow(a)
-        self._layout.insertWidget(0, row)
-        self._row_count += 1
-        if self._row_count > _MAX_ROWS:
-            item = self._layout.takeAt(self._layout.count() - 2)
-            if item and item.widget():
-                item.widget().deleteLater()
-            self._row_count -= 1
+        """Queue a new anomaly row; it is prepended on the next flush."""
+        self._pending.append(a)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Prepend all queued rows to the model in one batch."""
+        pending, self._pending = self._pending, []
+        self._model.prepend(pending)
 
     def clear(self) -> None:
-        while self._layout.count() > 1:
-            item = self._layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
-        self._row_count = 0
+        self._flush_timer.stop()
+        self._pending = []
+        self._model.clear()
 
     @property
     def count(self) -> int:
-        return self._row_count
+        return min(self._model.rowCount() + len(self._pending), _MAX_ROWS)
+
+
+class AnomalyModel(QAbstractListModel):
+    """Newest-first list of anomalies, capped at ``_MAX_ROWS``.
+
+    Row data is the :class:`Anomaly` itself under ``UserRole``; the delegate
+    does all the formatting.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: deque[Anomaly] = deque(maxlen=_MAX_ROWS)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        a = self._rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return a
+        if role == Qt.ItemDataRole.DisplayRole:
+            return a.message
+        return None
 
+    def prepend(self, anomalies: list[Anomaly]) -> None:
+        """Insert *anomalies* (oldest first) at the top, newest at row 0.
 
-class _AnomalyRow(QWidget):
-    """Single colour-coded anomaly row with left-accent bar."""
+        Rows pushed past ``_MAX_ROWS`` are removed explicitly first so the
+        view is told about them rather than the deque dropping them silently.
+        """
+        anomalies = anomalies[-_MAX_ROWS:]
+        if not anomalies:
+            return
+        n = len(anomalies)
+        overflow = len(self._rows) + n - _MAX_ROWS
+        if overflow > 0:
+            first = len(self._rows) - overflow
+            self.beginRemoveRows(QModelIndex(), first, len(self._rows) - 1)
+            for _ in range(overflow):
+                self._rows.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, n - 1)
+        self._rows.extendleft(anomalies)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class _AnomalyDelegate(QStyledItemDelegate):
+    """Paints one colour-coded anomaly row with a left-accent bar."""
 
     _ACCENT = {
-        "WARNING":  (Palette.WARNING,  "#1e1500", "#3a2800"),
-        "CRITICAL": (Palette.CRITICAL, "#1e0500", "#3a0800"),
+        "WARNING":  (Palette.WARNING,  "#1e1500"),
+        "CRITICAL": (Palette.CRITICAL, "#1e0500"),
+    }
+    _BADGE = {
+        "WARNING":  (Palette.WARNING,  "#2a1e00"),
+        "CRITICAL": (Palette.CRITICAL, "#2a0000"),
+        "OK":       (Palette.OK,       "#00200e"),
     }
 
-    def __init__(self, a: Anomaly, parent=None) -> None:
+    def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        accent, bg, bg_hover = self._ACCENT.get(
-            a.severity, (Palette.TEXT_DIM, Palette.BG_CARD, "#1a2030")
-        )
+        # Fonts and colours are built once here, not per paint
+        self._mono = QFont("Consolas", 10)
+        self._bold = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        self._badge_font = QFont("Segoe UI", 8, QFont.Weight.Bold)
+        self._badge_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 1.0)
+        self._dim = QColor(Palette.TEXT_DIM)
+        self._accent = {
+            sev: (QColor(fg), QColor(bg)) for sev, (fg, bg) in self._ACCENT.items()
+        }
+        self._accent_default = (QColor(Palette.TEXT_DIM), QColor(Palette.BG_CARD))
+        self._badge = {
+            sev: (QColor(fg), QColor(bg)) for sev, (fg, bg) in self._BADGE.items()
+        }
+        self._badge_default = (QColor(Palette.TEXT_DIM), QColor(Palette.BG_PANEL))
 
-        self.setFixedHeight(30)
-        self.setStyleSheet(
-            f"background-color: {bg}; border-radius: 4px; border-left: 3px solid {accent};"
-        )
-
-        lay = QHBoxLayout(self)
-        lay.setContentsMargins(8, 0, 8, 0)
-        lay.setSpacing(10)
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), _ROW_HEIGHT + _ROW_SPACING)
 
-        mono = QFont("Consolas", 10)
+    def paint(self, painter: QPainter, option, index) -> None:
+        a: Anomaly = index.data(Qt.ItemDataRole.UserRole)
+        if a is None:
+            return
+        accent, bg = self._accent.get(a.severity, self._accent_default)
+        rect = option.rect.adjusted(4, _ROW_SPACING // 2, -4, -(_ROW_SPACING - _ROW_SPACING // 2))
+        top, h = rect.top(), rect.height()
+        centre = Qt.AlignmentFlag.AlignVCenter
 
-        # Frame
-        lbl_frame = QLabel(f"#{a.frame_id:05d}")
-        lbl_frame.setFixedWidth(58)
-        lbl_frame.setFont(mono)
-        lbl_frame.setStyleSheet(f"color: {Palette.TEXT_DIM};")
-        lay.addWidget(lbl_frame)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.fillRect(QRect(rect.left(), top, 3, h), accent)
 
-        # Timestamp
+        # Left-hand columns: frame, timestamp
+        x = rect.left() + 3 + 8
+        painter.setFont(self._mono)
+        painter.setPen(self._dim)
+        painter.drawText(QRect(x, top, 58, h), centre, f"#{a.frame_id:05d}")
+        x += 58 + 10
         if a.timestamp_ms:
-            ts = datetime.datetime.fromtimestamp(a.timestamp_ms / 1000.0)
-            ts_str = ts.strftime("%H:%M:%S")
+            ts_str = datetime.datetime.fromtimestamp(a.timestamp_ms / 1000.0).strftime("%H:%M:%S")
         else:
             ts_str = "—"
-        lbl_ts = QLabel(ts_str)
-        lbl_ts.setFixedWidth(56)
-        lbl_ts.setFont(mono)
-        lbl_ts.setStyleSheet(f"color: {Palette.TEXT_DIM};")
-        lay.addWidget(lbl_ts)
-
-        # Type
-        lbl_type = QLabel(a.anomaly_type.replace("_", " "))
-        lbl_type.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        lbl_type.setStyleSheet(f"color: {accent};")
-        lbl_type.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        lay.addWidget(lbl_type)
-
-        # Value
-        lbl_val = QLabel(f"{a.value:.1f}")
-        lbl_val.setFixedWidth(52)
-        lbl_val.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        lbl_val.setFont(mono)
-        lbl_val.setStyleSheet(f"color: {accent};")
-        lay.addWidget(lbl_val)
-
-        # Speed (if available)
+        painter.drawText(QRect(x, top, 56, h), centre, ts_str)
+        x += 56 + 10
+
+        # Right-hand columns, laid out from the right edge: badge, speed, value
+        right = rect.right() - 8
+        fg, badge_bg = self._badge.get(a.severity, self._badge_default)
+        badge = QRect(right - 72, top + 4, 72, h - 8)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(badge_bg)
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setFont(self._badge_font)
+        painter.setPen(fg)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, a.severity)
+        right = badge.left() - 10
+
+        painter.setFont(self._mono)
         if a.speed_kmh:
-            lbl_spd = QLabel(f"{a.speed_kmh:.0f} km/h")
-            lbl_spd.setFixedWidth(60)
-            lbl_spd.setFont(mono)
-            lbl_spd.setStyleSheet(f"color: {Palette.TEXT_DIM};")
-            lay.addWidget(lbl_spd)
-
-        # Severity badge
-        lay.addWidget(SeverityBadge(a.severity))
+            painter.setPen(self._dim)
+            painter.drawText(QRect(right - 60, top, 60, h), centre, f"{a.speed_kmh:.0f} km/h")
+            right -= 60 + 10
+        painter.setPen(accent)
+        painter.drawText(
+            QRect(right - 52, top, 52, h),
+            Qt.AlignmentFlag.AlignRight | centre,
+            f"{a.value:.1f}",
+        )
+        right -= 52 + 10
+
+        # Type takes whatever width is left
+        painter.setFont(self._bold)
+        painter.drawText(QRect(x, top, max(right - x, 0), h), centre,
+                         a.anomaly_type.replace("_", " "))
+        painter.restore()
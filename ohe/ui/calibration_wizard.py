@@ -4,9 +4,13 @@ ui/calibration_wizard.py
 Step-by-step calibration wizard.
 
 Step 1 — Grab a reference frame from the video.
-Step 2 — User clicks TWO points on a known real-world distance.
-Step 3 — User enters the real distance (mm) between those points.
-Step 4 — Wizard calculates px_per_mm and saves calibration.json.
+Step 2 — User clicks two or more points along a known real-world scale.
+Step 3 — User enters the real spacing (mm) between consecutive points.
+Step 4 — Wizard fits px_per_mm and saves calibration.json.
+
+With more than two points (e.g. successive marks on a ruler at a uniform
+spacing) px_per_mm is the least-squares fit over every consecutive pair,
+which averages out click error on noisy frames.
 
 Also captures the track centre X from a click on the contact wire
 position so the stagger sign is correct.
@@ -14,14 +18,13 @@ position so the stagger sign is correct.
 
 from __future__ import annotations
 
-import math
 from pathlib import Path
 from typing import Optional
 
 import cv2
 import numpy as np
 from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QImage, QMouseEvent, QPixmap, QPainter, QPen, QColor
+from PyQt6.QtGui import QImage, QMouseEvent, QPixmap, QPainter, QPen, QColor, QPolygon
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -42,6 +45,34 @@ from ohe.processing.calibration import CalibrationModel
 from ohe.ui.widgets import Palette
 
 
+_MAX_POINTS = 10
+
+
+def _fit_px_per_mm(points: list[QPoint], spacing_mm: float) -> tuple[float, float]:
+    """Fit px/mm to points clicked at a uniform real-world *spacing_mm*.
+
+    Each consecutive pair should be ``spacing_mm * px_per_mm`` pixels apart;
+    the least-squares scale is the total polyline length over the total real
+    length.  Returns ``(px_per_mm, total_pixel_distance)``.
+    """
+    pts = np.array([(p.x(), p.y()) for p in points], dtype=np.float64)
+    pixel_dist = float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum())
+    real_mm = max(spacing_mm, 0.001) * (len(pts) - 1)
+    return pixel_dist / real_mm, pixel_dist
+
+
+def _frame_to_pixmap(frame: np.ndarray) -> QPixmap:
+    """Convert a BGR frame to a QPixmap with one colour conversion.
+
+    ``QPixmap.fromImage`` copies the pixels, so the RGB array only has to
+    stay alive for the duration of this call.
+    """
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    h, w = rgb.shape[:2]
+    qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888)
+    return QPixmap.fromImage(qimg)
+
+
 class CalibrationWizard(QWizard):
     """Guided wizard to compute px/mm scale from a reference frame."""
 
@@ -74,12 +105,12 @@ class CalibrationWizard(QWizard):
     def set_points(self, pts: list[QPoint]) -> None:
         self._points = pts
 
-    def compute_and_show(self, real_mm: float) -> None:
+    def compute_and_show(self, spacing_mm: float) -> None:
+        """Fit px/mm from the picked points, *spacing_mm* apart in reality."""
         if len(self._points) < 2 or self._frame is None:
             return
-        p1, p2 = self._points[0], self._points[1]
-        pixel_dist = math.hypot(p2.x() - p1.x(), p2.y() - p1.y())
-        px_per_mm = pixel_dist / max(real_mm, 0.001)
+        px_per_mm, pixel_dist = _fit_px_per_mm(self._points, spacing_mm)
+        real_mm = spacing_mm * (len(self._points) - 1)
         centre_x = self._frame.shape[1] // 2
 
         self.result_calibration = CalibrationModel(
@@ -157,11 +188,9 @@ class _FrameGrabPage(QWizardPage):
             self._status.setText("Could not read frame from video.")
             return
         self._wiz.set_frame(frame)
-        rgb = frame[:, :, ::-1].astype(np.uint8)
-        h, w, c = rgb.shape
-        qimg = QImage(rgb.data, w, h, c * w, QImage.Format.Format_RGB888)
+        h, w = frame.shape[:2]
         self._preview.setPixmap(
-            QPixmap.fromImage(qimg).scaled(
+            _frame_to_pixmap(frame).scaled(
                 self._preview.size(),
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
@@ -179,10 +208,14 @@ class _PointPickPage(QWizardPage):
     def __init__(self, wizard: CalibrationWizard):
         super().__init__(wizard)
         self._wiz = wizard
-        self.setTitle("Step 2 — Click Two Reference Points")
+        self.setTitle("Step 2 — Click Reference Points")
 
         lay = QVBoxLayout(self)
-        info = QLabel("Click exactly TWO points on the image that are a known distance apart.")
+        info = QLabel(
+            f"Click 2–{_MAX_POINTS} points on the image, each a known, equal distance "
+            "from the previous one (e.g. successive ruler marks)."
+        )
+        info.setWordWrap(True)
         info.setStyleSheet(f"color: {Palette.TEXT_DIM};")
         lay.addWidget(info)
 
@@ -197,7 +230,8 @@ class _PointPickPage(QWizardPage):
         self._dist_spin.setValue(1000)
         self._dist_spin.setSuffix(" mm")
         self._dist_spin.setStyleSheet(f"background-color: {Palette.BG_CARD}; color: {Palette.TEXT};")
-        controls.addWidget(QLabel("Real-world distance:"))
+        self._dist_spin.valueChanged.connect(self._recompute)
+        controls.addWidget(QLabel("Spacing between points:"))
         controls.addWidget(self._dist_spin)
 
         reset_btn = QPushButton("Reset points")
@@ -210,25 +244,28 @@ class _PointPickPage(QWizardPage):
         lay.addWidget(self._status)
 
     def load_frame(self, frame: np.ndarray) -> None:
-        rgb = frame[:, :, ::-1].astype(np.uint8)
-        h, w, c = rgb.shape
-        qimg = QImage(rgb.data, w, h, c * w, QImage.Format.Format_RGB888)
-        self._canvas.set_image(QPixmap.fromImage(qimg))
+        self._canvas.set_image(_frame_to_pixmap(frame))
         self._pts: list[QPoint] = []
 
     def _on_point(self, pt: QPoint) -> None:
-        if len(self._pts) >= 2:
+        if len(self._pts) >= _MAX_POINTS:
             return
         self._pts.append(pt)
         self._canvas.add_marker(pt)
-        if len(self._pts) == 2:
-            self._status.setText("2 points selected. Click Next to compute.")
+        n = len(self._pts)
+        if n >= 2:
+            self._status.setText(
+                f"{n} points selected. Click Next to compute, or add more points."
+            )
             self._wiz.set_points(self._pts)
-            real_mm = self._dist_spin.value()
-            self._wiz.compute_and_show(real_mm)
+            self._recompute()
             self.completeChanged.emit()
         else:
-            self._status.setText(f"Point 1 set. Click point 2.")
+            self._status.setText("Point 1 set. Click point 2.")
+
+    def _recompute(self) -> None:
+        if len(getattr(self, "_pts", [])) >= 2:
+            self._wiz.compute_and_show(self._dist_spin.value())
 
     def _reset(self) -> None:
         self._pts = []
@@ -237,7 +274,7 @@ class _PointPickPage(QWizardPage):
         self.completeChanged.emit()
 
     def isComplete(self) -> bool:
-        return len(getattr(self, "_pts", [])) == 2
+        return len(getattr(self, "_pts", [])) >= 2
 
 
 class _ResultPage(QWizardPage):
@@ -280,12 +317,20 @@ from PyQt6.QtCore import pyqtSignal
 
 
 class _ClickableLabel(QLabel):
-    """QLabel that emits clicked image coordinates."""
+    """QLabel that emits clicked image coordinates.
+
+    The image is scaled to the label once per image/resize and cached;
+    markers are painted over it in label coordinates in :meth:`paintEvent`,
+    so adding or clearing a marker only repaints instead of resampling.
+    """
     point_clicked = pyqtSignal(QPoint)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pixmap_orig: Optional[QPixmap] = None
+        self._scaled: Optional[QPixmap] = None
+        self._offset = QPoint(0, 0)
+        self._scale = 1.0
         self._markers: list[QPoint] = []
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setStyleSheet("background: #000;")
@@ -294,41 +339,60 @@ class _ClickableLabel(QLabel):
     def set_image(self, pixmap: QPixmap) -> None:
         self._pixmap_orig = pixmap
         self._markers = []
-        self._redraw()
+        self._rescale()
+        self.update()
 
     def add_marker(self, pt: QPoint) -> None:
         self._markers.append(pt)
-        self._redraw()
+        self.update()
 
     def clear_markers(self) -> None:
         self._markers = []
-        self._redraw()
+        self.update()
+
+    def resizeEvent(self, ev) -> None:
+        super().resizeEvent(ev)
+        self._rescale()
 
     def mousePressEvent(self, ev: QMouseEvent) -> None:
-        if ev.button() == Qt.MouseButton.LeftButton and self._pixmap_orig:
+        if ev.button() == Qt.MouseButton.LeftButton and self._scaled is not None:
             # Map label coords → original image coords
-            label_sz = self.size()
-            pm = self._pixmap_orig
-            scaled = pm.scaled(label_sz, Qt.AspectRatioMode.KeepAspectRatio)
-            offset_x = (label_sz.width()  - scaled.width())  // 2
-            offset_y = (label_sz.height() - scaled.height()) // 2
-            img_x = int((ev.position().x() - offset_x) / scaled.width()  * pm.width())
-            img_y = int((ev.position().y() - offset_y) / scaled.height() * pm.height())
+            img_x = int((ev.position().x() - self._offset.x()) / self._scale)
+            img_y = int((ev.position().y() - self._offset.y()) / self._scale)
             self.point_clicked.emit(QPoint(img_x, img_y))
 
-    def _redraw(self) -> None:
-        if not self._pixmap_orig:
+    def paintEvent(self, ev) -> None:
+        super().paintEvent(ev)
+        if self._scaled is None:
             return
-        pm = self._pixmap_orig.copy()
-        painter = QPainter(pm)
+        painter = QPainter(self)
+        painter.drawPixmap(self._offset, self._scaled)
         pen = QPen(QColor(Palette.ACCENT))
         pen.setWidth(3)
         painter.setPen(pen)
-        for i, pt in enumerate(self._markers):
+        pts = [self._to_label(pt) for pt in self._markers]
+        for i, pt in enumerate(pts):
             painter.drawEllipse(pt, 8, 8)
             painter.drawText(pt.x() + 12, pt.y() - 6, f"P{i+1}")
-        if len(self._markers) == 2:
-            painter.drawLine(self._markers[0], self._markers[1])
+        if len(pts) >= 2:
+            painter.drawPolyline(QPolygon(pts))
         painter.end()
-        self.setPixmap(pm.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio,
-                                 Qt.TransformationMode.SmoothTransformation))
+
+    def _rescale(self) -> None:
+        if not self._pixmap_orig:
+            self._scaled = None
+            return
+        pm = self._pixmap_orig
+        self._scaled = pm.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        self._scale = self._scaled.width() / max(pm.width(), 1)
+        self._offset = QPoint(
+            (self.width() - self._scaled.width()) // 2,
+            (self.height() - self._scaled.height()) // 2,
+        )
+
+    def _to_label(self, pt: QPoint) -> QPoint:
+        return QPoint(
+            self._offset.x() + round(pt.x() * self._scale),
+            self._offset.y() + round(pt.y() * self._scale),
+        )
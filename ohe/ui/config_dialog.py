@@ -12,15 +12,23 @@ Sections
  • Rules / Thresholds (stagger warning/critical, diameter low/high)
 
 Changes are applied to the in-memory config and optionally saved back to
-config/default.yaml.
+config/default.yaml.  The file is written atomically (temp file + rename)
+on a thread-pool thread, so a slow disk or an on-access virus scan can't
+stall the UI, and a failed write never leaves a truncated config.
+
+Only the ROI tab is built when the dialog opens; the Detection and Rules
+tabs are built the first time they are selected.  Settings on a tab that
+was never opened keep their current config values.
 """
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 import yaml
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QThreadPool, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -40,18 +48,43 @@ from PyQt6.QtWidgets import (
 )
 
 from ohe.core.config import AppConfig
-from ohe.ui.widgets import Palette
+from ohe.ui.widgets import HDivider, Palette
+
+try:  # libyaml-backed loader/dumper are an order of magnitude faster when available
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_CONFIG_PATH = Path("config/default.yaml")
+
+_TAB_DETECTION = 1
+_TAB_RULES = 2
 
 
 class ConfigDialog(QDialog):
     """Settings dialog — edit detection and rules parameters."""
 
+    # (path, error) from the background YAML write; error is "" on success
+    _save_finished = pyqtSignal(str, str)
+
     def __init__(self, cfg: AppConfig, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("OHE Settings")
         self.setMinimumSize(480, 520)
-        self.setStyleSheet(f"background-color: {Palette.BG_DARK}; color: {Palette.TEXT};")
+        # One dialog-level sheet styles every spin box, rather than each box
+        # parsing its own copy of the same rules
+        self.setStyleSheet(
+            f"* {{ background-color: {Palette.BG_DARK}; color: {Palette.TEXT}; }}"
+            f"QSpinBox, QDoubleSpinBox {{ {Palette.SPIN_CSS} }}"
+        )
         self._cfg = cfg
+        # Parsed config/default.yaml, read once here so "Save to YAML" only
+        # has to update and re-dump it; None if it couldn't be read yet
+        self._yaml_cache: dict | None = None
+        try:
+            self._yaml_cache = _load_yaml(_CONFIG_PATH)
+        except (OSError, yaml.YAMLError):
+            pass
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(10, 10, 10, 10)
@@ -64,9 +97,25 @@ class ConfigDialog(QDialog):
                             padding: 6px 16px; border-radius: 4px 4px 0 0; }}
             QTabBar::tab:selected {{ background: {Palette.BG_CARD}; color: {Palette.TEXT}; }}
         """)
-        tabs.addTab(self._build_roi_tab(), "ROI")
-        tabs.addTab(self._build_detection_tab(), "Detection")
-        tabs.addTab(self._build_rules_tab(), "Rules / Thresholds")
+        # Build the visible tab before the dialog repaints or restyles
+        # anything; the others get empty hosts filled by _ensure_tab
+        self.setUpdatesEnabled(False)
+        try:
+            tabs.addTab(self._build_roi_tab(), "ROI")
+            self._tab_builders = {
+                _TAB_DETECTION: self._build_detection_tab,
+                _TAB_RULES: self._build_rules_tab,
+            }
+            self._tab_hosts: dict[int, QVBoxLayout] = {}
+            for index, title in ((_TAB_DETECTION, "Detection"), (_TAB_RULES, "Rules / Thresholds")):
+                host = QWidget()
+                host_lay = QVBoxLayout(host)
+                host_lay.setContentsMargins(0, 0, 0, 0)
+                self._tab_hosts[index] = host_lay
+                tabs.insertTab(index, host, title)
+        finally:
+            self.setUpdatesEnabled(True)
+        tabs.currentChanged.connect(self._ensure_tab)
         lay.addWidget(tabs)
 
         # Buttons
@@ -80,6 +129,7 @@ class ConfigDialog(QDialog):
         bbox.accepted.connect(self._on_ok)
         bbox.rejected.connect(self.reject)
         save_btn.clicked.connect(self._on_save)
+        self._save_finished.connect(self._on_save_finished)
         bbox.setStyleSheet(f"color: {Palette.TEXT};")
         lay.addWidget(bbox)
 
@@ -87,6 +137,17 @@ class ConfigDialog(QDialog):
     # Tab builders
     # ------------------------------------------------------------------
 
+    def _ensure_tab(self, index: int) -> None:
+        """Build tab *index* into its host widget on first selection."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            self._tab_hosts[index].addWidget(builder())
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _build_roi_tab(self) -> QWidget:
         w = QWidget()
         form = QFormLayout(w)
@@ -113,7 +174,7 @@ class ConfigDialog(QDialog):
             "and pantograph structure below y=230.\n"
             "Default: [0, 70, 640, 160]"
         )
-        note.setStyleSheet(f"color: {Palette.TEXT_DIM}; font-size: 11px;")
+        note.setStyleSheet(Palette.NOTE_CSS)
         form.addRow(note)
         return w
 
@@ -139,12 +200,12 @@ class ConfigDialog(QDialog):
         form.addRow("Hough min line length (px):", self._hough_min)
         form.addRow("Hough max gap (px):", self._hough_gap)
         form.addRow("Min detection confidence:", self._min_conf)
-        form.addRow("─" * 30, QLabel(""))
+        form.addRow(HDivider())
         form.addRow("CLAHE clip limit:", self._clahe_clip)
         form.addRow("Blur kernel size (odd):", self._blur_k)
 
         note = QLabel("Canny2 should be ~3× Canny1.\nLower Hough threshold = more lines (may add noise).")
-        note.setStyleSheet(f"color: {Palette.TEXT_DIM}; font-size: 11px;")
+        note.setStyleSheet(Palette.NOTE_CSS)
         form.addRow(note)
         return w
 
@@ -162,10 +223,10 @@ class ConfigDialog(QDialog):
         self._d_hi_w  = _dspin(0, 50, r.diameter_high_warning_mm, step=0.5)
         self._d_hi_c  = _dspin(0, 50, r.diameter_high_critical_mm, step=0.5)
 
-        form.addRow("── Stagger ──", QLabel(""))
+        form.addRow(QLabel("── Stagger ──"))
         form.addRow("Warning |stagger| ≥ (mm):", self._s_warn)
         form.addRow("Critical |stagger| ≥ (mm):", self._s_crit)
-        form.addRow("── Diameter ──", QLabel(""))
+        form.addRow(QLabel("── Diameter ──"))
         form.addRow("Low warning < (mm):", self._d_lo_w)
         form.addRow("Low critical < (mm):", self._d_lo_c)
         form.addRow("High warning > (mm):", self._d_hi_w)
@@ -185,22 +246,25 @@ class ConfigDialog(QDialog):
         else:
             p.roi = None
 
-        p.canny_threshold1      = self._canny1.value()
-        p.canny_threshold2      = self._canny2.value()
-        p.hough_threshold       = self._hough_thr.value()
-        p.hough_min_line_length = self._hough_min.value()
-        p.hough_max_line_gap    = self._hough_gap.value()
-        p.min_detection_confidence = self._min_conf.value()
-        p.clahe_clip_limit      = self._clahe_clip.value()
-        p.blur_kernel_size      = self._blur_k.value()
-
-        r = self._cfg.rules
-        r.stagger_warning_mm       = self._s_warn.value()
-        r.stagger_critical_mm      = self._s_crit.value()
-        r.diameter_low_warning_mm  = self._d_lo_w.value()
-        r.diameter_low_critical_mm = self._d_lo_c.value()
-        r.diameter_high_warning_mm = self._d_hi_w.value()
-        r.diameter_high_critical_mm= self._d_hi_c.value()
+        # Tabs never opened have no widgets; their config values stand
+        if _TAB_DETECTION not in self._tab_builders:
+            p.canny_threshold1      = self._canny1.value()
+            p.canny_threshold2      = self._canny2.value()
+            p.hough_threshold       = self._hough_thr.value()
+            p.hough_min_line_length = self._hough_min.value()
+            p.hough_max_line_gap    = self._hough_gap.value()
+            p.min_detection_confidence = self._min_conf.value()
+            p.clahe_clip_limit      = self._clahe_clip.value()
+            p.blur_kernel_size      = self._blur_k.value()
+
+        if _TAB_RULES not in self._tab_builders:
+            r = self._cfg.rules
+            r.stagger_warning_mm       = self._s_warn.value()
+            r.stagger_critical_mm      = self._s_crit.value()
+            r.diameter_low_warning_mm  = self._d_lo_w.value()
+            r.diameter_low_critical_mm = self._d_lo_c.value()
+            r.diameter_high_warning_mm = self._d_hi_w.value()
+            r.diameter_high_critical_mm= self._d_hi_c.value()
 
     def _on_ok(self) -> None:
         self._apply_to_config()
@@ -209,9 +273,10 @@ class ConfigDialog(QDialog):
     def _on_save(self) -> None:
         self._apply_to_config()
         try:
-            cfg_path = Path("config/default.yaml")
-            with open(cfg_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            cfg_path = _CONFIG_PATH
+            if self._yaml_cache is None:
+                self._yaml_cache = _load_yaml(cfg_path)
+            data = self._yaml_cache
 
             p = self._cfg.processing
             data["processing"].update({
@@ -234,11 +299,54 @@ class ConfigDialog(QDialog):
                 "diameter_high_warning_mm": r.diameter_high_warning_mm,
                 "diameter_high_critical_mm": r.diameter_high_critical_mm,
             })
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            QMessageBox.information(self, "Saved", f"Config saved to {cfg_path.resolve()}")
+            # Serialise here so the background task never sees the dict change
+            text = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         except Exception as e:
             QMessageBox.critical(self, "Save Failed", str(e))
+            return
+        QThreadPool.globalInstance().start(lambda: self._write_config(cfg_path, text))
+
+    def _write_config(self, path: Path, text: str) -> None:
+        """Thread-pool task: write *text* to *path*, report via a signal."""
+        try:
+            _write_text_atomic(path, text)
+            result = (str(path.resolve()), "")
+        except Exception as e:
+            result = (str(path), str(e) or type(e).__name__)
+        try:
+            self._save_finished.emit(*result)
+        except RuntimeError:  # dialog already destroyed
+            pass
+
+    def _on_save_finished(self, path: str, error: str) -> None:
+        if error:
+            QMessageBox.critical(self, "Save Failed", error)
+        else:
+            QMessageBox.information(self, "Saved", f"Config saved to {path}")
+
+
+def _load_yaml(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace *path* with *text* via a temp file in the same directory."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        try:  # mkstemp creates the file 0600; keep the original's mode
+            os.chmod(tmp, os.stat(path).st_mode & 0o777)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 # ---------------------------------------------------------------------------
@@ -249,7 +357,6 @@ def _spin(lo: int, hi: int, val: int) -> QSpinBox:
     sb = QSpinBox()
     sb.setRange(lo, hi)
     sb.setValue(val)
-    sb.setStyleSheet(f"background-color: {Palette.BG_CARD}; color: {Palette.TEXT}; padding: 2px 4px;")
     return sb
 
 
@@ -259,5 +366,4 @@ def _dspin(lo: float, hi: float, val: float, step: float = 0.1) -> QDoubleSpinBo
     sb.setValue(val)
     sb.setSingleStep(step)
     sb.setDecimals(2)
-    sb.setStyleSheet(f"background-color: {Palette.BG_CARD}; color: {Palette.TEXT}; padding: 2px 4px;")
     return sb
@@ -25,9 +25,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import numpy as np
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtGui import QAction, QIcon, QImage
 from PyQt6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -179,6 +178,7 @@ class MainWindow(QMainWindow):
 
         # Left: video
         self._video_panel = VideoPanel()
+        self._video_panel.frame_rendered.connect(self._on_frame_rendered)
         self._video_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         top_lay.addWidget(self._video_panel, stretch=3)
 
@@ -240,6 +240,8 @@ class MainWindow(QMainWindow):
 
     def _build_statusbar(self) -> None:
         sb = QStatusBar()
+        # One rule for every status label instead of a sheet per label
+        sb.setStyleSheet(f"QLabel {{ {Palette.STATUS_LABEL_CSS} }}")
         self.setStatusBar(sb)
 
         self._lbl_track  = QLabel("Track: —")
@@ -250,7 +252,6 @@ class MainWindow(QMainWindow):
 
         for lbl in (self._lbl_track, self._lbl_frame, self._lbl_fps,
                     self._lbl_anoms, self._lbl_events):
-            lbl.setStyleSheet(f"color: {Palette.TEXT_DIM}; padding: 0 10px;")
             sb.addWidget(lbl)
 
         self._progress = QProgressBar()
@@ -378,7 +379,7 @@ class MainWindow(QMainWindow):
             "Version 0.2.0 — Phase 6<br><br>"
             "Complete event analysis system: wire detection, geolocation,<br>"
             "event clips, detailed logs, and data sharing.<br><br>"
-            "Built with OpenCV, scipy, PyQt6, pyqtgraph."
+            "Built with OpenCV, NumPy, PyQt6, pyqtgraph."
         )
 
     def _on_export(self) -> None:
@@ -416,10 +417,14 @@ class MainWindow(QMainWindow):
     # Worker signal handlers (run on UI thread via queued connection)
     # ------------------------------------------------------------------
 
-    def _on_frame(self, frame: np.ndarray, frame_id: int, cand) -> None:
+    def _on_frame(self, frame: QImage, frame_id: int, cand) -> None:
         self._video_panel.update_frame(frame)
         self._lbl_frame.setText(f"Frame: {frame_id:,}")
 
+    def _on_frame_rendered(self) -> None:
+        if self._worker:
+            self._worker.frame_rendered()
+
     def _on_measurement(self, m: Measurement) -> None:
         stagger_col = Palette.TEXT
         if m.stagger_mm is not None:
@@ -15,23 +15,34 @@ Accepts a :class:`SessionSetup` from the session setup dialog and:
 
 Signals
 -------
-new_frame(np.ndarray, int, object)
+new_frame(QImage, int, object)   — display frame, converted on the worker thread;
+                                    throttled, see below
 new_measurement(object)
 new_anomaly(object)
 new_event_clip(str, object)     — (clip_path, Anomaly) when a clip is saved
 stats_update(dict)
 error(str)
 finished()
+
+Display frames are rate-limited: ``new_frame`` is emitted at most
+``_MAX_DISPLAY_HZ`` times a second and only once the UI has acknowledged
+the previous one through :meth:`PipelineWorker.frame_rendered`.  Skipped
+frames skip the debug overlay, composition and conversion entirely.
+Measurement, anomaly and stats signals are unaffected and fire for every
+frame.
 """
 
 from __future__ import annotations
 
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
+import cv2
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QImage
 
 from ohe.core.config import AppConfig
 from ohe.core.models import Anomaly, Measurement
@@ -49,11 +60,18 @@ from ohe.rules.thresholds import Thresholds
 from ohe.speed.provider import NullSpeedProvider, SimulatedSpeedProvider, SpeedProvider
 from ohe.ui.session_setup_dialog import SessionSetup
 
+# Upper bound on display-frame emissions per second
+_MAX_DISPLAY_HZ = 30.0
+# Emit anyway if the UI hasn't acknowledged a frame for this long
+_FRAME_ACK_TIMEOUT_S = 1.0
+# Number of recent stagger values averaged for stats_update
+_STAGGER_WINDOW = 30
+
 
 class PipelineWorker(QThread):
     """Background thread — runs the detection pipeline and emits Qt signals."""
 
-    new_frame       = pyqtSignal(np.ndarray, int, object)
+    new_frame       = pyqtSignal(QImage, int, object)
     new_measurement = pyqtSignal(object)
     new_anomaly     = pyqtSignal(object)
     new_event_clip  = pyqtSignal(str, object)
@@ -73,6 +91,8 @@ class PipelineWorker(QThread):
         self._cfg     = cfg
         self._cal     = cal
         self._stop_requested = False
+        # Set when a display frame is emitted, cleared by frame_rendered()
+        self._frame_pending = False
 
         self._session:    Optional[SessionLogger] = None
         self._log_worker: Optional[LogWorker]     = None
@@ -84,6 +104,10 @@ class PipelineWorker(QThread):
     def request_stop(self) -> None:
         self._stop_requested = True
 
+    def frame_rendered(self) -> None:
+        """Called from the UI thread once the last display frame is shown."""
+        self._frame_pending = False
+
     # ------------------------------------------------------------------
     # QThread.run
     # ------------------------------------------------------------------
@@ -91,6 +115,7 @@ class PipelineWorker(QThread):
     def run(self) -> None:  # noqa: C901
         from ohe.ingestion.video_file import VideoFileProvider
         from ohe.ingestion.camera import CameraProvider
+        from ohe.ingestion.prefetch import PrefetchingProvider
 
         setup = self._setup
         pending_rowids: dict[int, Anomaly] = {}
@@ -183,16 +208,30 @@ class PipelineWorker(QThread):
                     frame_skip=self._cfg.ingestion.frame_skip,
                 )
             else:
-                provider = VideoFileProvider(
-                    setup.video_path,
-                    frame_skip=self._cfg.ingestion.frame_skip,
+                # File decode runs ahead on its own thread, overlapping the
+                # pipeline instead of serialising with it
+                provider = PrefetchingProvider(
+                    VideoFileProvider(
+                        setup.video_path,
+                        frame_skip=self._cfg.ingestion.frame_skip,
+                    ),
+                    maxsize=4,
                 )
 
             # --- Stats ----------------------------------------------------
             frame_count = detected = anomaly_count = 0
-            stagger_vals: list[float] = []
+            # Last _STAGGER_WINDOW staggers and their running sum, for the average
+            stagger_vals: deque[float] = deque(maxlen=_STAGGER_WINDOW)
+            stagger_sum = 0.0
             t_start = time.monotonic()
 
+            # --- Display buffers (sized on the first frame) ---------------
+            display_interval = 1.0 / _MAX_DISPLAY_HZ
+            last_display = -display_interval
+            self._frame_pending = False
+            display_buf: Optional[np.ndarray] = None
+            strip_buf: Optional[np.ndarray] = None
+
             with provider:
                 for raw in provider.frames():
                     if self._stop_requested:
@@ -200,8 +239,16 @@ class PipelineWorker(QThread):
 
                     t_frame = time.monotonic()
 
+                    since_display = t_frame - last_display
+                    show = since_display >= display_interval and (
+                        not self._frame_pending or since_display >= _FRAME_ACK_TIMEOUT_S
+                    )
+
                     pf   = pipeline._preprocessor.run(raw)
-                    cand, dbg_frame = detector.detect_debug(pf)
+                    if show:
+                        cand, dbg_frame = detector.detect_debug(pf)
+                    else:
+                        cand = detector.detect(pf)
                     m    = measure.compute(cand, pf.roi_offset_x, pf.roi_offset_y)
                     anomalies = rules.evaluate(m)
 
@@ -215,13 +262,25 @@ class PipelineWorker(QThread):
                         a.speed_kmh    = speed
                         a.model_version = self._cfg.model_version
 
-                    annotated = _compose_display_frame(raw.image, dbg_frame, self._cfg)
-                    self.new_frame.emit(annotated, raw.frame_id,
-                                        cand if cand.confidence > 0 else None)
+                    if show:
+                        if display_buf is None or display_buf.shape != raw.image.shape:
+                            display_buf = np.empty_like(raw.image)
+                            nw, nh = _debug_strip_size(raw.image.shape, dbg_frame.shape)
+                            strip_buf = np.empty((nh, nw, 3), dtype=np.uint8)
+                        annotated = _compose_display_frame(
+                            raw.image, dbg_frame, self._cfg, out=display_buf, small=strip_buf,
+                        )
+                        self._frame_pending = True
+                        last_display = t_frame
+                        self.new_frame.emit(_to_qimage(annotated), raw.frame_id,
+                                            cand if cand.confidence > 0 else None)
 
                     if m.stagger_mm is not None:
                         detected += 1
+                        if len(stagger_vals) == _STAGGER_WINDOW:
+                            stagger_sum -= stagger_vals[0]
                         stagger_vals.append(m.stagger_mm)
+                        stagger_sum += m.stagger_mm
                         self.new_measurement.emit(m)
                         self._log_worker.push_measurement(m, anomalies)
 
@@ -260,8 +319,7 @@ class PipelineWorker(QThread):
                             "det_pct":      detected / frame_count * 100,
                             "anomalies":    anomaly_count,
                             "avg_stagger":  (
-                                sum(stagger_vals[-30:]) / len(stagger_vals[-30:])
-                                if stagger_vals else None
+                                stagger_sum / len(stagger_vals) if stagger_vals else None
                             ),
                             "elapsed_s":    elapsed,
                             "frame_ms":     (time.monotonic() - t_frame) * 1000,
@@ -289,24 +347,52 @@ class PipelineWorker(QThread):
             self.finished.emit()
 
 
+def _to_qimage(frame: np.ndarray) -> QImage:
+    """Wrap a BGR frame as a QImage that owns its pixels.
+
+    Qt reads the BGR bytes directly (``Format_BGR888``), so no colour
+    conversion pass is needed; ``copy()`` detaches the image from *frame*,
+    letting the worker reuse its display buffer while the UI thread still
+    holds the emitted image.
+    """
+    h, w = frame.shape[:2]
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888).copy()
+
+
+def _debug_strip_size(frame_shape: tuple, dbg_shape: tuple) -> tuple[int, int]:
+    """(width, height) of the ROI debug strip inset into a frame."""
+    fh, fw = frame_shape[:2]
+    roi_h, roi_w = dbg_shape[:2]
+    scale = min((fw // 3) / max(roi_w, 1), 100 / max(roi_h, 1))
+    return max(1, int(roi_w * scale)), max(1, int(roi_h * scale))
+
+
 def _compose_display_frame(
     frame: np.ndarray,
     roi_dbg: np.ndarray,
     cfg: AppConfig,
+    out: Optional[np.ndarray] = None,
+    small: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    """Overlay the ROI debug panel on the full BGR frame."""
-    import cv2
-    out = frame.copy()
+    """Overlay the ROI debug panel on the full BGR frame.
+
+    *frame* is never modified (it still feeds the event clip writer).  The
+    composite is written into *out* and the downscaled debug strip into
+    *small* when those preallocated buffers are given.
+    """
+    if out is None:
+        out = frame.copy()
+    else:
+        np.copyto(out, frame)
     roi = cfg.processing.roi
     if roi:
         rx, ry, rw, rh = roi
         cv2.rectangle(out, (rx, ry), (rx + rw, ry + rh), (0, 200, 255), 1)
     fh, fw = out.shape[:2]
-    roi_h, roi_w = roi_dbg.shape[:2]
-    scale = min((fw // 3) / max(roi_w, 1), 100 / max(roi_h, 1))
-    nw = max(1, int(roi_w * scale))
-    nh = max(1, int(roi_h * scale))
-    small = cv2.resize(roi_dbg, (nw, nh))
+    nw, nh = _debug_strip_size(out.shape, roi_dbg.shape)
+    if small is not None and small.shape[:2] != (nh, nw):
+        small = None
+    small = cv2.resize(roi_dbg, (nw, nh), dst=small, interpolation=cv2.INTER_AREA)
     y0, x0 = fh - nh - 4, fw - nw - 4
     out[y0:y0 + nh, x0:x0 + nw] = small
     return out
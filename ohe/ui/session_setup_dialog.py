@@ -81,7 +81,7 @@ class SessionSetupDialog(QDialog):
             "Then choose input, GPS, and speed sources."
         )
         sub.setWordWrap(True)
-        sub.setStyleSheet(f"color: {Palette.TEXT_DIM}; font-size: 11px;")
+        sub.setStyleSheet(Palette.NOTE_CSS)
         layout.addWidget(sub)
 
         # ---- 1. Track Name ------------------------------------------------
@@ -3,7 +3,8 @@ ui/video_panel.py
 ------------------
 Live video display panel — Phase 2 enhanced.
 
-Shows BGR numpy frames from the pipeline with:
+Shows the display frames the pipeline worker emits (already converted to
+``QImage`` on the worker thread) with:
   • proper aspect-ratio scaling
   • an overlay bar at the bottom showing frame# / FPS / stagger value
   • animated placeholder when idle
@@ -11,8 +12,7 @@ Shows BGR numpy frames from the pipeline with:
 
 from __future__ import annotations
 
-import numpy as np
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QFont, QImage, QPixmap
 from PyQt6.QtWidgets import (
     QHBoxLayout,
@@ -26,7 +26,13 @@ from ohe.ui.widgets import Palette
 
 
 class VideoPanel(QWidget):
-    """Displays live video frames emitted by the pipeline worker."""
+    """Displays live video frames emitted by the pipeline worker.
+
+    ``frame_rendered`` fires once each frame is on screen; the worker uses it
+    to hold back the next display frame until the UI has caught up.
+    """
+
+    frame_rendered = pyqtSignal()
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -91,18 +97,15 @@ class VideoPanel(QWidget):
     # Public API
     # ------------------------------------------------------------------
 
-    def update_frame(self, frame: np.ndarray) -> None:
-        """Convert BGR numpy array → QPixmap and display it."""
-        h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        rgb   = frame[:, :, ::-1].astype(np.uint8)
-        qimg  = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg).scaled(
+    def update_frame(self, image: QImage) -> None:
+        """Scale a worker-built QImage to the label and display it."""
+        pixmap = QPixmap.fromImage(image).scaled(
             self._label.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
         self._label.setPixmap(pixmap)
+        self.frame_rendered.emit()
 
     def update_stats(self, frame_id: int, fps: float, stagger: float | None) -> None:
         """Update the bottom strip labels."""
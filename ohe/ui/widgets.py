@@ -39,6 +39,11 @@ class Palette:
     BORDER   = "#1e2d4a"        # subtle border
     TRACK    = "#7b2fff"        # purple for track name
 
+    # Stylesheet fragments shared by many widgets, built once at import
+    SPIN_CSS         = f"background-color: {BG_CARD}; color: {TEXT}; padding: 2px 4px;"
+    NOTE_CSS         = f"color: {TEXT_DIM}; font-size: 11px;"
+    STATUS_LABEL_CSS = f"color: {TEXT_DIM}; padding: 0 10px;"
+
 
 GLOBAL_STYLESHEET = f"""
 /* ── Base ─────────────────────────────────────────────── */
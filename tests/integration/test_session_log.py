@@ -142,3 +142,159 @@ class TestSessionLogIntegration:
         assert "detection" in summary
         assert "stagger_mm" in summary
         assert summary["stagger_mm"]["avg"] == pytest.approx(100.0, rel=1e-3)
+
+    def test_back_to_back_sessions_get_distinct_ids(self, tmp_path, monkeypatch):
+        """A coarse clock must not make two sessions share a database file."""
+        ns = time.time_ns()
+        monkeypatch.setattr(time, "time_ns", lambda: ns)
+        first = SessionLogger(tmp_path, source="test")
+        second = SessionLogger(tmp_path, source="test")
+        a = first.start()
+        b = second.start()
+        first.stop()
+        second.stop()
+        assert a.session_id != b.session_id
+        assert len(list(tmp_path.glob("*.sqlite"))) == 2
+
+    def test_connection_pragmas(self, tmp_path):
+        """The live session connection runs in WAL mode with relaxed syncing."""
+        session = SessionLogger(tmp_path, source="test_pragmas")
+        session.start()
+        try:
+            conn = session._conn
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        finally:
+            session.stop()
+
+    def test_single_measurements_buffered_until_flush(self, tmp_path):
+        """log_measurement() rows are held in memory and committed together."""
+        session = SessionLogger(tmp_path, source="test_buffer")
+        session.start()
+        for i in range(10):
+            session.log_measurement(Measurement(i, i * 33.3, 1.0, 12.0, 0.9))
+
+        reader = sqlite3.connect(str(session.db_path))
+        try:
+            before = reader.execute("SELECT COUNT(*) FROM measurements").fetchone()[0]
+            session.flush()
+            after = reader.execute("SELECT COUNT(*) FROM measurements").fetchone()[0]
+        finally:
+            reader.close()
+            info = session.stop()
+
+        assert before == 0
+        assert after == 10
+        assert info.total_frames == 10
+
+    def test_batch_commits_explicitly_in_autocommit_mode(self, tmp_path):
+        """Batches are committed by explicit BEGIN/COMMIT; nothing is left open."""
+        session = SessionLogger(tmp_path, source="test_autocommit")
+        session.start()
+        try:
+            assert session._conn.isolation_level is None
+            session.log_batch([(Measurement(i, 0.0, 1.0, 12.0, 0.9), []) for i in range(5)])
+            assert not session._conn.in_transaction
+
+            reader = sqlite3.connect(str(session.db_path))
+            try:
+                assert reader.execute("SELECT COUNT(*) FROM measurements").fetchone()[0] == 5
+            finally:
+                reader.close()
+        finally:
+            session.stop()
+
+    def test_exclusive_session_locks_out_readers_until_stop(self, tmp_path):
+        session = SessionLogger(tmp_path, source="test_exclusive", exclusive=True)
+        session.start()
+        session.log_batch([(Measurement(i, 0.0, 1.0, 12.0, 0.9), []) for i in range(5)])
+
+        reader = sqlite3.connect(str(session.db_path), timeout=0.1)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("SELECT COUNT(*) FROM measurements").fetchone()
+        finally:
+            reader.close()
+        session.stop()
+
+        reader = sqlite3.connect(str(session.db_path))
+        try:
+            assert reader.execute("SELECT COUNT(*) FROM measurements").fetchone()[0] == 5
+        finally:
+            reader.close()
+
+    def test_export_join_uses_indexes(self, tmp_path):
+        """The export's measurement/anomaly join is served by indexes."""
+        from ohe.logging_.export import _EXPORT_CSV_SQL
+
+        session = SessionLogger(tmp_path, source="test_index")
+        session.start()
+        session.log_batch([(Measurement(i, 0.0, 1.0, 12.0, 0.9), []) for i in range(20)])
+        session.stop()
+
+        conn = sqlite3.connect(str(session.db_path))
+        try:
+            plan = " ".join(r[3] for r in conn.execute("EXPLAIN QUERY PLAN " + _EXPORT_CSV_SQL))
+        finally:
+            conn.close()
+        assert "idx_anom_session_frame" in plan
+
+    def test_csv_writer_flushes_buffered_rows(self, tmp_path):
+        """Rows beyond the in-memory chunk size all reach disk on close()."""
+        csv = CsvWriter(tmp_path, "buffered", max_rows=10_000)
+        for i in range(2000):
+            csv.write(Measurement(i, i * 33.3, stagger_mm=1.0, diameter_mm=12.0, confidence=0.9))
+        csv.close()
+
+        lines = (tmp_path / "buffered.csv").read_text(encoding="utf-8").strip().split("\n")
+        assert len(lines) == 2001  # header + 2000 rows, more than one flush chunk
+
+    def test_csv_rows_parse_as_csv(self, tmp_path):
+        """Preformatted rows read back through csv.DictReader with the right values."""
+        import csv as csv_mod
+        from ohe.core.models import Anomaly
+
+        writer = CsvWriter(tmp_path, "parsed")
+        a = Anomaly(1, 33.3, "STAGGER_RIGHT", 160.0, 150.0, "WARNING", "test")
+        writer.write(Measurement(0, 0.0, stagger_mm=None, diameter_mm=None, confidence=0.0))
+        writer.write(Measurement(1, 33.3, stagger_mm=160.0, diameter_mm=12.5, confidence=0.9), [a, a])
+        writer.close()
+
+        with open(tmp_path / "parsed.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv_mod.DictReader(f))
+        assert rows[0]["stagger_mm"] == "" and rows[0]["anomaly_types"] == ""
+        assert rows[1] == {
+            "session_id": "parsed",
+            "frame_id": "1",
+            "timestamp_ms": "33.300",
+            "stagger_mm": "160.0000",
+            "diameter_mm": "12.5000",
+            "confidence": "0.9000",
+            "anomaly_types": "STAGGER_RIGHT;STAGGER_RIGHT",
+            "anomaly_severities": "WARNING;WARNING",
+        }
+
+    def test_csv_write_many_rolls_over(self, tmp_path):
+        """A batch spanning max_rows is split across file parts."""
+        writer = CsvWriter(tmp_path, "rolled", max_rows=4)
+        writer.write_many([(Measurement(i, 0.0, 1.0, 12.0, 0.9), []) for i in range(10)])
+        writer.close()
+
+        parts = sorted(tmp_path.glob("rolled*.csv"))
+        counts = [len(p.read_text(encoding="utf-8").splitlines()) - 1 for p in parts]
+        assert counts == [4, 4, 2]
+
+    def test_csv_rolls_over_on_byte_budget(self, tmp_path, monkeypatch):
+        """Parts are also capped by size, checked whenever the buffer is written."""
+        from ohe.logging_ import csv_writer as csv_mod
+
+        monkeypatch.setattr(csv_mod, "_FLUSH_BYTES", 1)   # write out every row
+        writer = CsvWriter(tmp_path, "sized", max_rows=1_000_000, max_bytes=300)
+        for i in range(10):
+            writer.write(Measurement(i, 0.0, 1.0, 12.0, 0.9))
+        writer.close()
+
+        parts = sorted(tmp_path.glob("sized*.csv"))
+        assert len(parts) > 1
+        rows = sum(len(p.read_text(encoding="utf-8").splitlines()) - 1 for p in parts)
+        assert rows == 10
@@ -69,6 +69,29 @@ class TestDataBus:
         bus.subscribe("alpha", lambda x: x)
         assert "alpha" in bus.topics()
 
+    def test_unsubscribe_during_publish(self):
+        """A handler removing itself mid-publish must not skip the others."""
+        bus = DataBus()
+        results = []
+
+        def once(payload):
+            bus.unsubscribe("t", once)
+
+        bus.subscribe("t", once)
+        bus.subscribe("t", results.append)
+        bus.publish("t", 1)
+        bus.publish("t", 2)
+        assert results == [1, 2]
+        assert bus._handlers["t"] == (results.append,)
+
+    def test_has_subscribers(self):
+        bus = DataBus()
+        assert not bus.has_subscribers("t")
+        bus.subscribe("t", print)
+        assert bus.has_subscribers("t")
+        bus.unsubscribe("t", print)
+        assert not bus.has_subscribers("t")
+
 
 class TestQueuedSubscriber:
     def test_put_and_drain(self):
@@ -90,3 +113,11 @@ class TestQueuedSubscriber:
         qs(2)
         qs(3)  # should be dropped silently
         assert qs.drain() == [1, 2]
+
+    def test_get_nonblocking_raises_when_empty(self):
+        import queue
+        qs = QueuedSubscriber()
+        with pytest.raises(queue.Empty):
+            qs.get()
+        qs(7)
+        assert qs.get() == 7
@@ -2,6 +2,7 @@
 
 import json
 import pytest
+import cv2
 import numpy as np
 
 from ohe.processing.calibration import CalibrationModel
@@ -52,3 +53,78 @@ class TestCalibrationModel:
         cal.save_to_json(p)
         cal2 = CalibrationModel.from_json(p)
         assert cal2.px_per_mm == pytest.approx(12.0)
+
+    def test_undistort_writes_into_dst(self):
+        k = np.array([[100.0, 0, 32], [0, 100.0, 24], [0, 0, 1]])
+        d = np.array([-0.2, 0.05, 0.0, 0.0, 0.0])
+        cal = CalibrationModel(
+            px_per_mm=10.0, track_centre_x_px=32, image_width_px=64, image_height_px=48,
+            use_undistort=True, camera_matrix=k, dist_coeffs=d,
+        )
+        img = np.random.default_rng(0).integers(0, 255, (48, 64), dtype=np.uint8)
+        dst = np.empty_like(img)
+        out = cal.undistort(img, dst)
+        assert out is dst
+        np.testing.assert_array_equal(out, cal.undistort(img))
+
+    def test_array_conversions_match_scalar(self):
+        cal = CalibrationModel(px_per_mm=8.0, track_centre_x_px=500, image_width_px=1000, image_height_px=500)
+        px = np.array([0.0, 4.0, 480.0, 520.5])
+        np.testing.assert_allclose(cal.px_to_mm_array(px), [cal.px_to_mm(p) for p in px])
+        out = np.empty(4)
+        res = cal.stagger_from_centre_px_array(px, out=out)
+        assert res is out
+        np.testing.assert_allclose(res, [cal.stagger_from_centre_px(p) for p in px])
+
+    def test_reassigning_px_per_mm_updates_conversions(self):
+        cal = CalibrationModel(px_per_mm=10.0, track_centre_x_px=500, image_width_px=1000, image_height_px=500)
+        cal.px_per_mm = 20.0
+        assert cal.px_to_mm(100) == pytest.approx(5.0)
+        with pytest.raises(CalibrationError):
+            cal.px_per_mm = 0.0
+
+    def test_from_json_builds_camera_matrix(self, tmp_path):
+        data = {
+            "px_per_mm": 8.0, "image_width_px": 64, "image_height_px": 48,
+            "distortion": {
+                "use_undistort": True, "fx": 100.0, "fy": 110.0, "cx": 32.0, "cy": 24.0,
+                "k1": -0.2, "k2": 0.05, "p1": 0.0, "p2": 0.0, "k3": 0.0,
+            },
+        }
+        p = tmp_path / "cal.json"
+        p.write_text(json.dumps(data), encoding="utf-8")
+        cal = CalibrationModel.from_json(p)
+        np.testing.assert_array_equal(
+            cal._camera_matrix, [[100.0, 0, 32.0], [0, 110.0, 24.0], [0, 0, 1.0]]
+        )
+        assert cal._map1 is not None
+
+    def test_from_json_stdlib_fallback(self, tmp_path, monkeypatch):
+        import ohe.processing.calibration as cal_mod
+
+        monkeypatch.setattr(cal_mod, "orjson", None)
+        p = tmp_path / "cal.json"
+        p.write_text(json.dumps({"px_per_mm": 7.5, "track_centre_x_px": 320}), encoding="utf-8")
+        cal = CalibrationModel.from_json(p)
+        assert cal.px_per_mm == pytest.approx(7.5)
+        assert cal.track_centre_x_px == 320
+
+    def test_has_no_instance_dict(self):
+        cal = CalibrationModel(px_per_mm=10.0, track_centre_x_px=500, image_width_px=1000, image_height_px=500)
+        with pytest.raises(AttributeError):
+            cal.unknown_attribute = 1
+
+    def test_window_maps_match_cropped_full_frame_undistort(self):
+        k = np.array([[300.0, 0, 160], [0, 300.0, 120], [0, 0, 1]])
+        d = np.array([-0.3, 0.1, 0.0, 0.0, 0.0])
+        cal = CalibrationModel(
+            px_per_mm=10.0, track_centre_x_px=160, image_width_px=320, image_height_px=240,
+            use_undistort=True, camera_matrix=k, dist_coeffs=d,
+        )
+        img = cv2.GaussianBlur(
+            np.random.default_rng(0).integers(0, 255, (240, 320), dtype=np.uint8), (9, 9), 0
+        )
+        x, y, w, h = 60, 40, 150, 100
+        map1, map2 = cal.undistort_maps(x, y, w, h)
+        roi = cv2.remap(np.ascontiguousarray(img[y:y + h, x:x + w]), map1, map2, cv2.INTER_LINEAR)
+        np.testing.assert_array_equal(roi[10:-10, 10:-10], cal.undistort(img)[y + 10:y + h - 10, x + 10:x + w - 10])
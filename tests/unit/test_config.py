@@ -40,3 +40,21 @@ rules:
     cfg = load_config(p)
     assert cfg.rules.stagger.warning_mm == 100.0
     assert cfg.rules.stagger.critical_mm == 180.0
+
+
+def test_reload_picks_up_file_changes(tmp_path):
+    import os
+    p = tmp_path / "reload.yaml"
+    p.write_text("rules:\n  stagger:\n    warning_mm: 100.0\n", encoding="utf-8")
+    assert load_config(p).rules.stagger.warning_mm == 100.0
+
+    p.write_text("rules:\n  stagger:\n    warning_mm: 120.0\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(p).rules.stagger.warning_mm == 120.0
+
+
+def test_loaded_configs_are_independent():
+    a = load_config()
+    a.processing.roi = None
+    assert load_config().processing.roi is not None
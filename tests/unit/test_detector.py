@@ -64,3 +64,164 @@ class TestWireDetector:
         pf = make_processed_frame_with_wire(frame_id=99)
         cand = self.detector.detect(pf)
         assert cand.frame_id == 99
+
+    def test_filter_horizontal_keeps_shallow_lines_in_either_direction(self):
+        lines = np.array([
+            [0, 10, 100, 20],     # ~6° left-to-right
+            [100, 20, 0, 10],     # same segment, right-to-left
+            [0, 0, 10, 100],      # near-vertical
+            [0, 0, 100, 100],     # 45°
+        ], dtype=np.int32)
+        kept = self.detector._filter_horizontal(lines)
+        assert kept.tolist() == [[0, 10, 100, 20], [100, 20, 0, 10]]
+
+    def test_detect_debug_matches_detect(self):
+        pf = make_processed_frame_with_wire(wire_y=50)
+        cand, dbg = self.detector.detect_debug(pf)
+        assert cand == self.detector.detect(pf)
+        assert dbg.shape == (*pf.roi_image.shape, 3)
+
+    def test_gaussian_diameter_matches_profile_width(self):
+        ys = np.arange(101, dtype=np.float64)
+        sigma = 3.0
+        profile = 20 + 180 * np.exp(-0.5 * ((ys - 50) / sigma) ** 2)
+        img = np.repeat(profile.astype(np.uint8)[:, None], 10, axis=1)
+        diam = WireDetector._gaussian_diameter(img, 5, 50)
+        assert diam == pytest.approx(2.355 * sigma, rel=0.1)
+
+    @pytest.mark.parametrize("sigma", [2.0, 3.0, 4.0])
+    def test_gaussian_diameter_noisy_offset_background(self, sigma, monkeypatch):
+        import ohe.processing.detector as det_mod
+
+        # Faint wire (20 levels) on a bright, noisy background
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        rng = np.random.default_rng(7)
+        ys = np.arange(101, dtype=np.float64)
+        diams = []
+        for _ in range(50):
+            profile = 100 + 20 * np.exp(-0.5 * ((ys - 50) / sigma) ** 2)
+            profile += rng.normal(0.0, 3.0, ys.shape)
+            col = np.clip(np.round(profile), 0, 255).astype(np.uint8)
+            img = np.repeat(col[:, None], 10, axis=1)
+            diams.append(WireDetector._gaussian_diameter(img, 5, 50))
+        assert np.mean(diams) == pytest.approx(2.355 * sigma, rel=0.15)
+
+    def test_gaussian_diameter_full_range_uint8_column(self, monkeypatch):
+        import ohe.processing.detector as det_mod
+
+        # Saturated wire on a black background, read through a strided view:
+        # the smoothed ×16 sums reach 4080 and must not wrap in uint8
+        ys = np.arange(101, dtype=np.float64)
+        sigma = 3.0
+        profile = 255 * np.exp(-0.5 * ((ys - 50) / sigma) ** 2)
+        img = np.repeat(np.round(profile).astype(np.uint8)[:, None], 10, axis=1)
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        diam = WireDetector._gaussian_diameter(img, 5, 50)
+        assert diam == pytest.approx(2.355 * sigma, rel=0.05)
+        assert det_mod._profile_fwhm(img[25:76, 5], 25) == pytest.approx(diam, rel=1e-9)
+
+    def test_gaussian_diameter_featureless_column(self):
+        img = np.full((100, 10), 80, dtype=np.uint8)
+        assert WireDetector._gaussian_diameter(img, 5, 50) == 4.0
+
+    def test_gaussian_diameter_pure_noise_column(self, monkeypatch):
+        import ohe.processing.detector as det_mod
+
+        # Noise alone throws up a max well over 5 levels, but no real lobe
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            col = np.clip(np.round(100 + rng.normal(0.0, 3.0, 101)), 0, 255)
+            img = np.repeat(col.astype(np.uint8)[:, None], 10, axis=1)
+            assert WireDetector._gaussian_diameter(img, 5, 50) == 4.0
+            assert det_mod._profile_fwhm(img[25:76, 5], 25) == 4.0
+
+    def test_edges_buffer_reused_across_frames(self):
+        self.detector.detect(make_processed_frame_with_wire(wire_y=40))
+        buf = self.detector._edges_buf
+        self.detector.detect(make_processed_frame_with_wire(wire_y=60))
+        assert self.detector._edges_buf is buf
+        self.detector.detect(make_processed_frame_with_wire(h=120, wire_y=60))
+        assert self.detector._edges_buf.shape == (120, 400)
+
+    def test_cluster_lines_keeps_longest_per_cluster(self):
+        lines = np.array([
+            [0, 50, 100, 50],     # mid 50, len 100
+            [0, 54, 300, 54],     # mid 54, len 300 — same cluster, longer
+            [0, 57, 50, 57],      # mid 57, within 8 px of the cluster start
+            [0, 62, 80, 62],      # mid 62, >8 px from 50: new cluster
+            [0, 10, 40, 10],      # mid 10, its own cluster
+        ], dtype=np.int32)
+        reps, length_sq = WireDetector._cluster_lines(lines)
+        assert reps.tolist() == [[0, 10, 40, 10], [0, 54, 300, 54], [0, 62, 80, 62]]
+        assert length_sq.tolist() == [40 ** 2, 300 ** 2, 80 ** 2]
+        assert WireDetector._elect_lowest_wire(reps, length_sq) == ((0, 62, 80, 62), 80 ** 2)
+
+    def test_detect_debug_reuses_overlay_buffer(self):
+        assert self.detector._dbg_buf is None
+        self.detector.detect(make_processed_frame_with_wire(wire_y=40))
+        assert self.detector._dbg_buf is None
+        _, dbg1 = self.detector.detect_debug(make_processed_frame_with_wire(wire_y=40))
+        _, dbg2 = self.detector.detect_debug(make_processed_frame_with_wire(wire_y=60))
+        assert dbg2 is dbg1
+
+    def test_detect_draws_only_when_given_debug_image(self):
+        pf = make_processed_frame_with_wire(wire_y=50)
+        canvas = np.zeros((*pf.roi_image.shape, 3), dtype=np.uint8)
+        cand = self.detector.detect(pf, debug=canvas)
+        assert cand == self.detector.detect(pf)
+        # Elected wire is drawn in pure green
+        assert ((canvas[..., 1] == 255) & (canvas[..., 0] == 0)).any()
+
+    @pytest.mark.parametrize("sigma", [1.5, 3.0, 6.0])
+    def test_profile_kernel_matches_numpy_path(self, sigma, monkeypatch):
+        import ohe.processing.detector as det_mod
+
+        ys = np.arange(101, dtype=np.float64)
+        profile = 30 + 150 * np.exp(-0.5 * ((ys - 47) / sigma) ** 2)
+        img = np.repeat(profile.astype(np.uint8)[:, None], 10, axis=1)
+
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        expected = WireDetector._gaussian_diameter(img, 5, 50)
+        assert det_mod._profile_fwhm(img[25:76, 5], 25) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize("sigma", [2.0, 3.0, 4.0])
+    def test_profile_kernel_recovers_sigma_on_noisy_profile(self, sigma, monkeypatch):
+        import ohe.processing.detector as det_mod
+
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        rng = np.random.default_rng(11)
+        ys = np.arange(51, dtype=np.float64)
+        kernel, numpy_path = [], []
+        for _ in range(50):
+            profile = 100 + 20 * np.exp(-0.5 * ((ys - 25) / sigma) ** 2)
+            profile += rng.normal(0.0, 3.0, ys.shape)
+            col = np.clip(np.round(profile), 0, 255).astype(np.uint8)
+            img = np.repeat(col[:, None], 4, axis=1)
+            kernel.append(det_mod._profile_fwhm(img[:, 2], 25))
+            numpy_path.append(WireDetector._gaussian_diameter(img, 2, 25))
+        assert np.mean(kernel) == pytest.approx(2.355 * sigma, rel=0.15)
+        assert kernel == pytest.approx(numpy_path, rel=1e-9)
+
+    @pytest.mark.parametrize("sigma", [1.5, 3.0, 6.0])
+    def test_jitted_profile_kernel_matches_numpy_path(self, sigma, monkeypatch):
+        pytest.importorskip("numba")
+        import ohe.processing.detector as det_mod
+
+        assert det_mod._profile_fwhm_jit is not None
+        rng = np.random.default_rng(5)
+        ys = np.arange(101, dtype=np.float64)
+        profile = 100 + 40 * np.exp(-0.5 * ((ys - 47) / sigma) ** 2)
+        profile += rng.normal(0.0, 3.0, ys.shape)
+        col = np.clip(np.round(profile), 0, 255).astype(np.uint8)
+        img = np.repeat(col[:, None], 10, axis=1)
+        jitted = WireDetector._gaussian_diameter(img, 5, 50)
+        monkeypatch.setattr(det_mod, "_profile_fwhm_jit", None)
+        assert jitted == pytest.approx(WireDetector._gaussian_diameter(img, 5, 50), rel=1e-9)
+
+    def test_hough_lines_are_an_int32_array(self):
+        pf = make_processed_frame_with_wire(wire_y=50)
+        lines = self.detector._find_hough_lines(pf.roi_image)
+        assert isinstance(lines, np.ndarray)
+        assert lines.dtype == np.int32
+        assert lines.ndim == 2 and lines.shape[1] == 4
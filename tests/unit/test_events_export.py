@@ -109,3 +109,15 @@ class TestEventsExport:
         assert csv_path.exists()
         assert json_path.exists()
         assert events_path.exists()
+
+    def test_stdlib_json_fallback_matches(self, tmp_path, monkeypatch):
+        """Output must parse identically whether or not orjson is installed."""
+        import ohe.logging_.export as export_mod
+
+        session = self._setup_session(tmp_path, n_anomalies=2)
+        exporter = SessionExporter(session.db_path)
+        fast = json.loads(exporter.export_events_json(tmp_path / "fast.json").read_text("utf-8"))
+
+        monkeypatch.setattr(export_mod, "orjson", None)
+        slow = json.loads(exporter.export_events_json(tmp_path / "slow.json").read_text("utf-8"))
+        assert fast == slow
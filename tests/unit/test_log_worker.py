@@ -31,6 +31,15 @@ def make_anomaly(frame_id=0) -> Anomaly:
     )
 
 
+def logged_measurements(session) -> list:
+    """Flatten every measurement handed to ``session.log_batch``."""
+    return [m for call in session.log_batch.call_args_list for m, _ in call.args[0]]
+
+
+def logged_anomalies(session) -> list:
+    return [a for call in session.log_batch.call_args_list for _, anoms in call.args[0] for a in anoms]
+
+
 class TestLogWorker:
     def test_push_and_write_to_session(self):
         """All pushed items must be written to the session logger."""
@@ -43,7 +52,7 @@ class TestLogWorker:
 
         worker.stop()
 
-        assert session.log_measurement.call_count == 5
+        assert len(logged_measurements(session)) == 5
 
     def test_anomalies_written(self):
         session = MagicMock()
@@ -54,7 +63,7 @@ class TestLogWorker:
         worker.push_measurement(make_measurement(), anomalies=[a])
         worker.stop()
 
-        session.log_anomaly.assert_called_once()
+        assert logged_anomalies(session) == [a]
 
     def test_csv_writer_called(self):
         session = MagicMock()
@@ -62,10 +71,11 @@ class TestLogWorker:
         worker = LogWorker(session, csv_writer=csv)
         worker.start()
 
-        worker.push_measurement(make_measurement())
+        m = make_measurement()
+        worker.push_measurement(m)
         worker.stop()
 
-        csv.write.assert_called_once()
+        csv.write_many.assert_called_once_with([(m, [])])
 
     def test_queue_full_drops_gracefully(self):
         """When the queue is full, push_measurement must not raise."""
@@ -107,4 +117,83 @@ class TestLogWorker:
         worker.stop()
 
         assert worker.dropped_count == 0
-        assert session.log_measurement.call_count == 100
+        assert len(logged_measurements(session)) == 100
+
+    def test_push_many(self):
+        session = MagicMock()
+        worker = LogWorker(session, csv_writer=None, maxsize=100)
+        worker.start()
+
+        worker.push_many([(make_measurement(i), []) for i in range(40)])
+        worker.stop()
+
+        assert [m.frame_id for m in logged_measurements(session)] == list(range(40))
+
+    def test_push_many_drops_overflow(self):
+        session = MagicMock()
+        worker = LogWorker(session, csv_writer=None, maxsize=5)
+        worker.push_many([(make_measurement(i), []) for i in range(8)])
+        assert worker.dropped_count == 3
+
+    def test_overflow_keeps_newest(self):
+        """A full buffer discards the oldest pending items, not the new ones."""
+        session = MagicMock()
+        worker = LogWorker(session, csv_writer=None, maxsize=3)
+        for i in range(5):
+            worker.push_measurement(make_measurement(i))
+        worker.start()
+        worker.stop()
+
+        assert worker.dropped_count == 2
+        assert [m.frame_id for m in logged_measurements(session)] == [2, 3, 4]
+
+    def test_items_are_batched(self):
+        """Items already queued at start-up are committed in batch_size chunks."""
+        session = MagicMock()
+        worker = LogWorker(session, csv_writer=None, maxsize=100, batch_size=10)
+
+        for i in range(25):
+            worker.push_measurement(make_measurement(i))
+        worker.start()
+        worker.stop()
+
+        sizes = [len(call.args[0]) for call in session.log_batch.call_args_list]
+        assert sum(sizes) == 25
+        assert max(sizes) <= 10
+        assert [m.frame_id for m in logged_measurements(session)] == list(range(25))
+
+    def test_periodic_checkpoint(self):
+        """Both sinks are made durable on the checkpoint interval."""
+        session = MagicMock()
+        csv = MagicMock()
+        worker = LogWorker(session, csv_writer=csv, checkpoint_interval=0.0)
+        worker.start()
+        worker.push_measurement(make_measurement())
+        worker.stop()
+
+        assert session.checkpoint.called
+        assert csv.durable_flush.called
+
+    def test_no_checkpoint_before_interval(self):
+        session = MagicMock()
+        worker = LogWorker(session, csv_writer=None, checkpoint_interval=3600.0)
+        worker.start()
+        worker.push_measurement(make_measurement())
+        worker.stop()
+
+        session.checkpoint.assert_not_called()
+
+    def test_csv_receives_whole_drain(self):
+        """The CSV writer buffers internally, so it gets one call per drain."""
+        session = MagicMock()
+        csv = MagicMock()
+        worker = LogWorker(session, csv_writer=csv, maxsize=100, batch_size=10)
+
+        for i in range(25):
+            worker.push_measurement(make_measurement(i))
+        worker.start()
+        worker.stop()
+
+        assert session.log_batch.call_count == 3
+        csv.write_many.assert_called_once()
+        assert len(csv.write_many.call_args.args[0]) == 25
@@ -74,3 +74,14 @@ class TestMeasurementEngine:
         m = eng.compute(c, roi_offset_x=200, roi_offset_y=100)
         assert m.wire_bbox[0] == 44 + 200
         assert m.wire_bbox[1] == c.bbox_y + 100
+
+    def test_compute_batch_matches_compute(self):
+        cal = make_calibration(px_per_mm=8.0, centre_x=500)
+        eng = MeasurementEngine(cal, make_config(min_confidence=0.5))
+        cands = [
+            make_candidate(cx=600.0, diameter_px=12.0, confidence=0.9),
+            make_candidate(cx=420.5, diameter_px=0.0, confidence=0.7),
+            make_candidate(cx=510.0, diameter_px=9.0, confidence=0.2),
+        ]
+        assert eng.compute_batch(cands, 15, 30) == [eng.compute(c, 15, 30) for c in cands]
+        assert eng.compute_batch([]) == []
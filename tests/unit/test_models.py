@@ -47,12 +47,36 @@ class TestMeasurement:
         m = Measurement(0, 0.0, stagger_mm=10.0, diameter_mm=None, confidence=0.9)
         assert not m.is_valid()
 
+    def test_geometry_defaults_to_missing(self):
+        m = Measurement(0, 0.0, stagger_mm=None, diameter_mm=None, confidence=0.0)
+        assert m.wire_bbox is None
+        assert m.wire_centre_px is None
+
+    def test_geometry_tuple_views(self):
+        m = Measurement(0, 0.0, 1.0, 12.0, 0.9, bbox_x=10, bbox_y=20, bbox_w=30, bbox_h=4,
+                        centre_x=25.0, centre_y=22.0)
+        assert m.wire_bbox == (10, 20, 30, 4)
+        assert m.wire_centre_px == (25.0, 22.0)
+
+    def test_positional_field_order(self):
+        """MeasurementEngine builds Measurement positionally; pin the order."""
+        m = Measurement(1, 2.0, 3.0, 4.0, 0.5, 6, 7, 8, 9, 10.0, 11.0)
+        assert (m.frame_id, m.timestamp_ms, m.stagger_mm, m.diameter_mm, m.confidence) == (1, 2.0, 3.0, 4.0, 0.5)
+        assert m.wire_bbox == (6, 7, 8, 9)
+        assert m.wire_centre_px == (10.0, 11.0)
+
 
 class TestWireCandidate:
     def test_default_confidence(self):
         wc = WireCandidate(frame_id=1, timestamp_ms=33.3)
         assert wc.confidence == 0.0
 
+    def test_positional_field_order(self):
+        """WireDetector builds WireCandidate positionally; pin the order."""
+        wc = WireCandidate(1, 2.0, 3, 4, 5, 6, 7.0, 8.0, 9.0, 0.5)
+        assert (wc.bbox_x, wc.bbox_y, wc.bbox_w, wc.bbox_h) == (3, 4, 5, 6)
+        assert (wc.centre_x, wc.centre_y, wc.diameter_px, wc.confidence) == (7.0, 8.0, 9.0, 0.5)
+
 
 class TestAnomaly:
     def test_fields(self):
@@ -0,0 +1,79 @@
+"""tests/unit/test_prefetch.py — PrefetchingProvider background reader tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ohe.core.exceptions import IngestionError
+from ohe.core.models import RawFrame
+from ohe.ingestion.base import FrameProvider
+from ohe.ingestion.prefetch import PrefetchingProvider
+
+
+class FakeProvider(FrameProvider):
+    def __init__(self, n: int, fail_at: int = -1) -> None:
+        self.n = n
+        self.fail_at = fail_at
+        self.i = 0
+        self.opened = False
+        self.closed = False
+
+    def open(self) -> None:
+        self.opened = True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def next_frame(self) -> RawFrame | None:
+        if self.i == self.fail_at:
+            raise IngestionError("decode failed")
+        if self.i >= self.n:
+            return None
+        frame = RawFrame(frame_id=self.i, timestamp_ms=0.0, image=np.zeros((2, 2, 3), np.uint8))
+        self.i += 1
+        return frame
+
+    @property
+    def frame_count(self) -> int:
+        return self.n
+
+
+class TestPrefetchingProvider:
+    def test_yields_all_frames_in_order(self):
+        inner = FakeProvider(20)
+        with PrefetchingProvider(inner, maxsize=3) as p:
+            ids = [f.frame_id for f in p.frames()]
+        assert ids == list(range(20))
+        assert inner.opened and inner.closed
+
+    def test_provider_is_iterable(self):
+        with PrefetchingProvider(FakeProvider(5)) as p:
+            assert [f.frame_id for f in p] == list(range(5))
+
+    def test_metadata_forwarded(self):
+        assert PrefetchingProvider(FakeProvider(7)).frame_count == 7
+
+    def test_close_before_end_does_not_hang(self):
+        inner = FakeProvider(1000)
+        p = PrefetchingProvider(inner, maxsize=2)
+        p.open()
+        assert p.next_frame().frame_id == 0
+        p.close()
+        assert inner.closed
+
+    def test_reader_error_is_reraised(self):
+        p = PrefetchingProvider(FakeProvider(10, fail_at=3))
+        p.open()
+        try:
+            got = [p.next_frame().frame_id for _ in range(3)]
+            assert got == [0, 1, 2]
+            with pytest.raises(IngestionError):
+                p.next_frame()
+            assert p.next_frame() is None
+        finally:
+            p.close()
+
+    def test_next_frame_requires_open(self):
+        with pytest.raises(IngestionError):
+            PrefetchingProvider(FakeProvider(1)).next_frame()
@@ -59,3 +59,110 @@ class TestPreProcessor:
         raw = make_bgr_frame(h=200, w=200)
         pf = pp.run(raw)
         assert pf.roi_image.shape == (50, 50)
+
+    def test_reuse_output_writes_into_same_buffer(self):
+        pp = PreProcessor(ProcessingConfig(roi=[10, 10, 100, 50]), reuse_output=True)
+        raw = make_bgr_frame()
+        first = pp.run(raw).roi_image
+        second = pp.run(raw).roi_image
+        assert np.shares_memory(first, second)
+        assert np.array_equal(second, PreProcessor(ProcessingConfig(roi=[10, 10, 100, 50])).run(raw).roi_image)
+
+    def test_output_ring_rotates_buffers(self):
+        pp = PreProcessor(ProcessingConfig(roi=[10, 10, 100, 50]), reuse_output=3)
+        raw = make_bgr_frame()
+        outs = [pp.run(raw).roi_image for _ in range(4)]
+        assert not any(np.shares_memory(outs[0], o) for o in outs[1:3])
+        assert np.shares_memory(outs[0], outs[3])
+
+    def test_run_batch_matches_run(self):
+        cfg = ProcessingConfig(roi=[10, 10, 100, 50])
+        raws = [make_bgr_frame(), make_bgr_frame(h=60, w=80), make_bgr_frame()]
+        batch = PreProcessor(cfg, reuse_output=True).run_batch(raws)
+        single = PreProcessor(cfg)
+        assert len(batch) == 3
+        for raw, pf in zip(raws, batch):
+            ref = single.run(raw)
+            assert np.array_equal(pf.roi_image, ref.roi_image)
+            assert (pf.roi_offset_x, pf.roi_offset_y) == (ref.roi_offset_x, ref.roi_offset_y)
+
+    def test_default_returns_fresh_output(self):
+        pp = PreProcessor(ProcessingConfig())
+        raw = make_bgr_frame()
+        assert not np.shares_memory(pp.run(raw).roi_image, pp.run(raw).roi_image)
+
+    def test_undistort_remaps_roi_window(self):
+        from ohe.processing.calibration import CalibrationModel
+
+        k = np.array([[300.0, 0, 200], [0, 300.0, 100], [0, 0, 1]])
+        d = np.array([-0.3, 0.1, 0.0, 0.0, 0.0])
+        cal = CalibrationModel(10.0, 200, 400, 200, use_undistort=True, camera_matrix=k, dist_coeffs=d)
+        pp = PreProcessor(ProcessingConfig(roi=[50, 40, 120, 60]), cal)
+        raw = make_bgr_frame(h=200, w=400)
+
+        pf = pp.run(raw)
+        assert pf.roi_image.shape == (60, 120)
+        maps = pp._undistort_maps
+        pp.run(raw)
+        assert pp._undistort_maps is maps
+
+        pp.set_roi((0, 0, 80, 80))
+        assert pp.run(raw).roi_image.shape == (80, 80)
+        assert pp._undistort_maps is not maps
+
+    def test_undistort_roi_edges_are_not_zero_filled(self):
+        from ohe.processing.calibration import CalibrationModel
+
+        # Pincushion distortion pulls the ROI corners from outside the crop
+        k = np.array([[300.0, 0, 200], [0, 300.0, 100], [0, 0, 1]])
+        d = np.array([0.3, 0.0, 0.0, 0.0, 0.0])
+        cal = CalibrationModel(10.0, 200, 400, 200, use_undistort=True, camera_matrix=k, dist_coeffs=d)
+        pp = PreProcessor(ProcessingConfig(roi=[50, 40, 120, 60]), cal)
+        raw = RawFrame(frame_id=0, timestamp_ms=0.0, image=np.full((200, 400, 3), 120, dtype=np.uint8))
+        out = pp.run(raw).roi_image
+        # A flat frame must stay flat — no dark bands along the ROI edges
+        assert out.min() == out.max()
+
+    def test_use_cuda_without_device_falls_back_to_cpu(self):
+        raw = make_bgr_frame()
+        gpu = PreProcessor(ProcessingConfig(use_cuda=True))
+        if gpu._cuda is not None:
+            pytest.skip("CUDA device present")
+        cpu = PreProcessor(ProcessingConfig())
+        assert np.array_equal(gpu.run(raw).roi_image, cpu.run(raw).roi_image)
+
+    def test_opencl_path_matches_cpu(self):
+        from ohe.processing.calibration import CalibrationModel
+
+        k = np.array([[300.0, 0, 200], [0, 300.0, 100], [0, 0, 1]])
+        d = np.array([-0.3, 0.1, 0.0, 0.0, 0.0])
+        cal = CalibrationModel(10.0, 200, 400, 200, use_undistort=True, camera_matrix=k, dist_coeffs=d)
+        cfg = ProcessingConfig(roi=[50, 40, 120, 60])
+        raw = make_bgr_frame()
+        cpu = PreProcessor(cfg, cal)
+        # UMat falls back to host memory without an OpenCL device, so the
+        # T-API code path runs either way
+        ocl = PreProcessor(cfg, cal, reuse_output=True)
+        ocl._opencl = True
+        out = ocl.run(raw).roi_image
+        assert out is ocl._out_pool[0]
+        assert np.array_equal(out, cpu.run(raw).roi_image)
+
+    def test_raw_image_left_untouched(self):
+        raw = make_bgr_frame()
+        before = raw.image.copy()
+        gray = RawFrame(frame_id=1, timestamp_ms=0.0, image=raw.image[..., 0].copy())
+        gray_before = gray.image.copy()
+        pp = PreProcessor(ProcessingConfig(roi=[10, 10, 100, 50]), reuse_output=True)
+        pp.run(raw)
+        pp.run(gray)
+        assert np.array_equal(raw.image, before)
+        assert np.array_equal(gray.image, gray_before)
+
+    def test_roi_clamped_per_frame_size(self):
+        pp = PreProcessor(ProcessingConfig(roi=[150, 50, 300, 300]))
+        assert pp.run(make_bgr_frame(h=200, w=400)).roi_image.shape == (150, 250)
+        # A different frame size re-clamps the same ROI
+        pf = pp.run(make_bgr_frame(h=100, w=200))
+        assert pf.roi_image.shape == (50, 50)
+        assert (pf.roi_offset_x, pf.roi_offset_y) == (150, 50)
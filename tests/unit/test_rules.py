@@ -1,5 +1,6 @@
 """tests/unit/test_rules.py — RulesEngine threshold evaluation tests."""
 
+import numpy as np
 import pytest
 
 from ohe.core.config import RulesConfig, StaggerThreshold, DiameterThreshold
@@ -84,3 +85,83 @@ class TestDiameterRules:
     def test_null_diameter_skipped(self):
         m = Measurement(1, 0.0, stagger_mm=0.0, diameter_mm=None, confidence=0.9)
         assert self.engine.evaluate(m) == []
+
+
+class TestEvaluateBatch:
+    def setup_method(self):
+        self.engine = RulesEngine(make_thresholds())
+
+    def test_empty_window(self):
+        assert self.engine.evaluate_batch([]) == []
+
+    def test_matches_per_frame_evaluate(self):
+        window = [
+            make_measurement(stagger=0.0, diameter=12.0),
+            make_measurement(stagger=160.0, diameter=12.0),
+            make_measurement(stagger=-210.0, diameter=7.0),
+            make_measurement(stagger=None, diameter=16.0),
+            make_measurement(stagger=50.0, diameter=None),
+            make_measurement(stagger=None, diameter=None),
+        ]
+        batch = self.engine.evaluate_batch(window)
+        assert batch == [self.engine.evaluate(m) for m in window]
+
+
+    def test_arrays_match_per_frame_evaluate(self):
+        stagger = [0.0, 160.0, -210.0, None, 50.0, None]
+        diameter = [12.0, 12.0, 7.0, 16.0, None, None]
+        window = [
+            Measurement(i, i * 33.0, s, d, 0.0)
+            for i, (s, d) in enumerate(zip(stagger, diameter))
+        ]
+        expected = [a for m in window for a in self.engine.evaluate(m)]
+        nan = float("nan")
+        got = self.engine.evaluate_arrays(
+            np.array([nan if v is None else v for v in stagger]),
+            np.array([nan if v is None else v for v in diameter]),
+            np.arange(6),
+            np.arange(6) * 33.0,
+        )
+        assert got == expected
+
+    def test_breach_kernel_matches_numpy(self, monkeypatch):
+        import ohe.rules.engine as engine_mod
+
+        nan = float("nan")
+        stagger = np.array([0.0, 149.9, 150.0, -150.0, nan, 20.0, nan])
+        diameter = np.array([12.0, 12.0, 12.0, nan, 10.0, 15.0, nan])
+        monkeypatch.setattr(engine_mod, "_breach_flags_jit", None)
+        expected = self.engine._breach_mask(stagger, diameter)
+        out = np.empty(len(stagger), dtype=bool)
+        engine_mod._breach_flags(stagger, diameter, 150.0, 10.0, 15.0, out)
+        assert out.tolist() == expected.tolist()
+
+
+    def test_jitted_breach_kernel_matches_numpy(self, monkeypatch):
+        pytest.importorskip("numba")
+        import ohe.rules.engine as engine_mod
+
+        assert engine_mod._breach_flags_jit is not None
+        nan = float("nan")
+        stagger = np.array([0.0, 149.9, 150.0, -150.0, nan, 20.0, nan])
+        diameter = np.array([12.0, 12.0, 12.0, nan, 10.0, 15.0, nan])
+        out = np.empty(len(stagger), dtype=bool)
+        engine_mod._breach_flags_jit(stagger, diameter, 150.0, 10.0, 15.0, out)
+        monkeypatch.setattr(engine_mod, "_breach_flags_jit", None)
+        assert out.tolist() == self.engine._breach_mask(stagger, diameter).tolist()
+
+class TestSpecialisedEvaluate:
+    def test_matches_reference_evaluate(self):
+        engine = RulesEngine(make_thresholds())
+        for stagger in (None, -250.0, -200.0, -150.0, -149.9, 0.0, 150.0, 199.9, 200.0):
+            for diameter in (None, 7.0, 8.0, 10.0, 12.0, 15.0, 17.0, 18.0):
+                m = make_measurement(stagger=stagger, diameter=diameter)
+                assert engine.evaluate(m) == RulesEngine.evaluate(engine, m)
+
+    def test_thresholds_bound_per_instance(self):
+        strict = RulesConfig(stagger=StaggerThreshold(warning_mm=50.0, critical_mm=80.0))
+        loose = RulesEngine(make_thresholds())
+        tight = RulesEngine(Thresholds.from_config(strict))
+        m = make_measurement(stagger=60.0)
+        assert loose.evaluate(m) == []
+        assert tight.evaluate(m)[0].severity == "WARNING"
@@ -0,0 +1,67 @@
+"""tests/unit/test_video_file.py — VideoFileProvider seek and rate-limit tests."""
+
+from __future__ import annotations
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from ohe.ingestion.video_file import VideoFileProvider
+
+
+def _write_video(path, n=12, fps=30.0):
+    """Write *n* flat grey frames whose brightness encodes the frame index."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (64, 48))
+    for i in range(n):
+        writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _index_of(image: np.ndarray) -> int:
+    return int(round(float(image.mean()) / 20))
+
+
+class TestVideoFileProvider:
+    def test_start_frame_seeks_by_grabbing(self, tmp_path):
+        video = _write_video(tmp_path / "seek.mp4")
+        with VideoFileProvider(video, start_frame=5) as provider:
+            frame = provider.next_frame()
+        assert frame.frame_id == 5
+        assert _index_of(frame.image) == 5
+
+    def test_target_fps_limits_rate(self, tmp_path):
+        video = _write_video(tmp_path / "rate.mp4")
+        with VideoFileProvider(video, target_fps=50.0) as provider:
+            t0 = time.monotonic()
+            for _ in range(6):
+                assert provider.next_frame() is not None
+            elapsed = time.monotonic() - t0
+        # First frame is immediate; the next five are spaced 20 ms apart
+        assert elapsed >= 5 * 0.02 * 0.9
+
+    def test_unlimited_rate_does_not_sleep(self, tmp_path, monkeypatch):
+        video = _write_video(tmp_path / "fast.mp4")
+        monkeypatch.setattr(time, "sleep", lambda s: pytest.fail("unexpected sleep"))
+        with VideoFileProvider(video) as provider:
+            assert len(list(provider.frames())) == 12
+
+    def test_buffer_pool_recycles_images(self, tmp_path):
+        video = _write_video(tmp_path / "pool.mp4")
+        with VideoFileProvider(video, buffer_pool=2) as provider:
+            f0 = provider.next_frame()
+            assert _index_of(f0.image) == 0
+            f1 = provider.next_frame()
+            f2 = provider.next_frame()
+        assert f2.image is f0.image
+        assert f1.image is not f0.image
+        assert _index_of(f2.image) == 2
+
+    def test_timestamps_match_decoder_for_constant_rate(self, tmp_path):
+        video = _write_video(tmp_path / "ts.mp4", fps=30.0)
+        with VideoFileProvider(video) as derived, \
+                VideoFileProvider(video, native_timestamps=True) as native:
+            for a, b in zip(derived.frames(), native.frames()):
+                assert a.timestamp_ms == pytest.approx(b.timestamp_ms, abs=0.5)
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import csv
 import logging
+import math
 import time
 from pathlib import Path
 
@@ -32,6 +33,7 @@ logger = logging.getLogger(__name__)
 
 from ohe.core.config import load_config
 from ohe.core.models import Measurement
+from ohe.ingestion.prefetch import PrefetchingProvider
 from ohe.ingestion.video_file import VideoFileProvider
 from ohe.processing.calibration import CalibrationModel
 from ohe.processing.detector import WireDetector
@@ -59,13 +61,13 @@ def _draw_full_frame_overlay(
         cv2.putText(out, "ROI", (rx + 2, ry + 12), cv2.FONT_HERSHEY_SIMPLEX, 0.35, (255, 255, 0), 1)
 
     # Wire bounding box (green)
-    if m.wire_bbox:
-        x, y, bw, bh = m.wire_bbox
+    if m.bbox_x >= 0:
+        x, y, bw, bh = m.bbox_x, m.bbox_y, m.bbox_w, m.bbox_h
         cv2.rectangle(out, (x, y), (x + bw, y + bh), (0, 255, 0), 2)
 
     # Wire centre vertical line (stagger indicator)
-    if m.wire_centre_px:
-        cx, cy = int(m.wire_centre_px[0]), int(m.wire_centre_px[1])
+    if not math.isnan(m.centre_x):
+        cx, cy = int(m.centre_x), int(m.centre_y)
         cv2.circle(out, (cx, cy), 5, (0, 0, 255), -1)
         cv2.line(out, (cx, 0), (cx, h), (0, 0, 255), 1)
 
@@ -132,7 +134,7 @@ def main(video, config_path, every, max_frames, output_dir, write_video):
     csv_writer = csv.writer(csv_file)
     csv_writer.writerow(["frame_id", "timestamp_ms", "stagger_mm", "diameter_mm", "confidence", "anomalies"])
 
-    provider = VideoFileProvider(video)
+    provider = PrefetchingProvider(VideoFileProvider(video), maxsize=4)
     frame_count = 0
     detected_count = 0
 